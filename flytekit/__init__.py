@@ -178,6 +178,8 @@ Task Utilities
    :toctree: generated/
 
    HashMethod
+   ContentAddressed
+   Prefetch
 
 Documentation
 =============
@@ -214,11 +216,12 @@ from flytekit.core.container_task import ContainerTask
 from flytekit.core.context_manager import ExecutionParameters, FlyteContext, FlyteContextManager
 from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.gate import approve, sleep, wait_for_input
-from flytekit.core.hash import HashMethod
+from flytekit.core.hash import ContentAddressed, HashMethod
 from flytekit.core.launch_plan import LaunchPlan, reference_launch_plan
 from flytekit.core.map_task import map_task
 from flytekit.core.notification import Email, PagerDuty, Slack
 from flytekit.core.pod_template import PodTemplate
+from flytekit.core.prefetch import Prefetch
 from flytekit.core.python_function_task import PythonFunctionTask, PythonInstanceTask
 from flytekit.core.reference import get_reference_entity
 from flytekit.core.reference_entity import LaunchPlanReference, TaskReference, WorkflowReference
@@ -16,4 +16,5 @@ This module provides lower level access to a Flyte backend.
 
    ~friendly.SynchronousFlyteClient
    ~raw.RawSynchronousFlyteClient
+   ~aio.AsynchronousFlyteClient
 """
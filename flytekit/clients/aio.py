@@ -0,0 +1,483 @@
+from __future__ import annotations
+
+import typing
+
+from flyteidl.admin import common_pb2 as _common_pb2
+from flyteidl.admin import execution_pb2 as _execution_pb2
+from flyteidl.admin import launch_plan_pb2 as _launch_plan_pb2
+from flyteidl.admin import node_execution_pb2 as _node_execution_pb2
+from flyteidl.admin import project_pb2 as _project_pb2
+from flyteidl.admin import task_execution_pb2 as _task_execution_pb2
+from flyteidl.admin import task_pb2 as _task_pb2
+from flyteidl.admin import workflow_pb2 as _workflow_pb2
+from flyteidl.service import admin_pb2_grpc as _admin_service
+
+from flytekit.clients.auth_helper import get_async_channel
+from flytekit.configuration import PlatformConfig
+from flytekit.loggers import logger
+from flytekit.models import common as _common
+from flytekit.models import execution as _execution
+from flytekit.models import filters as _filters
+from flytekit.models import launch_plan as _launch_plan
+from flytekit.models import node_execution as _node_execution
+from flytekit.models import project as _project
+from flytekit.models import task as _task
+from flytekit.models.admin import common as _admin_common
+from flytekit.models.admin import task_execution as _task_execution
+from flytekit.models.admin import workflow as _workflow
+from flytekit.models.core import identifier as _identifier
+
+T = typing.TypeVar("T")
+
+
+class AsynchronousFlyteClient(object):
+    """
+    The asyncio counterpart of :py:class:`~flytekit.clients.friendly.SynchronousFlyteClient`, backed by ``grpc.aio``.
+    It takes and returns the same models, so many calls can be in flight at once without a thread per call. The
+    paginated list endpoints are exposed as async iterators, that fetch the next page when the current one is consumed.
+
+    The client uses the same authentication, proxy authentication and exception handling as the synchronous client.
+    Its channel is bound to the running event loop, so it has to be created and used in the same loop.
+
+    .. code-block:: python
+
+        async with AsynchronousFlyteClient(PlatformConfig(endpoint="a.b.com", insecure=True)) as client:
+            executions = await asyncio.gather(*(client.get_execution(i) for i in ids))
+            async for execution in client.list_executions("flytesnacks", "development"):
+                ...
+    """
+
+    def __init__(self, cfg: PlatformConfig, **kwargs):
+        self._cfg = cfg
+        self._channel = get_async_channel(cfg, **kwargs)
+        self._stub = _admin_service.AdminServiceStub(self._channel)
+        logger.info(
+            f"Flyte async client configured -> {cfg.endpoint} in {'insecure' if cfg.insecure else 'secure'} mode."
+        )
+
+    @property
+    def url(self) -> str:
+        return self._cfg.endpoint
+
+    async def close(self):
+        """
+        Closes the channel, calls that are still in flight are cancelled.
+        """
+        await self._channel.close()
+
+    async def __aenter__(self) -> AsynchronousFlyteClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @staticmethod
+    async def _paginate(
+        rpc: typing.Callable,
+        request: typing.Any,
+        field: str,
+        model: typing.Callable[[typing.Any], T],
+    ) -> typing.AsyncIterator[T]:
+        while True:
+            response = await rpc(request)
+            for pb in getattr(response, field):
+                yield model(pb)
+            if not response.token:
+                return
+            request.token = response.token
+
+    @staticmethod
+    def _resource_list_request(identifier, page_size, filters, sort_by) -> _common_pb2.ResourceListRequest:
+        return _common_pb2.ResourceListRequest(
+            id=identifier.to_flyte_idl(),
+            limit=page_size,
+            filters=_filters.FilterList(filters or []).to_flyte_idl(),
+            sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+        )
+
+    ####################################################################################################################
+    #
+    #  Task Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_task(self, task_identifer: _identifier.Identifier, task_spec: _task.TaskSpec):
+        """
+        :param task_identifer: The identifier for this task.
+        :param task_spec: This is the actual definition of the task that should be created.
+        :raises flytekit.exceptions.user.FlyteEntityAlreadyExistsException: If an identical version of the task is
+            found.
+        """
+        await self._stub.CreateTask(
+            _task_pb2.TaskCreateRequest(id=task_identifer.to_flyte_idl(), spec=task_spec.to_flyte_idl())
+        )
+
+    async def get_task(self, id: _identifier.Identifier) -> _task.Task:
+        return _task.Task.from_flyte_idl(await self._stub.GetTask(_common_pb2.ObjectGetRequest(id=id.to_flyte_idl())))
+
+    def list_tasks(
+        self,
+        identifier: _common.NamedEntityIdentifier,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+    ) -> typing.AsyncIterator[_task.Task]:
+        """
+        Iterates over the tasks in a given project and domain, optionally limited to the tasks with the name of the
+        identifier.
+
+        :param identifier: The project, domain and optionally the name of the tasks.
+        :param page_size: The number of tasks fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        """
+        return self._paginate(
+            self._stub.ListTasks,
+            self._resource_list_request(identifier, page_size, filters, sort_by),
+            "tasks",
+            _task.Task.from_flyte_idl,
+        )
+
+    ####################################################################################################################
+    #
+    #  Workflow Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_workflow(self, workflow_identifier: _identifier.Identifier, workflow_spec: _workflow.WorkflowSpec):
+        """
+        :param workflow_identifier: The identifier for this workflow.
+        :param workflow_spec: This is the actual definition of the workflow that should be created.
+        :raises flytekit.exceptions.user.FlyteEntityAlreadyExistsException: If an identical version of the workflow
+            is found.
+        """
+        await self._stub.CreateWorkflow(
+            _workflow_pb2.WorkflowCreateRequest(
+                id=workflow_identifier.to_flyte_idl(), spec=workflow_spec.to_flyte_idl()
+            )
+        )
+
+    async def get_workflow(self, id: _identifier.Identifier) -> _workflow.Workflow:
+        return _workflow.Workflow.from_flyte_idl(
+            await self._stub.GetWorkflow(_common_pb2.ObjectGetRequest(id=id.to_flyte_idl()))
+        )
+
+    def list_workflows(
+        self,
+        identifier: _common.NamedEntityIdentifier,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+    ) -> typing.AsyncIterator[_workflow.Workflow]:
+        """
+        Iterates over the workflows in a given project and domain, optionally limited to the workflows with the name
+        of the identifier.
+
+        :param identifier: The project, domain and optionally the name of the workflows.
+        :param page_size: The number of workflows fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        """
+        return self._paginate(
+            self._stub.ListWorkflows,
+            self._resource_list_request(identifier, page_size, filters, sort_by),
+            "workflows",
+            _workflow.Workflow.from_flyte_idl,
+        )
+
+    ####################################################################################################################
+    #
+    #  Launch Plan Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_launch_plan(
+        self, launch_plan_identifer: _identifier.Identifier, launch_plan_spec: _launch_plan.LaunchPlanSpec
+    ):
+        """
+        :param launch_plan_identifer: The identifier for this launch plan.
+        :param launch_plan_spec: This is the actual definition of the launch plan that should be created.
+        :raises flytekit.exceptions.user.FlyteEntityAlreadyExistsException: If an identical version of the launch
+            plan is found.
+        """
+        await self._stub.CreateLaunchPlan(
+            _launch_plan_pb2.LaunchPlanCreateRequest(
+                id=launch_plan_identifer.to_flyte_idl(), spec=launch_plan_spec.to_flyte_idl()
+            )
+        )
+
+    async def get_launch_plan(self, id: _identifier.Identifier) -> _launch_plan.LaunchPlan:
+        return _launch_plan.LaunchPlan.from_flyte_idl(
+            await self._stub.GetLaunchPlan(_common_pb2.ObjectGetRequest(id=id.to_flyte_idl()))
+        )
+
+    async def get_active_launch_plan(self, identifier: _common.NamedEntityIdentifier) -> _launch_plan.LaunchPlan:
+        return _launch_plan.LaunchPlan.from_flyte_idl(
+            await self._stub.GetActiveLaunchPlan(_launch_plan_pb2.ActiveLaunchPlanRequest(id=identifier.to_flyte_idl()))
+        )
+
+    def list_launch_plans(
+        self,
+        identifier: _common.NamedEntityIdentifier,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+    ) -> typing.AsyncIterator[_launch_plan.LaunchPlan]:
+        """
+        Iterates over the launch plans in a given project and domain, optionally limited to the launch plans with the
+        name of the identifier.
+
+        :param identifier: The project, domain and optionally the name of the launch plans.
+        :param page_size: The number of launch plans fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        """
+        return self._paginate(
+            self._stub.ListLaunchPlans,
+            self._resource_list_request(identifier, page_size, filters, sort_by),
+            "launch_plans",
+            _launch_plan.LaunchPlan.from_flyte_idl,
+        )
+
+    async def update_launch_plan(self, id: _identifier.Identifier, state: int):
+        """
+        :param id: The identifier of the launch plan.
+        :param state: The state to set the launch plan to, from :py:class:`~flytekit.models.launch_plan.LaunchPlanState`.
+        """
+        await self._stub.UpdateLaunchPlan(_launch_plan_pb2.LaunchPlanUpdateRequest(id=id.to_flyte_idl(), state=state))
+
+    ####################################################################################################################
+    #
+    #  Execution Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_execution(
+        self, project: str, domain: str, name: str, execution_spec: _execution.ExecutionSpec, inputs
+    ) -> _identifier.WorkflowExecutionIdentifier:
+        """
+        This will create an execution for the given execution spec.
+
+        :param project:
+        :param domain:
+        :param name:
+        :param execution_spec: This is the specification for the execution.
+        :param flytekit.models.literals.LiteralMap inputs: The inputs for the execution
+        :returns: The unique identifier for the execution.
+        """
+        response = await self._stub.CreateExecution(
+            _execution_pb2.ExecutionCreateRequest(
+                project=project,
+                domain=domain,
+                name=name,
+                spec=execution_spec.to_flyte_idl(),
+                inputs=inputs.to_flyte_idl(),
+            )
+        )
+        return _identifier.WorkflowExecutionIdentifier.from_flyte_idl(response.id)
+
+    async def recover_execution(
+        self, id: _identifier.WorkflowExecutionIdentifier, name: typing.Optional[str] = None
+    ) -> _identifier.WorkflowExecutionIdentifier:
+        """
+        Recreates a previously-run workflow execution that will only start executing from the last known failure point.
+
+        :param id:
+        :param name: Optional name to assign to the newly created execution.
+        """
+        response = await self._stub.RecoverExecution(
+            _execution_pb2.ExecutionRecoverRequest(id=id.to_flyte_idl(), name=name)
+        )
+        return _identifier.WorkflowExecutionIdentifier.from_flyte_idl(response.id)
+
+    async def relaunch_execution(
+        self, id: _identifier.WorkflowExecutionIdentifier, name: typing.Optional[str] = None
+    ) -> _identifier.WorkflowExecutionIdentifier:
+        """
+        :param id:
+        :param name: [Optional] name for the new execution. If not specified, a randomly generated name will be used
+        :returns: The unique identifier for the new execution.
+        """
+        response = await self._stub.RelaunchExecution(
+            _execution_pb2.ExecutionRelaunchRequest(id=id.to_flyte_idl(), name=name)
+        )
+        return _identifier.WorkflowExecutionIdentifier.from_flyte_idl(response.id)
+
+    async def get_execution(self, id: _identifier.WorkflowExecutionIdentifier) -> _execution.Execution:
+        return _execution.Execution.from_flyte_idl(
+            await self._stub.GetExecution(_execution_pb2.WorkflowExecutionGetRequest(id=id.to_flyte_idl()))
+        )
+
+    async def get_execution_data(
+        self, id: _identifier.WorkflowExecutionIdentifier
+    ) -> _execution.WorkflowExecutionGetDataResponse:
+        """
+        Returns signed URLs to LiteralMap blobs for an execution's inputs and outputs (when available).
+        """
+        return _execution.WorkflowExecutionGetDataResponse.from_flyte_idl(
+            await self._stub.GetExecutionData(_execution_pb2.WorkflowExecutionGetDataRequest(id=id.to_flyte_idl()))
+        )
+
+    def list_executions(
+        self,
+        project: str,
+        domain: str,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+    ) -> typing.AsyncIterator[_execution.Execution]:
+        """
+        Iterates over the executions in a given project and domain.
+
+        :param project: Project in which to list executions.
+        :param domain: Domain in which to list executions.
+        :param page_size: The number of executions fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        """
+        return self._paginate(
+            self._stub.ListExecutions,
+            self._resource_list_request(_common.NamedEntityIdentifier(project, domain), page_size, filters, sort_by),
+            "executions",
+            _execution.Execution.from_flyte_idl,
+        )
+
+    async def terminate_execution(self, id: _identifier.WorkflowExecutionIdentifier, cause: str):
+        await self._stub.TerminateExecution(_execution_pb2.ExecutionTerminateRequest(id=id.to_flyte_idl(), cause=cause))
+
+    ####################################################################################################################
+    #
+    #  Node Execution Endpoints
+    #
+    ####################################################################################################################
+
+    async def get_node_execution(
+        self, node_execution_identifier: _identifier.NodeExecutionIdentifier
+    ) -> _node_execution.NodeExecution:
+        return _node_execution.NodeExecution.from_flyte_idl(
+            await self._stub.GetNodeExecution(
+                _node_execution_pb2.NodeExecutionGetRequest(id=node_execution_identifier.to_flyte_idl())
+            )
+        )
+
+    async def get_node_execution_data(
+        self, node_execution_identifier: _identifier.NodeExecutionIdentifier
+    ) -> _execution.NodeExecutionGetDataResponse:
+        """
+        Returns signed URLs to LiteralMap blobs for a node execution's inputs and outputs (when available).
+        """
+        return _execution.NodeExecutionGetDataResponse.from_flyte_idl(
+            await self._stub.GetNodeExecutionData(
+                _node_execution_pb2.NodeExecutionGetDataRequest(id=node_execution_identifier.to_flyte_idl())
+            )
+        )
+
+    def list_node_executions(
+        self,
+        workflow_execution_identifier: _identifier.WorkflowExecutionIdentifier,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+        unique_parent_id: typing.Optional[str] = None,
+    ) -> typing.AsyncIterator[_node_execution.NodeExecution]:
+        """
+        Iterates over the node executions of a given workflow execution.
+
+        :param workflow_execution_identifier:
+        :param page_size: The number of node executions fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        :param unique_parent_id: [Optional] If specified, only the children of this node execution are listed.
+        """
+        return self._paginate(
+            self._stub.ListNodeExecutions,
+            _node_execution_pb2.NodeExecutionListRequest(
+                workflow_execution_id=workflow_execution_identifier.to_flyte_idl(),
+                limit=page_size,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+                unique_parent_id=unique_parent_id,
+            ),
+            "node_executions",
+            _node_execution.NodeExecution.from_flyte_idl,
+        )
+
+    ####################################################################################################################
+    #
+    #  Task Execution Endpoints
+    #
+    ####################################################################################################################
+
+    async def get_task_execution(self, id: _identifier.TaskExecutionIdentifier) -> _task_execution.TaskExecution:
+        return _task_execution.TaskExecution.from_flyte_idl(
+            await self._stub.GetTaskExecution(_task_execution_pb2.TaskExecutionGetRequest(id=id.to_flyte_idl()))
+        )
+
+    async def get_task_execution_data(
+        self, task_execution_identifier: _identifier.TaskExecutionIdentifier
+    ) -> _execution.TaskExecutionGetDataResponse:
+        """
+        Returns signed URLs to LiteralMap blobs for a task execution's inputs and outputs (when available).
+        """
+        return _execution.TaskExecutionGetDataResponse.from_flyte_idl(
+            await self._stub.GetTaskExecutionData(
+                _task_execution_pb2.TaskExecutionGetDataRequest(id=task_execution_identifier.to_flyte_idl())
+            )
+        )
+
+    def list_task_executions(
+        self,
+        node_execution_identifier: _identifier.NodeExecutionIdentifier,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+    ) -> typing.AsyncIterator[_task_execution.TaskExecution]:
+        """
+        Iterates over the task executions of a given node execution.
+
+        :param node_execution_identifier:
+        :param page_size: The number of task executions fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        """
+        return self._paginate(
+            self._stub.ListTaskExecutions,
+            _task_execution_pb2.TaskExecutionListRequest(
+                node_execution_id=node_execution_identifier.to_flyte_idl(),
+                limit=page_size,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            ),
+            "task_executions",
+            _task_execution.TaskExecution.from_flyte_idl,
+        )
+
+    ####################################################################################################################
+    #
+    #  Project Endpoints
+    #
+    ####################################################################################################################
+
+    def list_projects(
+        self,
+        page_size: int = 100,
+        filters: typing.Optional[typing.List[_filters.Filter]] = None,
+        sort_by: typing.Optional[_admin_common.Sort] = None,
+    ) -> typing.AsyncIterator[_project.Project]:
+        """
+        Iterates over the registered projects.
+
+        :param page_size: The number of projects fetched per call.
+        :param filters: [Optional] If specified, the filters will be applied to the query.
+        :param sort_by: [Optional] If provided, the results will be sorted.
+        """
+        return self._paginate(
+            self._stub.ListProjects,
+            _project_pb2.ProjectListRequest(
+                limit=page_size,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            ),
+            "projects",
+            _project.Project.from_flyte_idl,
+        )
@@ -16,9 +16,15 @@ from flytekit.clients.auth.authenticator import (
     DeviceCodeAuthenticator,
     PKCEAuthenticator,
 )
-from flytekit.clients.grpc_utils.auth_interceptor import AuthUnaryInterceptor
-from flytekit.clients.grpc_utils.default_metadata_interceptor import DefaultMetadataInterceptor
-from flytekit.clients.grpc_utils.wrap_exception_interceptor import RetryExceptionWrapperInterceptor
+from flytekit.clients.grpc_utils.auth_interceptor import AsyncAuthUnaryInterceptor, AuthUnaryInterceptor
+from flytekit.clients.grpc_utils.default_metadata_interceptor import (
+    AsyncDefaultMetadataInterceptor,
+    DefaultMetadataInterceptor,
+)
+from flytekit.clients.grpc_utils.wrap_exception_interceptor import (
+    AsyncRetryExceptionWrapperInterceptor,
+    RetryExceptionWrapperInterceptor,
+)
 from flytekit.configuration import AuthType, PlatformConfig
 
 
@@ -195,26 +201,10 @@ def get_channel(cfg: PlatformConfig, **kwargs) -> grpc.Channel:
     if cfg.insecure:
         return grpc.intercept_channel(grpc.insecure_channel(cfg.endpoint, **kwargs), DefaultMetadataInterceptor())
 
-    credentials = None
-    if "credentials" not in kwargs:
-        if cfg.insecure_skip_verify:
-            credentials = bootstrap_creds_from_server(cfg.endpoint)
-        elif cfg.ca_cert_file_path:
-            with open(cfg.ca_cert_file_path, "rb") as f:
-                st_cert = f.read()
-            credentials = grpc.ssl_channel_credentials(st_cert)
-        else:
-            credentials = grpc.ssl_channel_credentials(
-                root_certificates=kwargs.get("root_certificates", None),
-                private_key=kwargs.get("private_key", None),
-                certificate_chain=kwargs.get("certificate_chain", None),
-            )
-    else:
-        credentials = kwargs["credentials"]
     return grpc.intercept_channel(
         grpc.secure_channel(
             target=cfg.endpoint,
-            credentials=credentials,
+            credentials=_get_channel_credentials(cfg, **kwargs),
             options=kwargs.get("options", None),
             compression=kwargs.get("compression", None),
         ),
@@ -222,6 +212,60 @@ def get_channel(cfg: PlatformConfig, **kwargs) -> grpc.Channel:
     )
 
 
+def _get_channel_credentials(cfg: PlatformConfig, **kwargs) -> grpc.ChannelCredentials:
+    if "credentials" in kwargs:
+        return kwargs["credentials"]
+    if cfg.insecure_skip_verify:
+        return bootstrap_creds_from_server(cfg.endpoint)
+    if cfg.ca_cert_file_path:
+        with open(cfg.ca_cert_file_path, "rb") as f:
+            st_cert = f.read()
+        return grpc.ssl_channel_credentials(st_cert)
+    return grpc.ssl_channel_credentials(
+        root_certificates=kwargs.get("root_certificates", None),
+        private_key=kwargs.get("private_key", None),
+        certificate_chain=kwargs.get("certificate_chain", None),
+    )
+
+
+def get_async_channel(cfg: PlatformConfig, **kwargs) -> grpc.aio.Channel:
+    """
+    Creates a ``grpc.aio`` channel for the given config, with the same interceptors as the synchronous channels: Flyte
+    exceptions and retries, authentication, proxy authentication if configured, and the default metadata. It takes
+    the same optional arguments as :py:func:`get_channel`.
+
+    The channel is bound to the running event loop, so it has to be created and used in the same loop.
+
+    :param cfg: PlatformConfig
+    :param kwargs: Optional arguments to be passed to channel method
+    :return: grpc.aio.Channel (secure / insecure)
+    """
+    # The client config is only fetched by the authenticator, on a worker thread, so it uses a synchronous channel.
+    cfg_store = RemoteClientConfigStore(upgrade_channel_to_proxy_authenticated(cfg, get_channel(cfg, **kwargs)))
+    interceptors = [
+        AsyncRetryExceptionWrapperInterceptor(max_retries=cfg.rpc_retries),
+        AsyncAuthUnaryInterceptor(get_authenticator(cfg, cfg_store)),
+    ]
+    if cfg.proxy_command:
+        interceptors.append(AsyncAuthUnaryInterceptor(get_proxy_authenticator(cfg)))
+    interceptors.append(AsyncDefaultMetadataInterceptor())
+
+    if cfg.insecure:
+        return grpc.aio.insecure_channel(
+            cfg.endpoint,
+            options=kwargs.get("options", None),
+            compression=kwargs.get("compression", None),
+            interceptors=interceptors,
+        )
+    return grpc.aio.secure_channel(
+        cfg.endpoint,
+        _get_channel_credentials(cfg, **kwargs),
+        options=kwargs.get("options", None),
+        compression=kwargs.get("compression", None),
+        interceptors=interceptors,
+    )
+
+
 def wrap_exceptions_channel(cfg: PlatformConfig, in_channel: grpc.Channel) -> grpc.Channel:
     """
     Wraps the input channel with RetryExceptionWrapperInterceptor. This wrapper will cover all
@@ -1,3 +1,4 @@
+import asyncio
 import typing
 from collections import namedtuple
 
@@ -78,3 +79,74 @@ class AuthUnaryInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamCli
             updated_call_details = self._call_details_with_auth_metadata(client_call_details)
             return continuation(updated_call_details, request)
         return c
+
+
+def _aio_call_details(
+    client_call_details: grpc.aio.ClientCallDetails, metadata: typing.Optional[grpc.aio.Metadata]
+) -> grpc.aio.ClientCallDetails:
+    return grpc.aio.ClientCallDetails(
+        client_call_details.method,
+        client_call_details.timeout,
+        metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+    )
+
+
+class AsyncAuthUnaryInterceptor(grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor):
+    """
+    The asyncio counterpart of :py:class:`AuthUnaryInterceptor`, for channels created with ``grpc.aio``. The
+    credentials are refreshed on a worker thread, so that the event loop is not blocked, and only once when many
+    concurrent calls are rejected with the same credentials.
+    """
+
+    def __init__(self, authenticator: Authenticator):
+        self._authenticator = authenticator
+        self._refresh_lock: typing.Optional[asyncio.Lock] = None
+
+    def _call_details_with_auth_metadata(
+        self, client_call_details: grpc.aio.ClientCallDetails
+    ) -> grpc.aio.ClientCallDetails:
+        auth_metadata = self._authenticator.fetch_grpc_call_auth_metadata()
+        if not auth_metadata:
+            return client_call_details
+        return _aio_call_details(
+            client_call_details, grpc.aio.Metadata(*(client_call_details.metadata or ()), auth_metadata)
+        )
+
+    async def _refresh_credentials(self, stale_credentials: typing.Any):
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            # Another call may have refreshed the credentials while this one was waiting for the lock.
+            if self._authenticator.get_credentials() is stale_credentials:
+                await asyncio.get_running_loop().run_in_executor(None, self._authenticator.refresh_credentials)
+
+    async def intercept_unary_unary(
+        self,
+        continuation: typing.Callable,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: typing.Any,
+    ):
+        """
+        Intercepts unary calls and adds auth metadata if available. On Unauthenticated, resets the token and refreshes
+        and then retries with the new token
+        """
+        credentials = self._authenticator.get_credentials()
+        call = await continuation(self._call_details_with_auth_metadata(client_call_details), request)
+        code = await call.code()
+        if code == grpc.StatusCode.UNAUTHENTICATED or code == grpc.StatusCode.UNKNOWN:
+            await self._refresh_credentials(credentials)
+            return await continuation(self._call_details_with_auth_metadata(client_call_details), request)
+        return call
+
+    async def intercept_unary_stream(
+        self,
+        continuation: typing.Callable,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: typing.Any,
+    ):
+        """
+        Handles a stream call and adds authentication metadata if needed
+        """
+        return await continuation(self._call_details_with_auth_metadata(client_call_details), request)
@@ -2,7 +2,7 @@ import typing
 
 import grpc
 
-from flytekit.clients.grpc_utils.auth_interceptor import _ClientCallDetails
+from flytekit.clients.grpc_utils.auth_interceptor import _aio_call_details, _ClientCallDetails
 
 
 class DefaultMetadataInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
@@ -41,3 +41,37 @@ class DefaultMetadataInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStr
         """
         updated_call_details = self._inject_default_metadata(client_call_details)
         return continuation(updated_call_details, request)
+
+
+class AsyncDefaultMetadataInterceptor(grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor):
+    """
+    The asyncio counterpart of :py:class:`DefaultMetadataInterceptor`, for channels created with ``grpc.aio``.
+    """
+
+    @staticmethod
+    def _inject_default_metadata(call_details: grpc.aio.ClientCallDetails) -> grpc.aio.ClientCallDetails:
+        return _aio_call_details(
+            call_details, grpc.aio.Metadata(("accept", "application/grpc"), *(call_details.metadata or ()))
+        )
+
+    async def intercept_unary_unary(
+        self,
+        continuation: typing.Callable,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: typing.Any,
+    ):
+        """
+        Intercepts unary calls and inject default metadata
+        """
+        return await continuation(self._inject_default_metadata(client_call_details), request)
+
+    async def intercept_unary_stream(
+        self,
+        continuation: typing.Callable,
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: typing.Any,
+    ):
+        """
+        Handles a stream call and inject default metadata
+        """
+        return await continuation(self._inject_default_metadata(client_call_details), request)
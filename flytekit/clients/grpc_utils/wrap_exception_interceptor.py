@@ -47,3 +47,31 @@ class RetryExceptionWrapperInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.Un
     def intercept_unary_stream(self, continuation, client_call_details, request):
         c: grpc.Call = continuation(client_call_details, request)
         return c
+
+
+class AsyncRetryExceptionWrapperInterceptor(
+    grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    """
+    The asyncio counterpart of :py:class:`RetryExceptionWrapperInterceptor`, for channels created with ``grpc.aio``.
+    """
+
+    def __init__(self, max_retries: int = 3):
+        self._max_retries = max_retries
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        retries = 0
+        while True:
+            call = await continuation(client_call_details, request)
+            try:
+                try:
+                    return await call
+                except grpc.RpcError as e:
+                    RetryExceptionWrapperInterceptor._raise_if_exc(request, e)
+            except FlyteException as e:
+                if retries == self._max_retries:
+                    raise e
+                retries = retries + 1
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await continuation(client_call_details, request)
@@ -19,4 +19,32 @@ def clear_local_cache():
     LocalTaskCache.clear()
 
 
+@click.command("prune")
+def prune_local_cache():
+    """
+    This command will remove expired objects from local cache and evict objects until it fits its size limit.
+    """
+    removed = LocalTaskCache.prune()
+    click.echo(f"Removed {removed} objects from local cache")
+
+
+@click.command("stats")
+def local_cache_stats():
+    """
+    This command will show the hits, misses, bytes read and written and size of local cache.
+    """
+    stats = LocalTaskCache.stats()
+    lookups = stats.hits + stats.misses
+    hit_ratio = f" ({stats.hits / lookups:.1%})" if lookups else ""
+    click.echo(f"Hits: {stats.hits}{hit_ratio}")
+    click.echo(f"Misses: {stats.misses}")
+    click.echo(f"Read: {stats.bytes_read} bytes")
+    click.echo(f"Written: {stats.bytes_written} bytes")
+    click.echo(f"Entries: {stats.entries}")
+    click.echo(f"Size: {stats.volume} / {stats.size_limit} bytes")
+    click.echo(f"Eviction policy: {stats.eviction_policy}")
+
+
 local_cache.add_command(clear_local_cache)
+local_cache.add_command(prune_local_cache)
+local_cache.add_command(local_cache_stats)
@@ -11,6 +11,7 @@ from flytekit.configuration import ImageConfig
 from flytekit.configuration.default_images import DefaultImages
 from flytekit.interaction.click_types import key_value_callback
 from flytekit.loggers import logger
+from flytekit.remote.remote import REGISTRATION_CONCURRENCY
 from flytekit.tools import repo
 
 _register_help = """
@@ -125,6 +126,27 @@ the root of your project, it finds the first folder that does not have a ``__ini
     help="Skip errors during registration. This is useful when registering multiple packages and you want to skip "
     "errors for some packages.",
 )
+@click.option(
+    "--concurrency",
+    required=False,
+    type=int,
+    default=REGISTRATION_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of entities that are registered at the same time.",
+)
+@click.option(
+    "--skip-unchanged",
+    default=False,
+    is_flag=True,
+    help="Skip the entities that were registered with the same version and spec before, as recorded in a local index, "
+    "without sending them to the backend.",
+)
+@click.option(
+    "--verify-unchanged",
+    default=False,
+    is_flag=True,
+    help="With --skip-unchanged, check the local index against the backend first.",
+)
 @click.argument("package-or-module", type=click.Path(exists=True, readable=True, resolve_path=True), nargs=-1)
 @click.pass_context
 def register(
@@ -144,6 +166,9 @@ def register(
     activate_launchplans: bool,
     env: typing.Optional[typing.Dict[str, str]],
     skip_errors: bool,
+    concurrency: int,
+    skip_unchanged: bool,
+    verify_unchanged: bool,
 ):
     """
     see help
@@ -197,6 +222,9 @@ def register(
             dry_run=dry_run,
             activate_launchplans=activate_launchplans,
             skip_errors=skip_errors,
+            concurrency=concurrency,
+            skip_unchanged=skip_unchanged,
+            verify_unchanged=verify_unchanged,
         )
     except Exception as e:
         raise e
@@ -600,14 +600,34 @@ class DataConfig(object):
     s3: S3Config = S3Config()
     gcs: GCSConfig = GCSConfig()
     azure: AzureBlobStorageConfig = AzureBlobStorageConfig()
+    transfer_concurrency: int = 8
+    transfer_chunk_size: int = 16 * 1024 * 1024
+    parquet_rows_per_file: typing.Optional[int] = None
+    parquet_bytes_per_file: typing.Optional[int] = None
+    pickle_compression: typing.Optional[str] = None
+    pickle_out_of_band_buffers: bool = False
+    iterator_prefetch: int = 0
 
     @classmethod
     def auto(cls, config_file: typing.Union[str, ConfigFile] = None) -> DataConfig:
         config_file = get_config_file(config_file)
+        kwargs = {}
+        kwargs = set_if_exists(kwargs, "transfer_concurrency", _internal.Data.TRANSFER_CONCURRENCY.read(config_file))
+        kwargs = set_if_exists(kwargs, "transfer_chunk_size", _internal.Data.TRANSFER_CHUNK_SIZE.read(config_file))
+        kwargs = set_if_exists(kwargs, "parquet_rows_per_file", _internal.Data.PARQUET_ROWS_PER_FILE.read(config_file))
+        kwargs = set_if_exists(
+            kwargs, "parquet_bytes_per_file", _internal.Data.PARQUET_BYTES_PER_FILE.read(config_file)
+        )
+        kwargs = set_if_exists(kwargs, "pickle_compression", _internal.Data.PICKLE_COMPRESSION.read(config_file))
+        kwargs = set_if_exists(
+            kwargs, "pickle_out_of_band_buffers", _internal.Data.PICKLE_OUT_OF_BAND_BUFFERS.read(config_file)
+        )
+        kwargs = set_if_exists(kwargs, "iterator_prefetch", _internal.Data.ITERATOR_PREFETCH.read(config_file))
         return DataConfig(
             azure=AzureBlobStorageConfig.auto(config_file),
             s3=S3Config.auto(config_file),
             gcs=GCSConfig.auto(config_file),
+            **kwargs,
         )
 
 
@@ -619,6 +639,13 @@ class LocalConfig(object):
 
     cache_enabled: bool = True
     cache_overwrite: bool = False
+    cache_size_limit: typing.Optional[int] = None
+    cache_eviction_policy: typing.Optional[str] = None
+    cache_ttl: typing.Optional[int] = None
+    cache_task_ttls: typing.Dict[str, int] = field(default_factory=dict)
+    cache_memory_entries: int = 128
+    map_executor: str = "serial"
+    map_max_workers: typing.Optional[int] = None
 
     @classmethod
     def auto(cls, config_file: typing.Union[str, ConfigFile] = None) -> LocalConfig:
@@ -626,8 +653,33 @@ class LocalConfig(object):
         kwargs = {}
         kwargs = set_if_exists(kwargs, "cache_enabled", _internal.Local.CACHE_ENABLED.read(config_file))
         kwargs = set_if_exists(kwargs, "cache_overwrite", _internal.Local.CACHE_OVERWRITE.read(config_file))
+        kwargs = set_if_exists(kwargs, "cache_size_limit", _internal.Local.CACHE_SIZE_LIMIT.read(config_file))
+        kwargs = set_if_exists(kwargs, "cache_eviction_policy", _internal.Local.CACHE_EVICTION_POLICY.read(config_file))
+        kwargs = set_if_exists(kwargs, "cache_ttl", _internal.Local.CACHE_TTL.read(config_file))
+        task_ttls = _internal.Local.CACHE_TASK_TTLS.read(config_file)
+        if task_ttls:
+            kwargs["cache_task_ttls"] = cls._parse_task_ttls(task_ttls)
+        kwargs = set_if_exists(kwargs, "cache_memory_entries", _internal.Local.CACHE_MEMORY_ENTRIES.read(config_file))
+        kwargs = set_if_exists(kwargs, "map_executor", _internal.Local.MAP_EXECUTOR.read(config_file))
+        kwargs = set_if_exists(kwargs, "map_max_workers", _internal.Local.MAP_MAX_WORKERS.read(config_file))
         return LocalConfig(**kwargs)
 
+    @staticmethod
+    def _parse_task_ttls(entries: typing.List[str]) -> typing.Dict[str, int]:
+        task_ttls = {}
+        for entry in entries:
+            if not entry.strip():
+                continue
+            name, _, ttl = entry.rpartition("=")
+            if not name.strip() or not ttl.strip().isdigit():
+                setting = _internal.Local.CACHE_TASK_TTLS.legacy
+                raise ValueError(
+                    f"Invalid entry '{entry}' in {setting.section}.{setting.option} ({setting.get_env_name()}), "
+                    f"expected <task name>=<seconds>"
+                )
+            task_ttls[name.strip()] = int(ttl)
+        return task_ttls
+
 
 @dataclass(init=True, repr=True, eq=True, frozen=True)
 class Config(object):
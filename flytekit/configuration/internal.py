@@ -66,10 +66,79 @@ class AZURE(object):
     CLIENT_SECRET = ConfigEntry(LegacyConfigEntry(SECTION, "client_secret"))
 
 
+class Data(object):
+    SECTION = "data"
+    TRANSFER_CONCURRENCY = ConfigEntry(LegacyConfigEntry(SECTION, "transfer_concurrency", int))
+    """
+    The maximum number of values that are uploaded (or downloaded) at the same time while converting task outputs
+    (or inputs) that are offloaded to blob storage, like files, directories and structured datasets.
+    """
+    TRANSFER_CHUNK_SIZE = ConfigEntry(LegacyConfigEntry(SECTION, "transfer_chunk_size", int))
+    """
+    The size in bytes of the parts that single large files are split into, to be downloaded (or uploaded, if the file
+    system supports it) in parallel. Set to 0 to always transfer files in one piece.
+    """
+    PARQUET_ROWS_PER_FILE = ConfigEntry(LegacyConfigEntry(SECTION, "parquet_rows_per_file", int))
+    """
+    If set, dataframes are written to parquet as several files of at most this many rows, which are encoded and
+    uploaded concurrently.
+    """
+    PARQUET_BYTES_PER_FILE = ConfigEntry(LegacyConfigEntry(SECTION, "parquet_bytes_per_file", int))
+    """
+    If set, dataframes are written to parquet as several files of roughly this many (in-memory) bytes each, which are
+    encoded and uploaded concurrently.
+    """
+    PICKLE_COMPRESSION = ConfigEntry(LegacyConfigEntry(SECTION, "pickle_compression"))
+    """
+    Compresses values that are passed between tasks as pickles, one of ``gzip``, ``lz4`` or ``zstd``. The latter two
+    require the ``lz4`` or ``zstandard`` package to be installed.
+    """
+    PICKLE_OUT_OF_BAND_BUFFERS = ConfigEntry(LegacyConfigEntry(SECTION, "pickle_out_of_band_buffers", bool))
+    """
+    If set, large buffers like numpy arrays are written next to the pickle stream instead of being copied into it,
+    using pickle protocol 5.
+    """
+    ITERATOR_PREFETCH = ConfigEntry(LegacyConfigEntry(SECTION, "iterator_prefetch", int))
+    """
+    The number of elements of an ``Iterator`` input that are converted, and downloaded if they are files or
+    directories, in the background while the task processes the current one. 0 converts every element on access.
+    """
+
+
 class Local(object):
     SECTION = "local"
     CACHE_ENABLED = ConfigEntry(LegacyConfigEntry(SECTION, "cache_enabled", bool))
     CACHE_OVERWRITE = ConfigEntry(LegacyConfigEntry(SECTION, "cache_overwrite", bool))
+    CACHE_SIZE_LIMIT = ConfigEntry(LegacyConfigEntry(SECTION, "cache_size_limit", int))
+    """
+    Maximum size in bytes of the local cache on disk, entries are evicted once it is exceeded.
+    """
+    CACHE_EVICTION_POLICY = ConfigEntry(LegacyConfigEntry(SECTION, "cache_eviction_policy"))
+    """
+    Which entries are evicted from the local cache first, one of ``least-recently-stored``, ``least-recently-used``,
+    ``least-frequently-used`` or ``none``.
+    """
+    CACHE_TTL = ConfigEntry(LegacyConfigEntry(SECTION, "cache_ttl", int))
+    """
+    Number of seconds after which entries of the local cache expire.
+    """
+    CACHE_TASK_TTLS = ConfigEntry(LegacyConfigEntry(SECTION, "cache_task_ttls", list))
+    """
+    Comma-delimited list of ``<task name>=<seconds>`` that overrides the local cache TTL of individual tasks.
+    """
+    CACHE_MEMORY_ENTRIES = ConfigEntry(LegacyConfigEntry(SECTION, "cache_memory_entries", int))
+    """
+    Number of recently used entries of the local cache that are also kept in memory.
+    """
+    MAP_EXECUTOR = ConfigEntry(LegacyConfigEntry(SECTION, "map_executor"))
+    """
+    How the instances of a map task are run during local executions, one of ``serial`` (the default), ``thread`` or
+    ``process``.
+    """
+    MAP_MAX_WORKERS = ConfigEntry(LegacyConfigEntry(SECTION, "map_max_workers", int))
+    """
+    Upper bound on the number of map task instances that are run at the same time during local executions.
+    """
 
 
 class Credentials(object):
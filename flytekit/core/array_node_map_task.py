@@ -7,15 +7,17 @@ import os  # TODO: use flytekit logger
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Set, Union, cast
 
-from flytekit.configuration import SerializationSettings
+from flytekit.configuration import LocalConfig, SerializationSettings
 from flytekit.core import tracker
 from flytekit.core.base_task import PythonTask, TaskResolverMixin
 from flytekit.core.context_manager import ExecutionState, FlyteContext, FlyteContextManager
 from flytekit.core.interface import transform_interface_to_list_interface
+from flytekit.core.map_task import run_local_map_instances
 from flytekit.core.python_function_task import PythonFunctionTask, PythonInstanceTask
+from flytekit.core.type_engine import TypeEngine
 from flytekit.core.utils import timeit
 from flytekit.exceptions import scopes as exception_scopes
-from flytekit.loggers import logger
+from flytekit.models import literals as _literal_models
 from flytekit.models.array_job import ArrayJob
 from flytekit.models.core.workflow import NodeMetadata
 from flytekit.models.interface import Variable
@@ -87,6 +89,7 @@ class ArrayNodeMapTask(PythonTask):
         self._concurrency: Optional[int] = concurrency
         self._min_successes: Optional[int] = min_successes
         self._min_success_ratio: Optional[float] = min_success_ratio
+        self._local_config: Optional[LocalConfig] = None
         self._collection_interface = collection_interface
 
         if "metadata" not in kwargs and actual_task.metadata:
@@ -217,15 +220,29 @@ class ArrayNodeMapTask(PythonTask):
         return self._raw_execute(**kwargs)
 
     def _execute_map_task(self, _: FlyteContext, **kwargs) -> Any:
+        return exception_scopes.user_entry_point(self.python_function_task.execute)(**kwargs)
+
+    def _literal_map_to_python_input(
+        self, literal_map: _literal_models.LiteralMap, ctx: FlyteContext
+    ) -> Dict[str, Any]:
+        """
+        When executed by the Flyte platform, every instance of the map task only uses the element of the mapped inputs
+        at its own index. Only that element is converted, instead of the full input collections.
+        """
+        if ctx.execution_state is None or ctx.execution_state.mode != ExecutionState.Mode.TASK_EXECUTION:
+            return super()._literal_map_to_python_input(literal_map, ctx)
+
         task_index = self._compute_array_job_index()
-        map_task_inputs = {}
-        for k in self.interface.inputs.keys():
-            v = kwargs[k]
-            if isinstance(v, list) and k not in self.bound_inputs:
-                map_task_inputs[k] = v[task_index]
+        literals = {}
+        python_types = {}
+        for k, v in literal_map.literals.items():
+            if k not in self.bound_inputs and v.collection is not None:
+                literals[k] = v.collection.get_literal(task_index)
+                python_types[k] = self.python_function_task.python_interface.inputs[k]
             else:
-                map_task_inputs[k] = v
-        return exception_scopes.user_entry_point(self.python_function_task.execute)(**map_task_inputs)
+                literals[k] = v
+                python_types[k] = self.python_interface.inputs[k]
+        return TypeEngine.literal_map_to_kwargs(ctx, _literal_models.LiteralMap(literals=literals), python_types)
 
     @staticmethod
     def _compute_array_job_index() -> int:
@@ -274,7 +291,6 @@ class ArrayNodeMapTask(PythonTask):
         outputs_expected = True
         if not self.interface.outputs:
             outputs_expected = False
-        outputs = []
 
         mapped_tasks_count = 0
         if self._run_task.interface.inputs.items():
@@ -284,13 +300,13 @@ class ArrayNodeMapTask(PythonTask):
                     mapped_tasks_count = len(v)
                     break
 
-        failed_count = 0
         min_successes = mapped_tasks_count
         if self._min_successes:
             min_successes = self._min_successes
         elif self._min_success_ratio:
             min_successes = math.ceil(min_successes * self._min_success_ratio)
 
+        instances = []
         for i in range(mapped_tasks_count):
             single_instance_inputs = {}
             for k in self.interface.inputs.keys():
@@ -299,18 +315,22 @@ class ArrayNodeMapTask(PythonTask):
                     single_instance_inputs[k] = kwargs[k][i]
                 else:
                     single_instance_inputs[k] = kwargs[k]
-            try:
-                o = exception_scopes.user_entry_point(self._run_task.execute)(**single_instance_inputs)
-                if outputs_expected:
-                    outputs.append(o)
-            except Exception as exc:
-                outputs.append(None)
-                failed_count += 1
-                if mapped_tasks_count - failed_count < min_successes:
-                    logger.error("The number of successful tasks is lower than the minimum ratio")
-                    raise exc
+            instances.append(single_instance_inputs)
+
+        return run_local_map_instances(
+            self._run_task.execute,
+            instances,
+            min_successes,
+            outputs_expected,
+            self._get_local_config(),
+            self._concurrency,
+        )
 
-        return outputs
+    def _get_local_config(self) -> LocalConfig:
+        # Only read on the first local execution of this task, instead of for every call.
+        if self._local_config is None:
+            self._local_config = LocalConfig.auto()
+        return self._local_config
 
 
 def map_task(
@@ -329,7 +349,9 @@ def map_task(
     :param task_function: This argument is implicitly passed and represents the repeatable function
     :param concurrency: If specified, this limits the number of mapped tasks than can run in parallel to the given batch
         size. If the size of the input exceeds the concurrency value, then multiple batches will be run serially until
-        all inputs are processed. If left unspecified, this means unbounded concurrency.
+        all inputs are processed. If left unspecified, this means unbounded concurrency. Local executions run the
+        mapped tasks serially, unless a thread or process pool is enabled with
+        :py:class:`flytekit.configuration.LocalConfig`, which is bounded the same way.
     :param min_success_ratio: If specified, this determines the minimum fraction of total jobs which can complete
         successfully before terminating this task and marking it successful.
     """
@@ -43,6 +43,7 @@ from flytekit.core.context_manager import (
 )
 from flytekit.core.interface import Interface, transform_interface_to_typed_interface
 from flytekit.core.local_cache import LocalTaskCache
+from flytekit.core.prefetch import prefetch_inputs
 from flytekit.core.promise import (
     Promise,
     VoidPromise,
@@ -53,7 +54,7 @@ from flytekit.core.promise import (
     translate_inputs_to_literals,
 )
 from flytekit.core.tracker import TrackedInstance
-from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError
+from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError, is_offloaded_type, map_concurrently
 from flytekit.core.utils import timeit
 from flytekit.loggers import logger
 from flytekit.models import dynamic_job as _dynamic_job
@@ -64,6 +65,7 @@ from flytekit.models.core import workflow as _workflow_model
 from flytekit.models.documentation import Description, Documentation
 from flytekit.models.interface import Variable
 from flytekit.models.security import SecurityContext
+from flytekit.models.types import LiteralType
 
 DYNAMIC_PARTITIONS = "_uap"
 MODEL_CARD = "_ucm"
@@ -437,6 +439,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         environment: Optional[Dict[str, str]] = None,
         disable_deck: Optional[bool] = None,
         enable_deck: Optional[bool] = None,
+        prefetch_inputs: bool = False,
         **kwargs,
     ):
         """
@@ -452,6 +455,8 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
                 execution of the task. Supplied as a dictionary of key/value pairs
             disable_deck (bool): (deprecated) If true, this task will not output deck html file
             enable_deck (bool): If true, this task will output deck html file
+            prefetch_inputs (bool): If true, all remote files and directories among the inputs are downloaded in the
+                background as soon as the task starts, instead of on first access
         """
         super().__init__(
             task_type=task_type,
@@ -462,6 +467,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         self._python_interface = interface if interface else Interface()
         self._environment = environment if environment else {}
         self._task_config = task_config
+        self._prefetch_inputs = prefetch_inputs
 
         if disable_deck is not None:
             warnings.warn("disable_deck was deprecated in 1.10.0, please use enable_deck instead", FutureWarning)
@@ -500,6 +506,13 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         """
         return self._python_interface
 
+    @property
+    def prefetch_inputs(self) -> bool:
+        """
+        If true, remote files and directories among the inputs are downloaded in the background before the task runs.
+        """
+        return self._prefetch_inputs
+
     @property
     def task_config(self) -> Optional[T]:
         """
@@ -570,23 +583,36 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         # We manually construct a LiteralMap here because task inputs and outputs actually violate the assumption
         # built into the IDL that all the values of a literal map are of the same type.
         with timeit("Translate the output to literals"):
-            literals = {}
-            omt = ctx.output_metadata_tracker
+            outputs = []
             for i, (k, v) in enumerate(native_outputs_as_map.items()):
                 literal_type = self._outputs_interface[k].type
                 py_type = self.get_type_for_output_var(k, v)
 
                 if isinstance(v, tuple):
                     raise TypeError(f"Output({k}) in task '{self.name}' received a tuple {v}, instead of {py_type}")
+                outputs.append((i, k, v, py_type, literal_type))
+
+            def to_literal(i: int, k: str, v: Any, py_type: Type, literal_type: LiteralType) -> _literal_models.Literal:
                 try:
-                    lit = TypeEngine.to_literal(ctx, v, py_type, literal_type)
-                    literals[k] = lit
+                    return TypeEngine.to_literal(ctx, v, py_type, literal_type)
                 except Exception as e:
                     # only show the name of output key if it's user-defined (by default Flyte names these as "o<n>")
                     key = k if k != f"o{i}" else i
                     msg = f"Failed to convert outputs of task '{self.name}' at position {key}:\n  {e}"
                     logger.error(msg)
                     raise TypeError(msg) from e
+
+            # Outputs that are offloaded to blob storage (files, directories, dataframes, ...) are independent
+            # uploads, so they are converted concurrently.
+            if sum(is_offloaded_type(o[-1]) for o in outputs) > 1:
+                lits = map_concurrently(ctx, to_literal, outputs)
+            else:
+                lits = [to_literal(*o) for o in outputs]
+
+            literals = {}
+            omt = ctx.output_metadata_tracker
+            for (_, k, v, _, _), lit in zip(outputs, lits):
+                literals[k] = lit
                 # Now check if there is any output metadata associated with this output variable and attach it to the
                 # literal
                 if omt is not None:
@@ -671,8 +697,9 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             # TODO: Logger should auto inject the current context information to indicate if the task is running within
             #   a workflow or a subworkflow etc
             logger.info(f"Invoking {self.name} with inputs: {native_inputs}")
-            with timeit("Execute user level code"):
-                native_outputs = self.execute(**native_inputs)
+            with prefetch_inputs(exec_ctx, native_inputs, self.python_interface.inputs, self._prefetch_inputs):
+                with timeit("Execute user level code"):
+                    native_outputs = self.execute(**native_inputs)
 
             if inspect.iscoroutine(native_outputs):
                 # If native outputs is a coroutine, then this is an eager workflow.
@@ -20,8 +20,9 @@ import pathlib
 import tempfile
 import traceback
 import typing
+from concurrent.futures import Executor, Future
 from contextlib import contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -827,6 +828,13 @@ class FlyteContext(object):
             return ExecutionState(working_dir=working_dir)
 
 
+def _run_with_own_context_stack(fn: typing.Callable, args: tuple, kwargs: dict) -> typing.Any:
+    # The copied context still shares its list of FlyteContexts with the submitting thread, so give this thread its own
+    # list before anything can push onto it.
+    flyte_context_Var.set(list(flyte_context_Var.get()))
+    return fn(*args, **kwargs)
+
+
 class FlyteContextManager(object):
     """
     FlyteContextManager manages the execution context within Flytekit. It holds global state of either compilation
@@ -918,6 +926,14 @@ class FlyteContextManager(object):
     def size() -> int:
         return len(flyte_context_Var.get())
 
+    @staticmethod
+    def submit(executor: Executor, fn: typing.Callable, /, *args, **kwargs) -> Future:
+        """
+        Submits ``fn`` to a thread pool ``executor``, to be run with the current context. Threads do not inherit the
+        context of the thread that started them, so without this ``fn`` would run with a freshly initialized one.
+        """
+        return executor.submit(copy_context().run, _run_with_own_context_stack, fn, args, kwargs)
+
     @staticmethod
     def initialize():
         """
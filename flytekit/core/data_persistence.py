@@ -15,17 +15,29 @@ simple implementation that ships with the core.
    :nosignatures:
 
    FileAccessProvider
+   TransferMetrics
+   submit_transfer
+   map_transfers
 
 """
+import collections
+import inspect
 import io
+import math
 import os
 import pathlib
 import tempfile
+import threading
+import time
 import typing
-from typing import Any, Dict, Optional, Union, cast
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union, cast
 from uuid import UUID
 
 import fsspec
+from fsspec.implementations.local import LocalFileSystem
 from fsspec.utils import get_protocol
 from typing_extensions import Unpack
 
@@ -101,12 +113,125 @@ def get_fsspec_storage_options(
     return {}
 
 
+@dataclass(frozen=True)
+class TransferMetrics(object):
+    """
+    Size and duration of a single file transfer, see :py:attr:`FileAccessProvider.transfers`. ``parts`` is the number
+    of ranged reads a download was split into by flytekit, transfers split by the file system itself count as one.
+    """
+
+    source: str
+    destination: str
+    size: int
+    seconds: float
+    parts: int = 1
+
+    @property
+    def throughput(self) -> float:
+        """
+        Bytes transferred per second.
+        """
+        return self.size / self.seconds if self.seconds > 0 else float("inf")
+
+
+T = typing.TypeVar("T")
+
+# One pool runs the transfers of the whole process (conversions of task inputs and outputs, ranged downloads, directory
+# transfers, hashing and prefetching), so that transfers running at the same time share its limit instead of each
+# starting their own threads.
+_transfer_executor: Optional[ThreadPoolExecutor] = None
+_transfer_executor_workers = 0
+_transfer_executor_lock = threading.Lock()
+# Set in the transfer pool's threads, whose nested transfers must not wait for the pool they are running on.
+_in_transfer: ContextVar[bool] = ContextVar("in_transfer", default=False)
+
+
+def _get_transfer_executor(workers: int) -> ThreadPoolExecutor:
+    global _transfer_executor, _transfer_executor_workers
+    with _transfer_executor_lock:
+        if _transfer_executor is None or _transfer_executor_workers != workers:
+            if _transfer_executor is not None:
+                # Transfers already submitted to the previous pool still run to completion.
+                _transfer_executor.shutdown(wait=False)
+            _transfer_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flytekit-transfer")
+            _transfer_executor_workers = workers
+        return _transfer_executor
+
+
+def _run_transfer(fn: typing.Callable[..., T], *args) -> T:
+    _in_transfer.set(True)
+    return fn(*args)
+
+
+def submit_transfer(workers: int, fn: typing.Callable[..., T], *args) -> "Future[T]":
+    """
+    Submits ``fn(*args)`` to the transfer pool shared by the whole process, which has ``workers``
+    (``DataConfig.transfer_concurrency``) threads, and runs it with the current context. If ``workers`` is at most 1,
+    or on a thread of the pool itself, ``fn`` is run right away and the returned future is already done, so nested
+    transfers never wait for the pool they are running on.
+    """
+    if workers <= 1 or _in_transfer.get():
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    from flytekit.core.context_manager import FlyteContextManager
+
+    return FlyteContextManager.submit(_get_transfer_executor(workers), _run_transfer, fn, *args)
+
+
+def map_transfers(
+    workers: int, fn: typing.Callable[..., T], items: typing.Sequence, max_concurrency: Optional[int] = None
+) -> typing.List[T]:
+    """
+    Calls ``fn(*item)`` for every item with :py:func:`submit_transfer`, with at most ``max_concurrency`` of them in
+    flight when it is set, and returns the results in the order of ``items``. Every call runs to completion before the
+    first failure, if any, is re-raised, so no transfer is left running in the background.
+    """
+    limit = min(workers, max_concurrency) if max_concurrency else workers
+    if len(items) <= 1 or limit <= 1 or _in_transfer.get():
+        return [fn(*item) for item in items]
+    futures: typing.List[Future] = []
+    running: typing.Set[Future] = set()
+    for item in items:
+        if len(running) >= limit:
+            _, running = wait(running, return_when=FIRST_COMPLETED)
+        future = submit_transfer(workers, fn, *item)
+        futures.append(future)
+        running.add(future)
+    wait(running)
+    return [f.result() for f in futures]
+
+
+_TRANSFER_PARAMS: Dict[Tuple[type, str], Tuple[str, ...]] = {}
+# S3 multipart uploads can have at most this many parts.
+_MAX_UPLOAD_PARTS = 10_000
+
+
+def _transfer_params(fs_type: type, method: str) -> Tuple[str, ...]:
+    """
+    Returns which of ``chunksize`` and ``max_concurrency`` the ``get_file`` / ``put_file`` of the file system accepts.
+    For example, s3fs and gcsfs uploads take the part size of multipart uploads (but upload the parts one after the
+    other), and adlfs transfers take the number of blocks transferred concurrently.
+    """
+    key = (fs_type, method)
+    if key not in _TRANSFER_PARAMS:
+        fn = getattr(fs_type, f"_{method}", None) or getattr(fs_type, method)
+        params = inspect.signature(fn).parameters
+        _TRANSFER_PARAMS[key] = tuple(p for p in ("chunksize", "max_concurrency") if p in params)
+    return _TRANSFER_PARAMS[key]
+
+
 class FileAccessProvider(object):
     """
     This is the class that is available through the FlyteContext and can be used for persisting data to the remote
     durable store.
     """
 
+    MAX_TRANSFER_METRICS = 128
+
     def __init__(
         self,
         local_sandbox_dir: Union[str, os.PathLike],
@@ -128,6 +253,7 @@ class FileAccessProvider(object):
         self._local = fsspec.filesystem(None)
 
         self._data_config = data_config if data_config else DataConfig.auto()
+        self._transfers: typing.Deque[TransferMetrics] = collections.deque(maxlen=self.MAX_TRANSFER_METRICS)
         self._default_protocol = get_protocol(str(raw_output_prefix))
         self._default_remote = cast(fsspec.AbstractFileSystem, self.get_filesystem(self._default_protocol))
         if os.name == "nt" and raw_output_prefix.startswith("file://"):
@@ -146,6 +272,13 @@ class FileAccessProvider(object):
     def data_config(self) -> DataConfig:
         return self._data_config
 
+    @property
+    def transfers(self) -> typing.List[TransferMetrics]:
+        """
+        Size, duration and throughput of the most recent single file downloads and uploads, oldest first.
+        """
+        return list(self._transfers)
+
     @property
     def raw_output_fs(self) -> fsspec.AbstractFileSystem:
         """
@@ -258,6 +391,8 @@ class FileAccessProvider(object):
                     self.strip_file_header(from_path), self.strip_file_header(to_path), dirs_exist_ok=True
                 )
             logger.info(f"Getting {from_path} to {to_path}")
+            if not recursive:
+                return self._get_file(file_system, from_path, to_path, **kwargs)
             dst = file_system.get(from_path, to_path, recursive=recursive, **kwargs)
             if isinstance(dst, (str, pathlib.Path)):
                 return dst
@@ -286,18 +421,109 @@ class FileAccessProvider(object):
                     self.strip_file_header(from_path), self.strip_file_header(to_path), dirs_exist_ok=True
                 )
             from_path, to_path = self.recursive_paths(from_path, to_path)
+        else:
+            size = os.path.getsize(from_path) if os.path.isfile(from_path) else None
+            kwargs = {**self._native_transfer_kwargs(file_system, "put_file", size), **kwargs}
+        start = time.perf_counter()
         dst = file_system.put(from_path, to_path, recursive=recursive, **kwargs)
+        if not recursive and os.path.isfile(from_path):
+            self._record_transfer(from_path, to_path, os.path.getsize(from_path), time.perf_counter() - start)
         if isinstance(dst, (str, pathlib.Path)):
             return dst
         else:
             return to_path
 
+    def _native_transfer_kwargs(
+        self, file_system: fsspec.AbstractFileSystem, method: str, size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Returns the arguments that ask the file system to split a single file transfer into parts itself, limited to
+        the ones its ``get_file`` / ``put_file`` accepts. The part size is only passed for uploads of a known ``size``,
+        and is grown in steps of ``DataConfig.transfer_chunk_size`` so that no upload needs more than 10,000 parts.
+        """
+        if (
+            isinstance(file_system, LocalFileSystem)
+            or self._data_config.transfer_chunk_size <= 0
+            or self._data_config.transfer_concurrency <= 1
+        ):
+            return {}
+        chunk_size = self._data_config.transfer_chunk_size
+        values = {"max_concurrency": self._data_config.transfer_concurrency}
+        if size is not None:
+            values["chunksize"] = chunk_size * max(1, math.ceil(size / (chunk_size * _MAX_UPLOAD_PARTS)))
+        return {param: values[param] for param in _transfer_params(type(file_system), method) if param in values}
+
+    def _record_transfer(self, source: str, destination: str, size: int, seconds: float, parts: int = 1):
+        metrics = TransferMetrics(source=source, destination=destination, size=size, seconds=seconds, parts=parts)
+        self._transfers.append(metrics)
+        logger.debug(
+            f"Transferred {size} bytes from {source} to {destination} in {parts} parts, "
+            f"{seconds:.3f}s at {metrics.throughput / 2**20:.1f} MiB/s"
+        )
+
+    def _get_file(self, file_system: fsspec.AbstractFileSystem, from_path: str, to_path: str, **kwargs):
+        """
+        Downloads a single file. File systems whose ``get_file`` takes a ``max_concurrency`` (e.g. adlfs) are asked to
+        split the download into concurrent parts themselves. For all other remote file systems (e.g. s3fs and gcsfs),
+        files larger than ``DataConfig.transfer_chunk_size`` are downloaded with concurrent ranged reads, which costs
+        one extra request for the size of the file.
+        """
+        chunk_size = self._data_config.transfer_chunk_size
+        concurrency = self._data_config.transfer_concurrency
+        start = time.perf_counter()
+        parts = 1
+        dst = None
+        native_kwargs = self._native_transfer_kwargs(file_system, "get_file")
+        if "max_concurrency" in native_kwargs:
+            dst = file_system.get(from_path, to_path, **native_kwargs, **kwargs)
+        elif isinstance(file_system, LocalFileSystem) or chunk_size <= 0 or concurrency <= 1 or kwargs:
+            dst = file_system.get(from_path, to_path, **kwargs)
+        else:
+            try:
+                size = file_system.size(from_path)
+            except Exception as e:
+                # Let the plain download below report any real problem with the source.
+                logger.debug(f"Could not get the size of {from_path}, downloading it in one piece: {e}")
+                size = None
+            if size is None or size <= chunk_size:
+                dst = file_system.get(from_path, to_path)
+            else:
+                if os.path.isdir(to_path):
+                    to_path = os.path.join(to_path, os.path.basename(from_path))
+                parts = self._get_file_in_parts(file_system, from_path, to_path, size)
+        if isinstance(dst, (str, pathlib.Path)):
+            to_path = str(dst)
+        if os.path.isfile(to_path):
+            self._record_transfer(from_path, to_path, os.path.getsize(to_path), time.perf_counter() - start, parts)
+        return to_path
+
+    def _get_file_in_parts(
+        self, file_system: fsspec.AbstractFileSystem, from_path: str, to_path: str, size: int
+    ) -> int:
+        chunk_size = self._data_config.transfer_chunk_size
+        offsets = range(0, size, chunk_size)
+        with open(to_path, "wb") as f:
+            f.truncate(size)
+
+        def _get_part(offset: int):
+            data = file_system.cat_file(from_path, start=offset, end=min(offset + chunk_size, size))
+            with open(to_path, "r+b") as f:
+                f.seek(offset)
+                f.write(data)
+
+        try:
+            map_transfers(self._data_config.transfer_concurrency, _get_part, [(o,) for o in offsets])
+        except Exception:
+            os.remove(to_path)
+            raise
+        return len(offsets)
+
     def put_raw_data(
         self,
         lpath: Uploadable,
         upload_prefix: Optional[str] = None,
         file_name: Optional[str] = None,
-        read_chunk_size_bytes: int = 1024,
+        read_chunk_size_bytes: Optional[int] = None,
         encoding: str = "utf-8",
         skip_raw_data_prefix: bool = False,
         **kwargs,
@@ -320,7 +546,8 @@ class FileAccessProvider(object):
             string will be generated
         :param file_name: A file name to add to the path. If None, then the file name will be the tail of the path if
             lpath is a file, or a random string if lpath is a buffer
-        :param read_chunk_size_bytes: If lpath is a buffer, this is the chunk size to read from it
+        :param read_chunk_size_bytes: If lpath is a buffer, this is the chunk size to read from it. Defaults to
+            ``DataConfig.transfer_chunk_size``
         :param encoding: If lpath is a io.StringIO, this is the encoding to use to encode it to binary.
         :param skip_raw_data_prefix: If True, the raw data prefix will not be prepended to the upload_prefix
         :param kwargs: Additional kwargs are passed into the the fsspec put() call or the open() call
@@ -337,6 +564,7 @@ class FileAccessProvider(object):
             else:
                 to_path = self.join(to_path, self.get_random_string())
 
+        read_chunk_size_bytes = read_chunk_size_bytes or self._data_config.transfer_chunk_size or 1024 * 1024
         # If lpath is a file, then use put.
         if isinstance(lpath, str) or isinstance(lpath, os.PathLike) or isinstance(lpath, pathlib.Path):
             p = pathlib.Path(lpath)
@@ -475,6 +703,54 @@ class FileAccessProvider(object):
         """
         return self.put_data(local_path, remote_path, is_multipart=True, **kwargs)
 
+    def _transfer_files(
+        self, transfer: typing.Callable[[str], None], paths: typing.Sequence[str], max_concurrency: int
+    ):
+        map_transfers(self._data_config.transfer_concurrency, transfer, [(p,) for p in paths], max_concurrency)
+
+    def get_files(
+        self,
+        remote_directory: str,
+        local_directory: str,
+        relative_paths: typing.Sequence[str],
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Downloads some files of a remote directory to the same relative paths under a local directory, each file on its
+        own, up to ``max_concurrency`` (``DataConfig.transfer_concurrency`` by default) at a time.
+
+        :param relative_paths: Paths of the files relative to the directories, separated with ``/``.
+        """
+        fs = self.get_filesystem_for_path(remote_directory)
+
+        def _get(relative_path: str):
+            local_path = os.path.join(local_directory, *relative_path.split("/"))
+            self.get_data(self.join(remote_directory, relative_path, fs=fs), local_path)
+
+        pathlib.Path(local_directory).mkdir(parents=True, exist_ok=True)
+        self._transfer_files(_get, relative_paths, max_concurrency or self._data_config.transfer_concurrency)
+
+    def put_files(
+        self,
+        local_directory: str,
+        remote_directory: str,
+        relative_paths: typing.Sequence[str],
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        The counterpart of :py:meth:`get_files`, uploads some files of a local directory.
+        """
+        fs = self.get_filesystem_for_path(remote_directory)
+
+        def _put(relative_path: str):
+            local_path = os.path.join(local_directory, *relative_path.split("/"))
+            self.put_data(local_path, self.join(remote_directory, relative_path, fs=fs))
+
+        if isinstance(fs, LocalFileSystem):
+            # Like a recursive put, create the directory even if it is empty. Object stores have no directories.
+            fs.makedirs(remote_directory, exist_ok=True)
+        self._transfer_files(_put, relative_paths, max_concurrency or self._data_config.transfer_concurrency)
+
     def get_data(self, remote_path: str, local_path: str, is_multipart: bool = False, **kwargs):
         """
         :param remote_path:
@@ -1,7 +1,14 @@
-from typing import Callable, Generic, TypeVar
+import hashlib
+import os
+from typing import Callable, Generic, Optional, TypeVar
+
+from flytekit.core.data_persistence import map_transfers
 
 T = TypeVar("T")
 
+# Files are hashed in chunks of this size on several threads. It is part of the digest, do not change it.
+_CONTENT_HASH_CHUNK_SIZE = 16 * 1024 * 1024
+
 
 class HashOnReferenceMixin(object):
     def __hash__(self):
@@ -21,3 +28,66 @@ class HashMethod(Generic[T]):
         Calculate hash for `obj`.
         """
         return self._function(obj)
+
+
+class ContentAddressed(object):
+    """
+    Uploads a ``FlyteFile`` or ``FlyteDirectory`` output to a location derived from the digest of its content, under
+    ``prefix`` (the raw output prefix by default). If the same content was uploaded before, e.g. by another run of the
+    task, the upload is skipped. Like with a :py:class:`HashMethod`, the digest is recorded as the hash of the literal,
+    so that cached downstream tasks key off the content rather than the location.
+
+    .. code-block:: python
+
+        @task
+        def t1() -> Annotated[FlyteFile, ContentAddressed("s3://my-bucket/cas")]:
+            ...
+    """
+
+    def __init__(self, prefix: Optional[str] = None):
+        self._prefix = prefix
+
+    @property
+    def prefix(self) -> Optional[str]:
+        return self._prefix
+
+
+def _hash_file_chunk(path: str, offset: int, length: int) -> bytes:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while length > 0:
+            data = f.read(min(length, 1024 * 1024))
+            if not data:
+                break
+            h.update(data)
+            length -= len(data)
+    return h.digest()
+
+
+def compute_file_digest(path: str, workers: int = 1) -> str:
+    """
+    Returns the sha256 of a local file. Files larger than 16 MiB are hashed in 16 MiB chunks, on the shared transfer
+    pool of ``workers`` threads, the digest is then the sha256 of the chunk digests followed by the number of chunks,
+    like multipart upload ETags.
+    """
+    size = os.path.getsize(path)
+    if size <= _CONTENT_HASH_CHUNK_SIZE:
+        return _hash_file_chunk(path, 0, size).hex()
+    offsets = range(0, size, _CONTENT_HASH_CHUNK_SIZE)
+    digests = map_transfers(workers, _hash_file_chunk, [(path, o, _CONTENT_HASH_CHUNK_SIZE) for o in offsets])
+    return f"{hashlib.sha256(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def compute_directory_digest(path: str, workers: int = 1) -> str:
+    """
+    Returns the sha256 of the relative paths and digests of all the files in a local directory.
+    """
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            full_path = os.path.join(root, name)
+            relative_path = os.path.relpath(full_path, path).replace(os.sep, "/")
+            h.update(f"{relative_path}\0{compute_file_digest(full_path, workers)}\n".encode())
+    return h.hexdigest()
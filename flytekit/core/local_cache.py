@@ -1,57 +1,136 @@
-from typing import Optional
+import atexit
+import hashlib
+import os
+import threading
+import time
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
 
 from diskcache import Cache
+from diskcache.core import EVICTION_POLICY
+from flyteidl.core import literals_pb2
 
-from flytekit import lazy_module
-from flytekit.models.literals import Literal, LiteralCollection, LiteralMap
-
-joblib = lazy_module("joblib")
+from flytekit.configuration import LocalConfig
+from flytekit.models.literals import LiteralMap
 
 # Location on the filesystem where serialized objects will be stored
 # TODO: read from config
 CACHE_LOCATION = "~/.flyte/local-cache"
 
 
-def _recursive_hash_placement(literal: Literal) -> Literal:
-    # Base case, hash gets passed through always if set
-    if literal.hash is not None:
-        return Literal(hash=literal.hash)
-    elif literal.collection is not None:
-        literals = [_recursive_hash_placement(lit) for lit in literal.collection.literals]
-        return Literal(collection=LiteralCollection(literals=literals))
-    elif literal.map is not None:
-        literal_map = {}
-        for key, literal_value in literal.map.literals.items():
-            literal_map[key] = _recursive_hash_placement(literal_value)
-        return Literal(map=LiteralMap(literal_map))
+def _update_hash(h: hashlib.blake2b, tag: bytes, data: bytes):
+    # Every chunk is tagged and length-prefixed, so that no two different literals can feed the same bytes.
+    h.update(tag)
+    h.update(len(data).to_bytes(8, "little"))
+    h.update(data)
+
+
+def _only_scalars(literals: typing.Iterable[literals_pb2.Literal]) -> bool:
+    return all(not lit.hash and lit.WhichOneof("value") == "scalar" for lit in literals)
+
+
+def _hash_literal(h: hashlib.blake2b, literal: literals_pb2.Literal):
+    """
+    Feeds a literal to ``h``. If a literal has a hash set, only that hash is used, at any level of nesting. Collections
+    and maps are walked, everything else is fed as its deterministic serialization.
+    """
+    if literal.hash:
+        _update_hash(h, b"h", literal.hash.encode("utf-8"))
+        return
+    value = literal.WhichOneof("value")
+    if value == "collection":
+        literals = literal.collection.literals
+        if _only_scalars(literals):
+            # Nothing to substitute in a collection of scalars, so it is fed in one go.
+            _update_hash(h, b"C", literal.collection.SerializeToString(deterministic=True))
+            return
+        _update_hash(h, b"c", len(literals).to_bytes(8, "little"))
+        for lit in literals:
+            _hash_literal(h, lit)
+    elif value == "map":
+        _hash_literal_map(h, literal.map)
     else:
-        return literal
+        _update_hash(h, b"s", literal.SerializeToString(deterministic=True))
+
+
+def _hash_literal_map(h: hashlib.blake2b, literal_map: literals_pb2.LiteralMap):
+    if _only_scalars(literal_map.literals.values()):
+        # Deterministic serialization orders the entries by key.
+        _update_hash(h, b"M", literal_map.SerializeToString(deterministic=True))
+        return
+    _update_hash(h, b"m", len(literal_map.literals).to_bytes(8, "little"))
+    for key in sorted(literal_map.literals.keys()):
+        _update_hash(h, b"k", key.encode("utf-8"))
+        _hash_literal(h, literal_map.literals[key])
 
 
 def _calculate_cache_key(task_name: str, cache_version: str, input_literal_map: LiteralMap) -> str:
-    # Traverse the literals and replace the literal with a new literal that only contains the hash
-    literal_map_overridden = {}
-    for key, literal in input_literal_map.literals.items():
-        literal_map_overridden[key] = _recursive_hash_placement(literal)
+    # Walk the IDL of the inputs and stream it into the hash. The hash of a literal, when set, stands in for the literal.
+    h = hashlib.blake2b(digest_size=16)
+    _hash_literal_map(h, input_literal_map.to_flyte_idl())
+    return f"{task_name}-{cache_version}-{h.hexdigest()}"
 
-    # Generate a stable representation of the underlying protobuf by passing `deterministic=True` to the
-    # protobuf library.
-    hashed_inputs = LiteralMap(literal_map_overridden).to_flyte_idl().SerializeToString(deterministic=True)
-    # Use joblib to hash the string representation of the literal into a fixed length string
-    return f"{task_name}-{cache_version}-{joblib.hash(hashed_inputs)}"
+
+@dataclass
+class LocalCacheStats(object):
+    """
+    Statistics of the local cache. Hits (from memory or disk), misses and the bytes of the values read and written are
+    counted across all processes using the cache. Every process adds its counts when it exits, or when the stats are
+    read.
+    """
+
+    hits: int
+    misses: int
+    bytes_read: int
+    bytes_written: int
+    entries: int
+    volume: int
+    size_limit: int
+    eviction_policy: str
+
+
+_COUNTERS = ("hits", "misses", "bytes_read", "bytes_written")
 
 
 class LocalTaskCache(object):
     """
-    This class implements a persistent store able to cache the result of local task executions.
+    This class implements a persistent store able to cache the result of local task executions. The most recently used
+    entries are also kept in memory, so that repeated lookups in the same process do not go to disk. Every lookup
+    returns a new LiteralMap, so callers are free to modify it. The size limit, eviction policy and TTLs of the cache
+    are read from :py:class:`flytekit.configuration.LocalConfig`.
     """
 
     _cache: Cache
+    _counters: Cache
     _initialized: bool = False
+    _config: LocalConfig
+    # Entries kept in memory hold the serialized value, which every hit parses into its own LiteralMap.
+    _memory: "OrderedDict[str, Tuple[Optional[float], bytes]]"
+    # Counts of this process that have not been added to the counters on disk yet.
+    _pending_counts: Dict[str, int] = dict.fromkeys(_COUNTERS, 0)
+    _lock = threading.Lock()
 
     @staticmethod
     def initialize():
-        LocalTaskCache._cache = Cache(CACHE_LOCATION)
+        if LocalTaskCache._initialized:
+            LocalTaskCache._flush_counts()
+        local_config = LocalConfig.auto()
+        settings: Dict[str, Any] = {}
+        if local_config.cache_size_limit is not None:
+            settings["size_limit"] = local_config.cache_size_limit
+        if local_config.cache_eviction_policy is not None:
+            if local_config.cache_eviction_policy not in EVICTION_POLICY:
+                raise ValueError(
+                    f"Unknown local cache eviction policy {local_config.cache_eviction_policy}, "
+                    f"expected one of {list(EVICTION_POLICY)}"
+                )
+            settings["eviction_policy"] = local_config.cache_eviction_policy
+        LocalTaskCache._cache = Cache(CACHE_LOCATION, **settings)
+        LocalTaskCache._counters = Cache(os.path.join(CACHE_LOCATION, "counters"))
+        LocalTaskCache._config = local_config
+        LocalTaskCache._memory = OrderedDict()
         LocalTaskCache._initialized = True
 
     @staticmethod
@@ -59,15 +138,108 @@ class LocalTaskCache(object):
         if not LocalTaskCache._initialized:
             LocalTaskCache.initialize()
         LocalTaskCache._cache.clear()
+        with LocalTaskCache._lock:
+            LocalTaskCache._memory.clear()
+
+    @staticmethod
+    def prune() -> int:
+        """
+        Removes the expired entries and evicts entries until the cache fits its size limit. Returns the number of
+        removed entries.
+        """
+        if not LocalTaskCache._initialized:
+            LocalTaskCache.initialize()
+        return LocalTaskCache._cache.expire() + LocalTaskCache._cache.cull()
+
+    @staticmethod
+    def _count(**counts: int):
+        with LocalTaskCache._lock:
+            for name, count in counts.items():
+                LocalTaskCache._pending_counts[name] += count
+
+    @staticmethod
+    def _flush_counts():
+        if not LocalTaskCache._initialized:
+            return
+        with LocalTaskCache._lock:
+            counts = LocalTaskCache._pending_counts
+            LocalTaskCache._pending_counts = dict.fromkeys(_COUNTERS, 0)
+        for name, count in counts.items():
+            if count:
+                LocalTaskCache._counters.incr(name, count)
+
+    @staticmethod
+    def reset_stats():
+        if not LocalTaskCache._initialized:
+            LocalTaskCache.initialize()
+        with LocalTaskCache._lock:
+            LocalTaskCache._pending_counts = dict.fromkeys(_COUNTERS, 0)
+        LocalTaskCache._counters.clear()
+
+    @staticmethod
+    def stats() -> LocalCacheStats:
+        if not LocalTaskCache._initialized:
+            LocalTaskCache.initialize()
+        LocalTaskCache._flush_counts()
+        cache = LocalTaskCache._cache
+        counters = LocalTaskCache._counters
+        return LocalCacheStats(
+            hits=counters.get("hits", 0),
+            misses=counters.get("misses", 0),
+            bytes_read=counters.get("bytes_read", 0),
+            bytes_written=counters.get("bytes_written", 0),
+            entries=len(cache),
+            volume=cache.volume(),
+            size_limit=cache.size_limit,
+            eviction_policy=cache.eviction_policy,
+        )
+
+    @staticmethod
+    def _remember(key: str, value: bytes, expire_time: Optional[float]):
+        with LocalTaskCache._lock:
+            memory = LocalTaskCache._memory
+            memory[key] = (expire_time, value)
+            memory.move_to_end(key)
+            while len(memory) > LocalTaskCache._config.cache_memory_entries:
+                memory.popitem(last=False)
 
     @staticmethod
     def get(task_name: str, cache_version: str, input_literal_map: LiteralMap) -> Optional[LiteralMap]:
         if not LocalTaskCache._initialized:
             LocalTaskCache.initialize()
-        return LocalTaskCache._cache.get(_calculate_cache_key(task_name, cache_version, input_literal_map))
+        key = _calculate_cache_key(task_name, cache_version, input_literal_map)
+        data = None
+        with LocalTaskCache._lock:
+            entry = LocalTaskCache._memory.get(key)
+            if entry is not None:
+                expire_time, data = entry
+                if expire_time is None or expire_time > time.time():
+                    LocalTaskCache._memory.move_to_end(key)
+                else:
+                    del LocalTaskCache._memory[key]
+                    data = None
+        if data is None:
+            value, expire_time = LocalTaskCache._cache.get(key, expire_time=True)
+            if value is None:
+                LocalTaskCache._count(misses=1)
+                return None
+            data = value.to_flyte_idl().SerializeToString()
+            LocalTaskCache._remember(key, data, expire_time)
+            LocalTaskCache._count(hits=1, bytes_read=len(data))
+            return value
+        LocalTaskCache._count(hits=1, bytes_read=len(data))
+        return LiteralMap.from_owned_flyte_idl(literals_pb2.LiteralMap.FromString(data))
 
     @staticmethod
     def set(task_name: str, cache_version: str, input_literal_map: LiteralMap, value: LiteralMap) -> None:
         if not LocalTaskCache._initialized:
             LocalTaskCache.initialize()
-        LocalTaskCache._cache.set(_calculate_cache_key(task_name, cache_version, input_literal_map), value)
+        key = _calculate_cache_key(task_name, cache_version, input_literal_map)
+        ttl = LocalTaskCache._config.cache_task_ttls.get(task_name, LocalTaskCache._config.cache_ttl)
+        data = value.to_flyte_idl().SerializeToString()
+        LocalTaskCache._cache.set(key, value, expire=ttl)
+        LocalTaskCache._remember(key, data, None if ttl is None else time.time() + ttl)
+        LocalTaskCache._count(bytes_written=len(data))
+
+
+atexit.register(LocalTaskCache._flush_counts)
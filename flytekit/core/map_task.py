@@ -8,10 +8,13 @@ import logging
 import math
 import os
 import typing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
-from flytekit.configuration import SerializationSettings
+import cloudpickle
+
+from flytekit.configuration import LocalConfig, SerializationSettings
 from flytekit.core import tracker
 from flytekit.core.base_task import PythonTask, Task, TaskResolverMixin
 from flytekit.core.constants import CONTAINER_ARRAY_TASK
@@ -19,9 +22,11 @@ from flytekit.core.context_manager import ExecutionState, FlyteContext, FlyteCon
 from flytekit.core.interface import transform_interface_to_list_interface
 from flytekit.core.python_function_task import PythonFunctionTask, PythonInstanceTask
 from flytekit.core.tracker import TrackedInstance
+from flytekit.core.type_engine import TypeEngine
 from flytekit.core.utils import timeit
 from flytekit.exceptions import scopes as exception_scopes
 from flytekit.loggers import logger
+from flytekit.models import literals as _literal_models
 from flytekit.models.array_job import ArrayJob
 from flytekit.models.interface import Variable
 from flytekit.models.task import Container, K8sPod, Sql
@@ -99,6 +104,7 @@ class MapPythonTask(PythonTask):
         self._cmd_prefix: typing.Optional[typing.List[str]] = None
         self._max_concurrency: typing.Optional[int] = concurrency
         self._min_success_ratio: typing.Optional[float] = min_success_ratio
+        self._local_config: typing.Optional[LocalConfig] = None
         self._array_task_interface = actual_task.python_interface
         if "metadata" not in kwargs and actual_task.metadata:
             kwargs["metadata"] = actual_task.metadata
@@ -243,18 +249,32 @@ class MapPythonTask(PythonTask):
         """
         This is called during ExecutionState.Mode.TASK_EXECUTION executions, that is executions orchestrated by the
         Flyte platform. Individual instances of the map task, aka array task jobs are passed the full set of inputs but
-        only produce a single output based on the map task (array task) instance. The array plugin handler will actually
-        create a collection from these individual outputs as the final map task output value.
+        only produce a single output based on the map task (array task) instance. The inputs have already been reduced
+        to the elements at the index of this instance by ``_literal_map_to_python_input``. The array plugin handler will
+        actually create a collection from these individual outputs as the final map task output value.
+        """
+        return exception_scopes.user_entry_point(self._run_task.execute)(**kwargs)
+
+    def _literal_map_to_python_input(
+        self, literal_map: _literal_models.LiteralMap, ctx: FlyteContext
+    ) -> Dict[str, Any]:
         """
+        When executed by the Flyte platform, every instance of the map task only uses the element of the mapped inputs
+        at its own index. Only that element is converted, instead of the full input collections.
+        """
+        if ctx.execution_state is None or ctx.execution_state.mode != ExecutionState.Mode.TASK_EXECUTION:
+            return super()._literal_map_to_python_input(literal_map, ctx)
+
         task_index = self._compute_array_job_index()
-        map_task_inputs = {}
-        for k in self.interface.inputs.keys():
-            v = kwargs[k]
-            if isinstance(v, list) and k not in self.bound_inputs:
-                map_task_inputs[k] = v[task_index]
+        literals = {}
+        for k, v in literal_map.literals.items():
+            if k not in self.bound_inputs and v.collection is not None:
+                literals[k] = v.collection.get_literal(task_index)
             else:
-                map_task_inputs[k] = v
-        return exception_scopes.user_entry_point(self._run_task.execute)(**map_task_inputs)
+                literals[k] = v
+        return TypeEngine.literal_map_to_kwargs(
+            ctx, _literal_models.LiteralMap(literals=literals), self._run_task.python_interface.inputs
+        )
 
     def _raw_execute(self, **kwargs) -> Any:
         """
@@ -264,7 +284,6 @@ class MapPythonTask(PythonTask):
         outputs_expected = True
         if not self.interface.outputs:
             outputs_expected = False
-        outputs = []
 
         mapped_tasks_count = 0
         if self._run_task.interface.inputs.items():
@@ -274,11 +293,11 @@ class MapPythonTask(PythonTask):
                     mapped_tasks_count = len(v)
                     break
 
-        failed_count = 0
         min_successes = mapped_tasks_count
         if self._min_success_ratio:
             min_successes = math.ceil(min_successes * self._min_success_ratio)
 
+        instances = []
         for i in range(mapped_tasks_count):
             single_instance_inputs = {}
             for k in self.interface.inputs.keys():
@@ -287,18 +306,128 @@ class MapPythonTask(PythonTask):
                     single_instance_inputs[k] = kwargs[k][i]
                 else:
                     single_instance_inputs[k] = kwargs[k]
+            instances.append(single_instance_inputs)
+
+        return run_local_map_instances(
+            self._run_task.execute,
+            instances,
+            min_successes,
+            outputs_expected,
+            self._get_local_config(),
+            self._max_concurrency,
+        )
+
+    def _get_local_config(self) -> LocalConfig:
+        # Only read on the first local execution of this task, instead of for every call.
+        if self._local_config is None:
+            self._local_config = LocalConfig.auto()
+        return self._local_config
+
+
+def _run_pickled(payload: bytes) -> Any:
+    # Runs in a worker process. Tasks defined with the @task decorator shadow their function in its module, so they
+    # (and the function itself) can only be shipped with cloudpickle.
+    fn, kwargs = cloudpickle.loads(payload)
+    try:
+        return fn(**kwargs)
+    except exception_scopes.FlyteScopedException as exc:
+        # Scoped exceptions hold a traceback, which cannot be pickled back to the parent. Only the original error is
+        # sent back, and the parent scopes it as a user error again.
+        raise exc.value from None
+
+
+def _get_pickled_result(fn: Callable, future: Future) -> Any:
+    def result():
+        return future.result()
+
+    result.__name__ = getattr(fn, "__name__", result.__name__)
+    return exception_scopes.user_entry_point(result)()
+
+
+def _get_local_map_executor(
+    n_instances: int, local_config: LocalConfig, max_concurrency: Optional[int]
+) -> Optional[Executor]:
+    """
+    Returns the executor the instances of a map task should be run on during local executions, as configured by
+    ``local_config``, or None if they should be run serially in the calling thread.
+    """
+    max_workers = n_instances
+    for limit in (max_concurrency, local_config.map_max_workers):
+        if limit:
+            max_workers = min(max_workers, limit)
+    if local_config.map_executor == "serial" or max_workers <= 1:
+        return None
+    if local_config.map_executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flytekit-map")
+    if local_config.map_executor == "process":
+        return ProcessPoolExecutor(max_workers=min(max_workers, os.cpu_count() or 1))
+    raise ValueError(
+        f"Unknown local map executor {local_config.map_executor}, expected one of 'serial', 'thread' or 'process'"
+    )
+
+
+def _submit_local_map_instance(executor: Optional[Executor], fn: Callable, kwargs: Dict[str, Any]) -> Future:
+    if isinstance(executor, ProcessPoolExecutor):
+        return executor.submit(_run_pickled, cloudpickle.dumps((fn, kwargs)))
+    if executor is not None:
+        return FlyteContextManager.submit(executor, exception_scopes.user_entry_point(fn), **kwargs)
+    future: Future = Future()
+    try:
+        future.set_result(exception_scopes.user_entry_point(fn)(**kwargs))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def run_local_map_instances(
+    fn: Callable,
+    instances: List[Dict[str, Any]],
+    min_successes: int,
+    outputs_expected: bool,
+    local_config: LocalConfig,
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """
+    Runs ``fn`` once for every set of inputs in ``instances`` and returns the outputs in the order of ``instances``.
+    The instances are run one after the other, unless the map executor of ``local_config`` is ``thread`` or
+    ``process`` to run them in parallel on a pool, with at most ``max_concurrency`` instances in flight when it is set.
+    Failed instances produce a None output, and the error of the failure that makes reaching ``min_successes``
+    impossible is raised, the same as a serial run.
+    """
+    executor = _get_local_map_executor(len(instances), local_config, max_concurrency)
+    futures: List[Future] = []
+    pending: Iterator[Future]
+    outputs = []
+    failed_count = 0
+    try:
+        if executor is None:
+            # Serially, each instance is run and checked before the next one is started, so a failure that cannot be
+            # tolerated stops the run right there.
+            pending = (_submit_local_map_instance(None, fn, kwargs) for kwargs in instances)
+        else:
+            futures = [_submit_local_map_instance(executor, fn, kwargs) for kwargs in instances]
+            pending = iter(futures)
+        for future in pending:
             try:
-                o = exception_scopes.user_entry_point(self._run_task.execute)(**single_instance_inputs)
+                if isinstance(executor, ProcessPoolExecutor):
+                    o = _get_pickled_result(fn, future)
+                else:
+                    o = future.result()
                 if outputs_expected:
                     outputs.append(o)
             except Exception as exc:
                 outputs.append(None)
                 failed_count += 1
-                if mapped_tasks_count - failed_count < min_successes:
+                if len(instances) - failed_count < min_successes:
                     logger.error("The number of successful tasks is lower than the minimum ratio")
                     raise exc
+    finally:
+        if executor is not None:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
 
-        return outputs
+    return outputs
 
 
 def map_task(
@@ -347,7 +476,9 @@ def map_task(
     :param task_function: This argument is implicitly passed and represents the repeatable function
     :param concurrency: If specified, this limits the number of mapped tasks than can run in parallel to the given batch
         size. If the size of the input exceeds the concurrency value, then multiple batches will be run serially until
-        all inputs are processed. If left unspecified, this means unbounded concurrency.
+        all inputs are processed. If left unspecified, this means unbounded concurrency. Local executions run the
+        mapped tasks serially, unless a thread or process pool is enabled with
+        :py:class:`flytekit.configuration.LocalConfig`, which is bounded the same way.
     :param min_success_ratio: If specified, this determines the minimum fraction of total jobs which can complete
         successfully before terminating this task and marking it successful.
 
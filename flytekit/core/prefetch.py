@@ -0,0 +1,114 @@
+"""
+Background downloads of task inputs.
+
+Remote ``FlyteFile`` and ``FlyteDirectory`` inputs are downloaded lazily, the first time the task accesses them. When
+prefetching is enabled for a task (``@task(prefetch_inputs=True)``) or for a single input
+(``Annotated[FlyteFile, Prefetch()]``), all of those downloads are started concurrently before the user code runs.
+Accessing an input still blocks, but only until that one input is available.
+"""
+
+import typing
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+
+from typing_extensions import get_args
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.data_persistence import submit_transfer
+from flytekit.core.type_engine import is_annotated
+from flytekit.loggers import logger
+
+
+class Prefetch(object):
+    """
+    Marks a task input to be downloaded in the background as soon as the task starts, even if the task does not
+    prefetch all of its inputs.
+
+    .. code-block:: python
+
+        @task
+        def t1(model: Annotated[FlyteFile, Prefetch()], data: FlyteDirectory):
+            ...
+    """
+
+
+def _is_prefetched(python_type: typing.Optional[typing.Type]) -> bool:
+    return (
+        python_type is not None
+        and is_annotated(python_type)
+        and any(isinstance(a, Prefetch) for a in get_args(python_type)[1:])
+    )
+
+
+def collect_downloadable(value: typing.Any) -> list:
+    """
+    Returns the remote ``FlyteFile`` and ``FlyteDirectory`` values in ``value``, also inside lists and dicts, that have
+    not been downloaded yet.
+    """
+    out: list = []
+    _collect_downloadable(value, out)
+    return out
+
+
+def _collect_downloadable(value: typing.Any, out: list):
+    from flytekit.types.directory import FlyteDirectory
+    from flytekit.types.file import FlyteFile
+
+    if isinstance(value, (FlyteFile, FlyteDirectory)):
+        # Only inputs that were converted from a remote literal have something to download.
+        if value.remote_source is not None and not value.downloaded:
+            out.append(value)
+    elif isinstance(value, list):
+        for v in value:
+            _collect_downloadable(v, out)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _collect_downloadable(v, out)
+
+
+def _prefetch(workers: int, value: typing.Any) -> Future:
+    download = value._downloader
+    future = submit_transfer(workers, download)
+
+    def _wait():
+        # A download that has not started yet is run right away on the calling thread, instead of waiting for the
+        # ones queued before it. This is also the case once the prefetching has been shut down.
+        if future.cancel():
+            return download()
+        return future.result()
+
+    value._downloader = _wait
+    return future
+
+
+@contextmanager
+def prefetch_inputs(
+    ctx: FlyteContext,
+    native_inputs: typing.Dict[str, typing.Any],
+    input_types: typing.Dict[str, typing.Type],
+    prefetch_all: bool = False,
+) -> typing.Generator[None, None, None]:
+    """
+    Starts downloading the remote files and directories among ``native_inputs`` in the background, for all inputs if
+    ``prefetch_all`` is set, otherwise only for the inputs annotated with :py:class:`Prefetch`. Downloads that have
+    not started when the context exits are cancelled, they happen lazily on first access again.
+    """
+    values: list = []
+    for k, v in native_inputs.items():
+        if prefetch_all or _is_prefetched(input_types.get(k)):
+            _collect_downloadable(v, values)
+    if not values:
+        yield
+        return
+
+    workers = ctx.file_access.data_config.transfer_concurrency
+    logger.info(f"Prefetching {len(values)} inputs on the transfer pool of {workers} workers")
+    futures = []
+    try:
+        for v in values:
+            futures.append(_prefetch(workers, v))
+        yield
+    finally:
+        for f in futures:
+            f.cancel()
+        wait(futures)
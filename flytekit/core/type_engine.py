@@ -29,7 +29,8 @@ from typing_extensions import Annotated, get_args, get_origin
 
 from flytekit.core.annotation import FlyteAnnotation
 from flytekit.core.context_manager import FlyteContext
-from flytekit.core.hash import HashMethod
+from flytekit.core.data_persistence import map_transfers
+from flytekit.core.hash import ContentAddressed, HashMethod
 from flytekit.core.type_helpers import load_type_from_tag
 from flytekit.core.utils import timeit
 from flytekit.exceptions import user as user_exceptions
@@ -91,6 +92,14 @@ def get_batch_size(t: Type) -> Optional[int]:
     return None
 
 
+def get_content_addressed(t: Type) -> Optional[ContentAddressed]:
+    if is_annotated(t):
+        for annotation in get_args(t)[1:]:
+            if isinstance(annotation, ContentAddressed):
+                return annotation
+    return None
+
+
 def modify_literal_uris(lit: Literal):
     """
     Modifies the literal object recursively to replace the URIs with the native paths in case they are of
@@ -99,8 +108,10 @@ def modify_literal_uris(lit: Literal):
     from flytekit.remote.remote_fs import FlytePathResolver
 
     if lit.collection:
-        for l in lit.collection.literals:
-            modify_literal_uris(l)
+        # Lists of primitives hold no URIs to rewrite, and walking them would build a Literal object per element.
+        if not lit.collection.holds_only_primitives:
+            for l in lit.collection.literals:
+                modify_literal_uris(l)
     elif lit.map:
         for k, v in lit.map.literals.items():
             modify_literal_uris(v)
@@ -119,6 +130,35 @@ def modify_literal_uris(lit: Literal):
             )
 
 
+def is_offloaded_type(lt: Optional[LiteralType]) -> bool:
+    """
+    Returns True if values of the given ``LiteralType`` are (or contain) data that is offloaded to blob storage, i.e.
+    converting them to or from a literal moves data over the network.
+    """
+    if lt is None:
+        return False
+    if lt.blob is not None or lt.structured_dataset_type is not None or lt.schema is not None:
+        return True
+    if lt.collection_type is not None:
+        return is_offloaded_type(lt.collection_type)
+    if lt.map_value_type is not None:
+        return is_offloaded_type(lt.map_value_type)
+    if lt.union_type is not None:
+        return any(is_offloaded_type(v) for v in lt.union_type.variants)
+    return False
+
+
+def map_concurrently(ctx: FlyteContext, fn: typing.Callable[..., T], items: typing.Sequence) -> List[T]:
+    """
+    Calls ``fn(*item)`` for every item on the transfer pool shared by the whole process (see
+    :py:func:`flytekit.core.data_persistence.map_transfers`) and returns the results in the order of ``items``. The
+    pool has ``DataConfig.transfer_concurrency`` threads, which bounds the number of concurrent transfers across all
+    the conversions running at the same time. Nested values (e.g. ``List[List[FlyteFile]]``) are converted serially on
+    the thread that converts their parent.
+    """
+    return map_transfers(ctx.file_access.data_config.transfer_concurrency, fn, items)
+
+
 class TypeTransformerFailedError(TypeError, AssertionError, ValueError):
     ...
 
@@ -333,6 +373,11 @@ class DataclassTransformer(TypeTransformer[object]):
             self._serializable_classes.append(DataClassORJSONMixin)
         except ModuleNotFoundError:
             pass
+        # Per type plans used to fix up the values produced by ``from_json``, see ``_get_value_fixer``.
+        self._value_fixers: typing.Dict[
+            typing.Tuple[Type, bool], Optional[typing.Callable[[typing.Any], typing.Any]]
+        ] = {}
+        self._has_flyte_types: typing.Dict[Type, bool] = {}
 
     def assert_type(self, expected_type: Type[DataClassJsonMixin], v: T):
         # Skip iterating all attributes in the dataclass if the type of v already matches the expected_type
@@ -491,7 +536,8 @@ class DataclassTransformer(TypeTransformer[object]):
                 f"Dataclass {python_type} should be decorated with @dataclass_json or inherit DataClassJSONMixin to be "
                 f"serialized correctly"
             )
-        self._serialize_flyte_type(python_val, python_type)
+        if self._contains_flyte_type(python_type):
+            self._serialize_flyte_type(python_val, python_type)
 
         json_str = python_val.to_json()  # type: ignore
 
@@ -733,6 +779,163 @@ class DataclassTransformer(TypeTransformer[object]):
             dc.__setattr__(f.name, self._fix_val_int(f.type, val))
         return dc
 
+    def _contains_flyte_type(self, python_type: Type, seen: Optional[typing.Set[Type]] = None) -> bool:
+        """
+        Whether a value of this type can hold a flyte type that ``_serialize_flyte_type`` has to convert. Types that
+        cannot are not walked at all.
+        """
+        try:
+            return self._has_flyte_types[python_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # Some types cannot be hashed, e.g. Annotated[StructuredDataset, kwtypes(...)], those are not cached.
+            return self._find_flyte_type(python_type, seen or set())
+
+        has_flyte_type = self._find_flyte_type(python_type, seen or set())
+        self._has_flyte_types[python_type] = has_flyte_type
+        return has_flyte_type
+
+    def _find_flyte_type(self, python_type: Type, seen: typing.Set[Type]) -> bool:
+        from flytekit.types.directory.types import FlyteDirectory
+        from flytekit.types.file import FlyteFile
+        from flytekit.types.schema.types import FlyteSchema
+        from flytekit.types.structured.structured_dataset import StructuredDataset
+
+        # This follows the same structure as _serialize_flyte_type
+        if get_origin(python_type) is typing.Union and type(None) in get_args(python_type):
+            return self._find_flyte_type(get_args(python_type)[0], seen)
+        if hasattr(python_type, "__origin__") and get_origin(python_type) is list:
+            return self._find_flyte_type(get_args(python_type)[0], seen)
+        if hasattr(python_type, "__origin__") and get_origin(python_type) is dict:
+            return self._find_flyte_type(get_args(python_type)[1], seen)
+        if not dataclasses.is_dataclass(python_type):
+            return False
+        if inspect.isclass(python_type) and issubclass(
+            python_type, (FlyteSchema, FlyteFile, FlyteDirectory, StructuredDataset)
+        ):
+            return True
+        if python_type in seen:
+            # Recursive dataclasses, the other fields decide.
+            return False
+        seen.add(python_type)
+        return any(self._contains_flyte_type(f.type, seen) for f in dataclasses.fields(python_type))
+
+    def _get_value_fixer(
+        self,
+        python_type: Type,
+        fix_sd: bool = True,
+        building: Optional[typing.Dict[typing.Tuple[Type, bool], typing.Any]] = None,
+    ) -> Optional[typing.Callable[[typing.Any], typing.Any]]:
+        """
+        Returns a function that fixes up a value of the given type, as produced by ``from_json``, or None if there is
+        nothing to fix. This does the same as ``_fix_structured_dataset_type``, ``_deserialize_flyte_type`` and
+        ``_fix_dataclass_int`` in a single pass, and skips the parts of the value that need no changes. The plan is
+        computed once per type.
+
+        ``fix_sd`` is false below Optional types, which ``_fix_structured_dataset_type`` does not look into.
+        """
+        key = (python_type, fix_sd)
+        try:
+            return self._value_fixers[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._build_value_fixer(python_type, fix_sd, building if building is not None else {})
+
+        if building is not None:
+            if key not in building:
+                building[key] = self._build_value_fixer(python_type, fix_sd, building)
+            return building[key]
+
+        # Nested plans are only published once the whole plan is complete, so that other threads never see a
+        # partially built one.
+        building = {}
+        fixer = self._build_value_fixer(python_type, fix_sd, building)
+        building[key] = fixer
+        self._value_fixers.update(building)
+        return fixer
+
+    def _build_value_fixer(
+        self, python_type: Type, fix_sd: bool, building: typing.Dict[typing.Tuple[Type, bool], typing.Any]
+    ) -> Optional[typing.Callable[[typing.Any], typing.Any]]:
+        from flytekit.types.directory.types import FlyteDirectory
+        from flytekit.types.file import FlyteFile
+        from flytekit.types.schema.types import FlyteSchema
+        from flytekit.types.structured.structured_dataset import StructuredDataset
+
+        origin = get_origin(python_type)
+        args = get_args(python_type)
+
+        if origin is typing.Union and type(None) in args:
+            sub_fixer = self._get_value_fixer(args[0], False, building)
+            if sub_fixer is None:
+                return None
+            fix_sub: typing.Callable[[typing.Any], typing.Any] = sub_fixer
+            return lambda v: None if v is None else fix_sub(v)
+
+        if python_type is int:
+            return lambda v: None if v is None else int(v)
+
+        if python_type in (str, float, bool):
+            return None
+
+        if origin is list and len(args) == 1:
+            element_fixer = self._get_value_fixer(args[0], fix_sd, building)
+            if element_fixer is None:
+                return None
+            fix_element: typing.Callable[[typing.Any], typing.Any] = element_fixer
+            return lambda v: [fix_element(x) for x in v]
+
+        if origin is dict and len(args) == 2:
+            ktype, vtype = args
+            value_fixer = self._get_value_fixer(vtype, fix_sd, building)
+            if ktype is str:
+                if value_fixer is None:
+                    return None
+                fix_str_value: typing.Callable[[typing.Any], typing.Any] = value_fixer
+                return lambda v: {k: fix_str_value(x) for k, x in v.items()}
+
+            def fix_key(k: typing.Any) -> typing.Any:
+                return self._fix_val_int(ktype, self._fix_structured_dataset_type(ktype, k) if fix_sd else k)
+
+            if value_fixer is None:
+                return lambda v: {fix_key(k): x for k, x in v.items()}
+            fix_map_value: typing.Callable[[typing.Any], typing.Any] = value_fixer
+            return lambda v: {fix_key(k): fix_map_value(x) for k, x in v.items()}
+
+        if (
+            dataclasses.is_dataclass(python_type)
+            and inspect.isclass(python_type)
+            and not issubclass(python_type, (FlyteSchema, FlyteFile, FlyteDirectory, StructuredDataset))
+        ):
+            plan: typing.List[typing.Tuple[str, typing.Callable[[typing.Any], typing.Any]]] = []
+
+            def fix_dataclass(v: typing.Any) -> typing.Any:
+                for name, field_fixer in plan:
+                    setattr(v, name, field_fixer(getattr(v, name)))
+                return v
+
+            # Registered before the fields are looked at, for dataclasses that refer to themselves.
+            building[(python_type, fix_sd)] = fix_dataclass
+            for f in dataclasses.fields(python_type):
+                field_fixer = self._get_value_fixer(f.type, fix_sd, building)
+                if field_fixer is not None:
+                    plan.append((f.name, field_fixer))
+            return fix_dataclass if plan else None
+
+        if inspect.isclass(python_type) and not dataclasses.is_dataclass(python_type):
+            if not issubclass(python_type, (int, list, dict)) and python_type is not object:
+                return None
+
+        # Flyte types and anything else that is not understood above go through the generic code.
+        def fix_value(v: typing.Any) -> typing.Any:
+            if fix_sd:
+                v = self._fix_structured_dataset_type(python_type, v)
+            return self._fix_val_int(python_type, self._deserialize_flyte_type(v, python_type))
+
+        return fix_value
+
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
         if not dataclasses.is_dataclass(expected_python_type):
             raise TypeTransformerFailedError(
@@ -747,8 +950,8 @@ class DataclassTransformer(TypeTransformer[object]):
         json_str = _json_format.MessageToJson(lv.scalar.generic)
         dc = expected_python_type.from_json(json_str)  # type: ignore
 
-        dc = self._fix_structured_dataset_type(expected_python_type, dc)
-        return self._fix_dataclass_int(expected_python_type, self._deserialize_flyte_type(dc, expected_python_type))
+        fixer = self._get_value_fixer(expected_python_type)
+        return fixer(dc) if fixer is not None else dc
 
     # This ensures that calls with the same literal type returns the same dataclass. For example, `pyflyte run``
     # command needs to call guess_python_type to get the TypeEngine-derived dataclass. Without caching here, separate
@@ -898,6 +1101,10 @@ class TypeEngine(typing.Generic[T]):
     _RESTRICTED_TYPES: typing.List[type] = []
     _DATACLASS_TRANSFORMER: TypeTransformer = DataclassTransformer()  # type: ignore
     _ENUM_TRANSFORMER: TypeTransformer = EnumTransformer()  # type: ignore
+    # Memoizes the result of get_transformer for hashable python types. Invalidated whenever the registry changes.
+    _TRANSFORMER_CACHE: typing.Dict[Type, TypeTransformer[T]] = {}
+    # Some types are created on the fly (e.g. FlyteFile["csv"]), keep the cache from growing without bounds.
+    _TRANSFORMER_CACHE_MAX_SIZE = 4096
     has_lazy_import = False
 
     @classmethod
@@ -918,6 +1125,7 @@ class TypeEngine(typing.Generic[T]):
                     f" Cannot override with {transformer.name}"
                 )
             cls._REGISTRY[t] = transformer
+        cls._TRANSFORMER_CACHE.clear()
 
     @classmethod
     def register_restricted_type(
@@ -932,6 +1140,7 @@ class TypeEngine(typing.Generic[T]):
     def register_additional_type(cls, transformer: TypeTransformer, additional_type: Type, override=False):
         if additional_type not in cls._REGISTRY or override:
             cls._REGISTRY[additional_type] = transformer
+            cls._TRANSFORMER_CACHE.clear()
 
     @classmethod
     def get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
@@ -961,8 +1170,28 @@ class TypeEngine(typing.Generic[T]):
 
         Step 5:
             if v is of type data class, use the dataclass transformer
+
+        The result is memoized per python type, so repeated lookups (e.g. once per element of a large list) only pay
+        for a dictionary access. Types that are not hashable (e.g. annotated with a dict of columns) are resolved
+        every time.
         """
         cls.lazy_import_transformers()
+        try:
+            return cls._TRANSFORMER_CACHE[python_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # The type is not hashable, it cannot be memoized.
+            return cls._get_transformer(python_type)
+
+        transformer = cls._get_transformer(python_type)
+        if len(cls._TRANSFORMER_CACHE) >= cls._TRANSFORMER_CACHE_MAX_SIZE:
+            cls._TRANSFORMER_CACHE.clear()
+        cls._TRANSFORMER_CACHE[python_type] = transformer
+        return transformer
+
+    @classmethod
+    def _get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
         # Step 1
         if is_annotated(python_type):
             args = get_args(python_type)
@@ -1089,6 +1318,21 @@ class TypeEngine(typing.Generic[T]):
         """
         Converts a python value of a given type and expected ``LiteralType`` into a resolved ``Literal`` value.
         """
+        return cls._to_literal(ctx, python_val, python_type, expected)
+
+    @classmethod
+    def _to_literal(
+        cls,
+        ctx: FlyteContext,
+        python_val: typing.Any,
+        python_type: Type,
+        expected: LiteralType,
+        transformer: Optional[TypeTransformer] = None,
+    ) -> Literal:
+        """
+        Same as ``to_literal``, but accepts an already resolved transformer for ``python_type``. This is used by the
+        collection transformers to look up the transformer of their sub-type once instead of once per element.
+        """
         from flytekit.core.promise import Promise, VoidPromise
 
         if isinstance(python_val, Promise):
@@ -1107,7 +1351,8 @@ class TypeEngine(typing.Generic[T]):
             )
         if python_val is None and expected and expected.union_type is None:
             raise TypeTransformerFailedError(f"Python value cannot be None, expected {python_type}/{expected}")
-        transformer = cls.get_transformer(python_type)
+        if transformer is None:
+            transformer = cls.get_transformer(python_type)
         if transformer.type_assertions_enabled:
             transformer.assert_type(python_type, python_val)
 
@@ -1280,9 +1525,37 @@ class ListTransformer(TypeTransformer[T]):
     Transformer that handles a univariate typing.List[T]
     """
 
+    # Lists of these types are converted in bulk, straight from and to the IDL message, without going through the
+    # TypeEngine for every element.
+    _PRIMITIVE_FIELDS: typing.Dict[type, str] = {
+        int: "integer",
+        float: "float_value",
+        str: "string_value",
+        bool: "boolean",
+    }
+
     def __init__(self):
         super().__init__("Typed List", list)
 
+    @classmethod
+    def get_primitive_field(cls, t: Type) -> Optional[str]:
+        """
+        Returns the name of the Primitive field that holds the elements of a List[t], if t is a primitive type that
+        can be converted in bulk.
+        """
+        for primitive_type, field in cls._PRIMITIVE_FIELDS.items():
+            if t is primitive_type:
+                return field
+        return None
+
+    @staticmethod
+    def _primitives_to_literal(python_val: list, field: str) -> Literal:
+        idl = literals_pb2.LiteralCollection()
+        add = idl.literals.add
+        for x in python_val:
+            setattr(add().scalar.primitive, field, x)
+        return Literal(collection=LiteralCollection.from_owned_flyte_idl(idl))
+
     @staticmethod
     def get_sub_type(t: Type[T]) -> Type[T]:
         """
@@ -1350,18 +1623,40 @@ class ListTransformer(TypeTransformer[T]):
                         batch_size = annotation.val
                         break
             if batch_size > 0:
-                lit_list = [
-                    TypeEngine.to_literal(ctx, python_val[i : i + batch_size], FlytePickle, expected.collection_type)
-                    for i in range(0, len(python_val), batch_size)
-                ]  # type: ignore
+                # Every batch is uploaded as its own pickle file.
+                lit_list = map_concurrently(
+                    ctx,
+                    TypeEngine.to_literal,
+                    [
+                        (ctx, python_val[i : i + batch_size], FlytePickle, expected.collection_type)
+                        for i in range(0, len(python_val), batch_size)
+                    ],
+                )
             else:
                 lit_list = []
         else:
             t = self.get_sub_type(python_type)
-            lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]  # type: ignore
+            field = self.get_primitive_field(t)
+            if field is not None and all(type(x) is t for x in python_val):
+                return self._primitives_to_literal(python_val, field)
+            transformer: TypeTransformer = TypeEngine.get_transformer(t)
+            items = [(ctx, x, t, expected.collection_type, transformer) for x in python_val]
+            if is_offloaded_type(expected.collection_type):
+                lit_list = map_concurrently(ctx, TypeEngine._to_literal, items)
+            else:
+                lit_list = [TypeEngine._to_literal(*item) for item in items]  # type: ignore
         return Literal(collection=LiteralCollection(literals=lit_list))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> typing.List[typing.Any]:  # type: ignore
+        collection = getattr(lv, "collection", None)
+        if collection is not None and not collection.is_materialized:
+            sub_type = self.get_sub_type_or_none(expected_python_type)
+            field = self.get_primitive_field(sub_type) if sub_type is not None else None
+            if field is not None:
+                # Anything else, e.g. integers in a List[float], is left to the element transformer to convert or reject
+                values = collection.get_primitive_values(field)
+                if values is not None:
+                    return values
         try:
             lits = lv.collection.literals
         except AttributeError:
@@ -1382,7 +1677,8 @@ class ListTransformer(TypeTransformer[T]):
             return batch_list
         else:
             st = self.get_sub_type(expected_python_type)
-            return [TypeEngine.to_python_value(ctx, x, st) for x in lits]
+            transformer: TypeTransformer = TypeEngine.get_transformer(st)
+            return [transformer.to_python_value(ctx, x, st) for x in lits]
 
     def guess_python_type(self, literal_type: LiteralType) -> list:  # type: ignore
         if literal_type.collection_type:
@@ -1667,14 +1963,18 @@ class DictTransformer(TypeTransformer[dict]):
         if expected and expected.simple and expected.simple == SimpleType.STRUCT:
             return self.dict_to_generic_literal(python_val)
 
-        lit_map = {}
-        for k, v in python_val.items():
+        _, v_type = self.get_dict_types(python_type)
+        transformer: TypeTransformer = TypeEngine.get_transformer(cast(type, v_type))
+        for k in python_val:
             if type(k) != str:
                 raise ValueError("Flyte MapType expects all keys to be strings")
-            # TODO: log a warning for Annotated objects that contain HashMethod
-            k_type, v_type = self.get_dict_types(python_type)
-            lit_map[k] = TypeEngine.to_literal(ctx, v, cast(type, v_type), expected.map_value_type)
-        return Literal(map=LiteralMap(literals=lit_map))
+        # TODO: log a warning for Annotated objects that contain HashMethod
+        items = [(ctx, v, cast(type, v_type), expected.map_value_type, transformer) for v in python_val.values()]
+        if is_offloaded_type(expected.map_value_type):
+            lits = map_concurrently(ctx, TypeEngine._to_literal, items)
+        else:
+            lits = [TypeEngine._to_literal(*item) for item in items]
+        return Literal(map=LiteralMap(literals=dict(zip(python_val.keys(), lits))))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[dict]) -> dict:
         if lv and lv.map and lv.map.literals is not None:
@@ -1688,8 +1988,9 @@ class DictTransformer(TypeTransformer[dict]):
             if tp[0] != str:
                 raise TypeError("TypeMismatch. Destination dictionary does not accept 'str' key")
             py_map = {}
+            transformer: TypeTransformer = TypeEngine.get_transformer(cast(Type, tp[1]))
             for k, v in lv.map.literals.items():
-                py_map[k] = TypeEngine.to_python_value(ctx, v, cast(Type, tp[1]))
+                py_map[k] = transformer.to_python_value(ctx, v, cast(Type, tp[1]))
             return py_map
 
         # for empty generic we have to explicitly test for lv.scalar.generic is not None as empty dict
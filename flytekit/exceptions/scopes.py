@@ -1,3 +1,5 @@
+import typing
+from contextvars import ContextVar
 from functools import wraps as _wraps
 from sys import exc_info as _exc_info
 from traceback import format_tb as _format_tb
@@ -125,12 +127,14 @@ _NULL_CONTEXT = 0
 _USER_CONTEXT = 1
 _SYSTEM_CONTEXT = 2
 
-# Keep the stack with a null-context so we never have to range check when peeking back.
-_CONTEXT_STACK = [_NULL_CONTEXT]
+# Keep the stack with a null-context so we never have to range check when peeking back. The stack is an immutable tuple
+# held in a ContextVar so that code running in worker threads (e.g. locally executed map tasks) that starts from a copy
+# of the caller's context sees the caller's scopes, without racing on a shared list.
+_CONTEXT_STACK: ContextVar[typing.Tuple[int, ...]] = ContextVar("exception_scopes", default=(_NULL_CONTEXT,))
 
 
 def _is_base_context():
-    return _CONTEXT_STACK[-2] == _NULL_CONTEXT
+    return _CONTEXT_STACK.get()[-2] == _NULL_CONTEXT
 
 
 def _decorator(outer_f):
@@ -163,8 +167,8 @@ def system_entry_point(wrapped, args, kwargs):
     user -- allowing them to know if they should take action themselves or pass on to the platform owners.
     We will dispatch metrics and such appropriately.
     """
+    token = _CONTEXT_STACK.set(_CONTEXT_STACK.get() + (_SYSTEM_CONTEXT,))
     try:
-        _CONTEXT_STACK.append(_SYSTEM_CONTEXT)
         if _is_base_context():
             # If this is the first time either of this decorator, or the one below is called, then we unwrap the
             # exception. The first time these decorators are used is currently in the entrypoint.py file. The scoped
@@ -187,7 +191,7 @@ def system_entry_point(wrapped, args, kwargs):
                 # System error, raise full stack-trace all the way up the chain.
                 raise FlyteScopedSystemException(*_exc_info(), kind=_error_model.ContainerError.Kind.RECOVERABLE)
     finally:
-        _CONTEXT_STACK.pop()
+        _CONTEXT_STACK.reset(token)
 
 
 @_decorator
@@ -203,8 +207,8 @@ def user_entry_point(wrapped, args, kwargs):
     we create here will only be handled within our system code so we don't need to worry about leaking weird exceptions
     to the user.
     """
+    token = _CONTEXT_STACK.set(_CONTEXT_STACK.get() + (_USER_CONTEXT,))
     try:
-        _CONTEXT_STACK.append(_USER_CONTEXT)
         if _is_base_context():
             # See comment at this location for system_entry_point
             fn_name = wrapped.__name__
@@ -229,4 +233,4 @@ def user_entry_point(wrapped, args, kwargs):
                 # This will also catch FlyteUserException re-raised by the system_entry_point handler
                 raise FlyteScopedUserException(*_exc_info())
     finally:
-        _CONTEXT_STACK.pop()
+        _CONTEXT_STACK.reset(token)
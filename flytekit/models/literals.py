@@ -647,18 +647,68 @@ class LiteralCollection(_common.FlyteIdlEntity):
         :param list[Literal] literals: underlying list of literals in this collection.
         """
         self._literals = literals
+        self._idl: Optional[_literals_pb2.LiteralCollection] = None
 
     @property
     def literals(self):
         """
         :rtype: list[Literal]
         """
+        if self._literals is None:
+            self._literals = [Literal.from_flyte_idl(l) for l in self._idl.literals]
+            self._idl = None
         return self._literals
 
+    @property
+    def is_materialized(self) -> bool:
+        """
+        A collection created from its IDL representation only builds the Literal objects of its elements the first
+        time ``literals`` is accessed. Until then this is False, and ``to_flyte_idl`` returns a copy of the message.
+        """
+        return self._literals is not None
+
+    @property
+    def holds_only_primitives(self) -> bool:
+        """
+        Whether every element of the collection is a primitive scalar. This is checked on the IDL message while the
+        collection is not materialized, without building the Literal objects of its elements.
+        """
+        if self._literals is None:
+            return all(l.HasField("scalar") and l.scalar.HasField("primitive") for l in self._idl.literals)
+        return all(l.scalar is not None and l.scalar.primitive is not None for l in self._literals)
+
+    def get_literal(self, index: int) -> "Literal":
+        """
+        Returns the literal at ``index``, without building the Literal objects of the other elements.
+        """
+        if self._literals is None:
+            return Literal.from_flyte_idl(self._idl.literals[index])
+        return self._literals[index]
+
+    def get_primitive_values(self, field: str) -> Optional[list]:
+        """
+        Returns the ``field`` (e.g. ``integer``) of the Primitive of every element, read from the IDL message without
+        building the Literal objects of the elements. Returns None if the collection is materialized, or if any element
+        holds anything else.
+        """
+        if self._literals is not None:
+            return None
+        values = []
+        for l in self._idl.literals:
+            p = l.scalar.primitive
+            if p.WhichOneof("value") != field:
+                return None
+            values.append(getattr(p, field))
+        return values
+
     def to_flyte_idl(self):
         """
         :rtype: flyteidl.core.literals_pb2.LiteralCollection
         """
+        if self._literals is None:
+            idl = _literals_pb2.LiteralCollection()
+            idl.CopyFrom(self._idl)
+            return idl
         return _literals_pb2.LiteralCollection(literals=[l.to_flyte_idl() for l in self.literals])
 
     @classmethod
@@ -667,7 +717,19 @@ class LiteralCollection(_common.FlyteIdlEntity):
         :param flyteidl.core.literals_pb2.LiteralCollection pb2_object:
         :rtype: LiteralCollection
         """
-        return cls([Literal.from_flyte_idl(l) for l in pb2_object.literals])
+        idl = _literals_pb2.LiteralCollection()
+        idl.CopyFrom(pb2_object)
+        return cls.from_owned_flyte_idl(idl)
+
+    @classmethod
+    def from_owned_flyte_idl(cls, pb2_object: _literals_pb2.LiteralCollection) -> "LiteralCollection":
+        """
+        Same as ``from_flyte_idl``, but keeps ``pb2_object`` itself instead of a copy of it. Only use this for a message
+        that nothing else holds on to or modifies, e.g. one that was just built or parsed.
+        """
+        collection = cls(None)
+        collection._idl = pb2_object
+        return collection
 
 
 class LiteralMap(_common.FlyteIdlEntity):
@@ -676,6 +738,7 @@ class LiteralMap(_common.FlyteIdlEntity):
         :param dict[Text, Literal] literals: A dictionary mapping Text key names to Literal objects.
         """
         self._literals = literals
+        self._idl: Optional[_literals_pb2.LiteralMap] = None
 
     @property
     def literals(self):
@@ -683,12 +746,27 @@ class LiteralMap(_common.FlyteIdlEntity):
         A dictionary mapping Text key names to Literal objects.
         :rtype: dict[Text, Literal]
         """
+        if self._literals is None:
+            self._literals = {k: Literal.from_flyte_idl(v) for k, v in self._idl.literals.items()}
+            self._idl = None
         return self._literals
 
+    @property
+    def is_materialized(self) -> bool:
+        """
+        Same as for the LiteralCollection, a map created from its IDL representation only builds the Literal objects
+        of its values the first time ``literals`` is accessed.
+        """
+        return self._literals is not None
+
     def to_flyte_idl(self):
         """
         :rtype: flyteidl.core.literals_pb2.LiteralMap
         """
+        if self._literals is None:
+            idl = _literals_pb2.LiteralMap()
+            idl.CopyFrom(self._idl)
+            return idl
         return _literals_pb2.LiteralMap(literals={k: v.to_flyte_idl() for k, v in self.literals.items()})
 
     @classmethod
@@ -697,7 +775,18 @@ class LiteralMap(_common.FlyteIdlEntity):
         :param flyteidl.core.literals_pb2.LiteralMap pb2_object:
         :rtype: LiteralMap
         """
-        return cls({k: Literal.from_flyte_idl(v) for k, v in pb2_object.literals.items()})
+        idl = _literals_pb2.LiteralMap()
+        idl.CopyFrom(pb2_object)
+        return cls.from_owned_flyte_idl(idl)
+
+    @classmethod
+    def from_owned_flyte_idl(cls, pb2_object: _literals_pb2.LiteralMap) -> "LiteralMap":
+        """
+        Same as for the LiteralCollection, keeps ``pb2_object`` itself instead of a copy of it.
+        """
+        literal_map = cls(None)
+        literal_map._idl = pb2_object
+        return literal_map
 
 
 class Scalar(_common.FlyteIdlEntity):
@@ -83,6 +83,7 @@ Execution Objects
    ~executions.FlyteWorkflowExecution
    ~executions.FlyteTaskExecution
    ~executions.FlyteNodeExecution
+   ~watcher.ExecutionWatcher
 
 """
 
@@ -97,3 +98,4 @@ from flytekit.remote.entities import (
 )
 from flytekit.remote.executions import FlyteNodeExecution, FlyteTaskExecution, FlyteWorkflowExecution
 from flytekit.remote.remote import FlyteRemote
+from flytekit.remote.watcher import ExecutionWatcher
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import typing
+
+from flytekit.clients.friendly import SynchronousFlyteClient
+from flytekit.loggers import logger
+from flytekit.models import filters
+from flytekit.models.common import FlyteIdlEntity, NamedEntityIdentifier
+from flytekit.models.core.identifier import Identifier, ResourceType
+
+# Where the registration indices are kept, one file per Admin endpoint, project and domain.
+REGISTRATION_INDEX_DIR = os.path.join(os.path.expanduser("~"), ".flyte", "registration-index")
+
+
+class RegistrationIndex(object):
+    """
+    A local record of the entities that were registered to a project and domain, with the digest of the spec they were
+    registered with. An entity whose identifier, version included, and spec match the record was already registered,
+    and does not have to be sent to Admin again.
+
+    The index can be out of date, for example if Admin's database was reset. :py:meth:`verify` drops the entries that
+    Admin does not know about.
+    """
+
+    def __init__(self, path: typing.Optional[str], project: str, domain: str, entries: typing.Dict[str, list]):
+        self._path = path
+        self._project = project
+        self._domain = domain
+        self._entries = entries
+        self._lock = threading.Lock()
+        self._changed = False
+
+    @classmethod
+    def load(cls, endpoint: str, project: str, domain: str) -> "RegistrationIndex":
+        key = hashlib.sha256(f"{endpoint}/{project}/{domain}".encode("utf-8")).hexdigest()
+        path = os.path.join(REGISTRATION_INDEX_DIR, f"{key}.json")
+        entries = {}
+        try:
+            with open(path, "r") as f:
+                index = json.load(f)
+            if index.get("version") == 1:
+                entries = index["entities"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return cls(path, project, domain, entries)
+
+    @staticmethod
+    def digest(ident: Identifier, spec: FlyteIdlEntity) -> str:
+        hasher = hashlib.sha256(ident.to_flyte_idl().SerializeToString(deterministic=True))
+        hasher.update(spec.to_flyte_idl().SerializeToString(deterministic=True))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _key(ident: Identifier) -> str:
+        return f"{ident.resource_type}/{ident.name}"
+
+    def is_registered(self, ident: Identifier, digest: str) -> bool:
+        if ident.project != self._project or ident.domain != self._domain:
+            return False
+        return self._entries.get(self._key(ident)) == [ident.version, digest]
+
+    def record(self, ident: Identifier, digest: str):
+        if ident.project != self._project or ident.domain != self._domain:
+            return
+        with self._lock:
+            self._entries[self._key(ident)] = [ident.version, digest]
+            self._changed = True
+
+    def verify(self, client: SynchronousFlyteClient, version: str):
+        """
+        Drops the entries for the given version that are not registered in Admin, using a single paginated list call
+        per entity type.
+        """
+        list_methods = {
+            ResourceType.TASK: client.list_tasks_paginated,
+            ResourceType.WORKFLOW: client.list_workflows_paginated,
+            ResourceType.LAUNCH_PLAN: client.list_launch_plans_paginated,
+        }
+        for resource_type, list_method in list_methods.items():
+            prefix = f"{resource_type}/"
+            if not any(k.startswith(prefix) and v[0] == version for k, v in self._entries.items()):
+                continue
+
+            names = set()
+            token = None
+            while True:
+                entities, token = list_method(
+                    NamedEntityIdentifier(self._project, self._domain),
+                    limit=1000,
+                    token=token,
+                    filters=[filters.Equal("version", version)],
+                )
+                names.update(e.id.name for e in entities)
+                if not token:
+                    break
+
+            stale = [
+                k
+                for k, v in self._entries.items()
+                if k.startswith(prefix) and v[0] == version and k[len(prefix) :] not in names
+            ]
+            for k in stale:
+                del self._entries[k]
+            if stale:
+                logger.info(
+                    f"Dropped {len(stale)} entities that are not registered in Admin from the registration index"
+                )
+                self._changed = True
+
+    def save(self):
+        if not self._changed or self._path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self._path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                with self._lock:
+                    json.dump({"version": 1, "entities": self._entries}, f)
+            os.replace(tmp_path, self._path)
+            self._changed = False
+        except OSError as e:
+            logger.debug(f"Failed to write the registration index {self._path}: {e}")
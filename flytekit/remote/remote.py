@@ -12,13 +12,13 @@ import hashlib
 import os
 import pathlib
 import tempfile
-import time
 import typing
 import uuid
 from base64 import b64encode
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import click
 import fsspec
@@ -27,6 +27,7 @@ from flyteidl.admin.signal_pb2 import Signal, SignalListRequest, SignalSetReques
 from flyteidl.core import literals_pb2
 
 from flytekit import ImageSpec
+from flytekit.clients.aio import AsynchronousFlyteClient
 from flytekit.clients.friendly import SynchronousFlyteClient
 from flytekit.clients.helpers import iterate_node_executions, iterate_task_executions
 from flytekit.configuration import Config, FastSerializationSettings, ImageConfig, SerializationSettings
@@ -75,8 +76,10 @@ from flytekit.remote.entities import FlyteLaunchPlan, FlyteNode, FlyteTask, Flyt
 from flytekit.remote.executions import FlyteNodeExecution, FlyteTaskExecution, FlyteWorkflowExecution
 from flytekit.remote.interface import TypedInterface
 from flytekit.remote.lazy_entity import LazyEntity
+from flytekit.remote.registration_index import RegistrationIndex
 from flytekit.remote.remote_callable import RemoteEntity
 from flytekit.remote.remote_fs import get_flyte_fs
+from flytekit.remote.watcher import ExecutionWatcher
 from flytekit.tools.fast_registration import fast_package
 from flytekit.tools.interactive import ipython_check
 from flytekit.tools.script_mode import compress_scripts, hash_file
@@ -98,6 +101,9 @@ ExecutionDataResponse = typing.Union[WorkflowExecutionGetDataResponse, NodeExecu
 
 MOST_RECENT_FIRST = admin_common_models.Sort("created_at", admin_common_models.Sort.Direction.DESCENDING)
 
+# Maximum number of registration requests that are sent to Admin at the same time.
+REGISTRATION_CONCURRENCY = 8
+
 
 class RegistrationSkipped(Exception):
     """
@@ -107,6 +113,60 @@ class RegistrationSkipped(Exception):
     pass
 
 
+def _launch_plan_refs(spec: admin_workflow_models.WorkflowSpec) -> typing.Iterator[str]:
+    """
+    Names of the launch plans that are run by the nodes of the workflow, including nested branches, array nodes and
+    sub-workflows.
+    """
+    nodes = list(spec.template.nodes or [])
+    for sub_workflow in spec.sub_workflows or []:
+        nodes.extend(sub_workflow.nodes or [])
+    while nodes:
+        node = nodes.pop()
+        if node.workflow_node is not None and node.workflow_node.launchplan_ref is not None:
+            yield node.workflow_node.launchplan_ref.name
+        if node.branch_node is not None:
+            if_else = node.branch_node.if_else
+            nodes.append(if_else.case.then_node)
+            nodes.extend(block.then_node for block in if_else.other or [])
+            if if_else.else_node is not None:
+                nodes.append(if_else.else_node)
+        if node.array_node is not None:
+            nodes.append(node.array_node.node)
+
+
+def _entity_name(cp_entity: FlyteControlPlaneEntity) -> str:
+    if isinstance(cp_entity, launch_plan_models.LaunchPlan):
+        return cp_entity.id.name
+    template = getattr(cp_entity, "template", None)
+    return template.id.name if template is not None else str(cp_entity)
+
+
+def _registration_waves(cp_entities: typing.Sequence[FlyteControlPlaneEntity]) -> typing.List[typing.List[int]]:
+    """
+    Groups the entities, which are given in dependency order, into waves of entities that do not depend on each other
+    and can be registered concurrently. Tasks come first, then workflows and then launch plans. A workflow that runs
+    one of the launch plans is registered in a wave after that launch plan, and its own launch plans after that.
+    Returns the indices of the entities in each wave.
+    """
+    levels: typing.Dict[typing.Tuple[int, str], int] = {}
+    waves: typing.List[typing.List[int]] = []
+    for i, cp_entity in enumerate(cp_entities):
+        if isinstance(cp_entity, admin_workflow_models.WorkflowSpec):
+            deps = [(ResourceType.LAUNCH_PLAN, name) for name in _launch_plan_refs(cp_entity)]
+            level = max([1] + [levels[d] + 1 for d in deps if d in levels])
+            levels[(ResourceType.WORKFLOW, cp_entity.template.id.name)] = level
+        elif isinstance(cp_entity, launch_plan_models.LaunchPlan):
+            level = max(2, levels.get((ResourceType.WORKFLOW, cp_entity.spec.workflow_id.name), 0) + 1)
+            levels[(ResourceType.LAUNCH_PLAN, cp_entity.id.name)] = level
+        else:
+            level = 0
+        while len(waves) <= level:
+            waves.append([])
+        waves[level].append(i)
+    return [wave for wave in waves if wave]
+
+
 @dataclass
 class ResolvedIdentifiers:
     project: str
@@ -237,6 +297,13 @@ class FlyteRemote(object):
             self._client_initialized = True
         return self._client
 
+    def async_client(self) -> AsynchronousFlyteClient:
+        """
+        Return a new AsynchronousFlyteClient for the same backend, to make many calls concurrently from asyncio code.
+        It has to be created and used in the same event loop, and closed once done.
+        """
+        return AsynchronousFlyteClient(self.config.platform, **self._kwargs)
+
     @property
     def default_project(self) -> str:
         """Default project to use when fetching or executing flyte entities."""
@@ -588,6 +655,7 @@ class FlyteRemote(object):
         create_default_launchplan: bool = True,
         options: Options = None,
         og_entity: FlyteLocalEntity = None,
+        registration_index: typing.Optional[RegistrationIndex] = None,
     ) -> typing.Optional[Identifier]:
         """
         Raw register method, can be used to register control plane entities. Usually if you have a Flyte Entity like a
@@ -600,6 +668,8 @@ class FlyteRemote(object):
         :param create_default_launchplan: boolean that indicates if a default launch plan should be created
         :param options: Options to be used if registering a default launch plan
         :param og_entity: Pass in the original workflow (flytekit type) if create_default_launchplan is true
+        :param registration_index: If given, entities that it records as registered with the same spec are not sent to
+            Admin again, and the registered entities are recorded in it.
         :return: Identifier of the created entity
         """
         if isinstance(cp_entity, RemoteEntity):
@@ -631,16 +701,24 @@ class FlyteRemote(object):
             if isinstance(cp_entity, FlyteTask):
                 version = cp_entity.id.version
             ident = self._resolve_identifier(ResourceType.TASK, cp_entity.template.id.name, version, settings)
+            unchanged, digest = self._is_unchanged(registration_index, ident, cp_entity)
+            if unchanged:
+                return ident
             try:
                 self.client.create_task(task_identifer=ident, task_spec=cp_entity)
             except FlyteEntityAlreadyExistsException:
                 logger.info(f" {ident} Already Exists!")
+            if digest is not None:
+                registration_index.record(ident, digest)
             return ident
 
         if isinstance(cp_entity, admin_workflow_models.WorkflowSpec):
             if isinstance(cp_entity, FlyteWorkflow):
                 version = cp_entity.id.version
             ident = self._resolve_identifier(ResourceType.WORKFLOW, cp_entity.template.id.name, version, settings)
+            unchanged, digest = self._is_unchanged(registration_index, ident, cp_entity)
+            if unchanged:
+                return ident
             try:
                 self.client.create_workflow(workflow_identifier=ident, workflow_spec=cp_entity)
             except FlyteEntityAlreadyExistsException:
@@ -669,18 +747,143 @@ class FlyteRemote(object):
                     self.client.create_launch_plan(lp_entity.id, lp_entity.spec)
                 except FlyteEntityAlreadyExistsException:
                     logger.info(f" {lp_entity.id} Already Exists!")
+            # Recorded after the default launch plan, so that the workflow is registered again if that failed.
+            if digest is not None:
+                registration_index.record(ident, digest)
             return ident
 
         if isinstance(cp_entity, launch_plan_models.LaunchPlan):
             ident = self._resolve_identifier(ResourceType.LAUNCH_PLAN, cp_entity.id.name, version, settings)
+            unchanged, digest = self._is_unchanged(registration_index, ident, cp_entity.spec)
+            if unchanged:
+                return ident
             try:
                 self.client.create_launch_plan(launch_plan_identifer=ident, launch_plan_spec=cp_entity.spec)
             except FlyteEntityAlreadyExistsException:
                 logger.info(f" {ident} Already Exists!")
+            if digest is not None:
+                registration_index.record(ident, digest)
             return ident
 
         raise AssertionError(f"Unknown entity of type {type(cp_entity)}")
 
+    @staticmethod
+    def _is_unchanged(
+        registration_index: typing.Optional[RegistrationIndex], ident: Identifier, spec: common_models.FlyteIdlEntity
+    ) -> typing.Tuple[bool, typing.Optional[str]]:
+        """
+        Returns whether the entity is recorded as registered with the same spec in the index, and the digest to record
+        once it is registered otherwise.
+        """
+        if registration_index is None:
+            return False, None
+        digest = registration_index.digest(ident, spec)
+        if registration_index.is_registered(ident, digest):
+            logger.debug(f" {ident} is unchanged since it was registered, skipping")
+            return True, None
+        return False, digest
+
+    def raw_register_all(
+        self,
+        entities: typing.Sequence[typing.Tuple[typing.Optional[FlyteLocalEntity], FlyteControlPlaneEntity]],
+        settings: SerializationSettings,
+        version: str,
+        create_default_launchplan: bool = True,
+        options: typing.Optional[Options] = None,
+        activate_launchplans: bool = False,
+        skip_errors: bool = False,
+        max_concurrency: int = REGISTRATION_CONCURRENCY,
+        skip_unchanged: bool = False,
+        verify_unchanged: bool = False,
+        on_registered: typing.Optional[
+            typing.Callable[[FlyteControlPlaneEntity, typing.Optional[Identifier], typing.Optional[Exception]], None]
+        ] = None,
+    ) -> typing.List[typing.Union[Identifier, Exception, None]]:
+        """
+        Registers many control plane entities, ``max_concurrency`` at a time. The entities have to be given in
+        dependency order, as returned by ``get_serializable``. They are registered in waves of entities that do not
+        depend on each other, tasks first, then workflows and then launch plans.
+
+        :param entities: Pairs of the original flytekit entity, if there is one, and its control plane entity.
+        :param settings: SerializationSettings to be used for registration - especially to identify the id
+        :param version: Version to be registered
+        :param create_default_launchplan: Whether default launch plans are created for the workflows
+        :param options: Options to be used if registering a default launch plan
+        :param activate_launchplans: Whether the registered launch plans are activated
+        :param skip_errors: If set, the entities that fail to register are skipped, otherwise the first error is raised
+            once the requests in flight have completed, and no further entities are registered.
+        :param max_concurrency: Maximum number of registration requests in flight
+        :param skip_unchanged: If set, the entities that were registered with the same identifier and spec before, as
+            recorded in a local :py:class:`RegistrationIndex`, are not sent to Admin again.
+        :param verify_unchanged: If set, the local index is checked against Admin first, in a single list call per
+            entity type.
+        :param on_registered: Called on the calling thread with the control plane entity, its identifier and the error
+            if any, as soon as each entity is registered.
+        :return: For each entity, its identifier, or the exception it failed with. Entities that are not registrable
+            come back with a :py:class:`RegistrationSkipped` error.
+        """
+
+        registration_index = None
+        if skip_unchanged:
+            registration_index = RegistrationIndex.load(
+                self.config.platform.endpoint, settings.project, settings.domain
+            )
+            if verify_unchanged:
+                registration_index.verify(self.client, version)
+
+        def _register(og_entity, cp_entity) -> typing.Optional[Identifier]:
+            ident = self.raw_register(
+                cp_entity,
+                settings=settings,
+                version=version,
+                create_default_launchplan=create_default_launchplan,
+                options=options,
+                og_entity=og_entity,
+                registration_index=registration_index,
+            )
+            if activate_launchplans and isinstance(cp_entity, launch_plan_models.LaunchPlan):
+                self.activate_launchplan(ident)
+            return ident
+
+        if len(entities) > 1:
+            # The client is created lazily, make sure that happens once, before it is used from several threads.
+            _ = self.client
+
+        results: typing.List[typing.Union[Identifier, Exception, None]] = [None] * len(entities)
+        errors: typing.List[typing.Tuple[int, Exception]] = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, max_concurrency), thread_name_prefix="flytekit-register"
+            ) as pool:
+                for wave in _registration_waves([cp_entity for _, cp_entity in entities]):
+                    futures = {FlyteContextManager.submit(pool, _register, *entities[i]): i for i in wave}
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        error = future.exception()
+                        if error is None:
+                            results[i] = future.result()
+                        elif isinstance(error, Exception):
+                            results[i] = error
+                            if not isinstance(error, RegistrationSkipped):
+                                errors.append((i, error))
+                        else:
+                            raise error
+                        if on_registered is not None:
+                            on_registered(entities[i][1], future.result() if error is None else None, error)
+
+                    if errors and not skip_errors:
+                        for i, e in errors:
+                            logger.error(f"Failed to register {_entity_name(entities[i][1])}: {e}")
+                        raise errors[0][1]
+        finally:
+            if registration_index is not None:
+                registration_index.save()
+
+        if errors:
+            names = ", ".join(_entity_name(entities[i][1]) for i, _ in errors)
+            logger.warning(f"Skipped {len(errors)} entities that failed to register: {names}")
+        return results
+
     def _serialize_and_register(
         self,
         entity: FlyteLocalEntity,
@@ -712,7 +915,6 @@ class FlyteRemote(object):
 
         _ = get_serializable(m, settings=serialization_settings, entity=entity, options=options)
 
-        ident = None
         for entity, cp_entity in m.items():
             if not isinstance(cp_entity, admin_workflow_models.WorkflowSpec) and is_dummy_serialization_setting:
                 # Only in the case of workflows can we use the dummy serialization settings.
@@ -721,18 +923,17 @@ class FlyteRemote(object):
                     f"No serialization settings set, but workflow contains entities that need to be registered. {cp_entity.id.name}",
                 )
 
-            try:
-                ident = self.raw_register(
-                    cp_entity,
-                    settings=settings,
-                    version=version,
-                    create_default_launchplan=create_default_launchplan,
-                    options=options,
-                    og_entity=entity,
-                )
-            except RegistrationSkipped:
-                pass
-
+        results = self.raw_register_all(
+            list(m.items()),
+            settings=settings,
+            version=version,
+            create_default_launchplan=create_default_launchplan,
+            options=options,
+        )
+        ident = None
+        for result in results:
+            if not isinstance(result, RegistrationSkipped):
+                ident = result
         return ident
 
     def register_task(
@@ -1612,19 +1813,38 @@ class FlyteRemote(object):
 
         :param execution: execution object to wait on
         :param timeout: maximum amount of time to wait
-        :param poll_interval: sync workflow execution at this interval
+        :param poll_interval: check the state of the workflow execution at this interval. By default, the execution is
+            checked often at first, and less and less often while its phase does not change.
         :param sync_nodes: passed along to the sync call for the workflow execution
         """
-        poll_interval = poll_interval or timedelta(seconds=30)
-        time_to_give_up = datetime.max if timeout is None else datetime.utcnow() + timeout
+        for done in self.watch([execution], timeout=timeout, poll_interval=poll_interval, sync_nodes=sync_nodes):
+            return done
 
-        while datetime.utcnow() < time_to_give_up:
-            execution = self.sync_execution(execution, sync_nodes=sync_nodes)
-            if execution.is_done:
-                return execution
-            time.sleep(poll_interval.total_seconds())
+    def watch(
+        self,
+        executions: typing.Iterable[FlyteWorkflowExecution],
+        timeout: typing.Optional[timedelta] = None,
+        poll_interval: typing.Optional[timedelta] = None,
+        sync_nodes: bool = False,
+    ) -> ExecutionWatcher:
+        """
+        Waits for many executions at once. Iterating over the returned :py:class:`ExecutionWatcher`, synchronously or
+        with ``async for``, yields the executions as they complete, synced.
 
-        raise user_exceptions.FlyteTimeout(f"Execution {self} did not complete before timeout.")
+        .. code-block:: python
+
+            for execution in remote.watch(executions, timeout=timedelta(hours=1)):
+                print(execution.id.name, execution.closure.phase)
+
+        :param executions: execution objects to wait on
+        :param timeout: maximum amount of time to wait for all of them, a ``FlyteTimeout`` error is raised after that
+        :param poll_interval: check the state of the executions at this interval. By default, each execution is checked
+            often at first, and less and less often while its phase does not change.
+        :param sync_nodes: whether to fetch the node executions as well, incrementally while the executions run
+        """
+        if poll_interval is not None:
+            return ExecutionWatcher(self, executions, timeout, poll_interval, poll_interval, sync_nodes)
+        return ExecutionWatcher(self, executions, timeout, sync_nodes=sync_nodes)
 
     ########################
     # Sync Execution State #
@@ -1667,48 +1887,12 @@ class FlyteRemote(object):
         # and then for the closure to have is_done to be true.
         execution._closure = self.client.get_execution(execution.id).closure
         execution_data = self.client.get_execution_data(execution.id)
-        lp_id = execution.spec.launch_plan
         underlying_node_executions = []
         if sync_nodes:
             underlying_node_executions = [
                 FlyteNodeExecution.promote_from_model(n) for n in iterate_node_executions(self.client, execution.id)
             ]
-
-        # This condition is only true for single-task executions
-        if execution.spec.launch_plan.resource_type == ResourceType.TASK:
-            flyte_entity = self.fetch_task(lp_id.project, lp_id.domain, lp_id.name, lp_id.version)
-            node_interface = flyte_entity.interface
-            if sync_nodes:
-                # Need to construct the mapping. There should've been returned exactly three nodes, a start,
-                # an end, and a task node.
-                task_node_exec = [
-                    x
-                    for x in filter(
-                        lambda x: x.id.node_id != constants.START_NODE_ID and x.id.node_id != constants.END_NODE_ID,
-                        underlying_node_executions,
-                    )
-                ]
-                # We need to manually make a map of the nodes since there is none for single task executions
-                # Assume the first one is the only one.
-                node_mapping = (
-                    {
-                        task_node_exec[0].id.node_id: FlyteNode(
-                            id=flyte_entity.id,
-                            upstream_nodes=[],
-                            bindings=[],
-                            metadata=NodeMetadata(name=""),
-                            task_node=FlyteTaskNode(flyte_entity),
-                        )
-                    }
-                    if len(task_node_exec) >= 1
-                    else {}  # This is for the case where node executions haven't appeared yet
-                )
-        # This is the default case, an execution of a normal workflow through a launch plan
-        else:
-            fetched_lp = self.fetch_launch_plan(lp_id.project, lp_id.domain, lp_id.name, lp_id.version)
-            node_interface = fetched_lp.flyte_workflow.interface
-            execution._flyte_workflow = fetched_lp.flyte_workflow
-            node_mapping = fetched_lp.flyte_workflow._node_map
+        node_interface, node_mapping = self._fetch_node_mapping(execution, underlying_node_executions)
 
         # update node executions (if requested), and inputs/outputs
         if sync_nodes:
@@ -1718,6 +1902,91 @@ class FlyteRemote(object):
             execution._node_executions = node_execs
         return self._assign_inputs_and_outputs(execution, execution_data, node_interface)
 
+    def sync_node_executions(
+        self,
+        execution: FlyteWorkflowExecution,
+        updated_since: typing.Optional[datetime] = None,
+    ) -> typing.Optional[datetime]:
+        """
+        Fetch the node executions of a workflow execution that were updated at or after ``updated_since``, or all of
+        them if it is not set, and merge them into ``execution.node_executions``. Node executions that are done are
+        synced with their data, the others only carry their closure, so this can be called while the execution runs.
+
+        :param execution: the workflow execution whose node executions to fetch
+        :param updated_since: only fetch the node executions updated at or after this time
+        :return: the time of the latest update seen, to pass as ``updated_since`` on the next call
+        """
+        filters = []
+        if updated_since is not None:
+            since = updated_since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            filters.append(filter_models.GreaterThanOrEqual("updated_at", since))
+        node_execs = dict(execution.node_executions)
+        updated = []
+        for n in iterate_node_executions(self.client, execution.id, filters=filters):
+            n = FlyteNodeExecution.promote_from_model(n)
+            if n.closure.updated_at is not None and (updated_since is None or n.closure.updated_at > updated_since):
+                updated_since = n.closure.updated_at
+            previous = node_execs.get(n.id.node_id)
+            # The cursor is inclusive, so the latest node executions are returned again on the next call.
+            if previous is not None and previous.is_done and previous.closure.updated_at == n.closure.updated_at:
+                continue
+            node_execs[n.id.node_id] = n
+            updated.append(n)
+
+        done = [n for n in updated if n.is_done]
+        if done:
+            if execution.spec.launch_plan.resource_type != ResourceType.TASK and execution.flyte_workflow is not None:
+                node_mapping = execution.flyte_workflow._node_map
+            else:
+                _, node_mapping = self._fetch_node_mapping(execution, node_execs.values())
+            for n in done:
+                node_execs[n.id.node_id] = self.sync_node_execution(n, node_mapping)
+        execution._node_executions = node_execs
+        return updated_since
+
+    def _fetch_node_mapping(
+        self,
+        execution: FlyteWorkflowExecution,
+        node_executions: typing.Iterable[FlyteNodeExecution],
+    ) -> typing.Tuple[TypedInterface, typing.Dict[str, FlyteNode]]:
+        """
+        Fetch the entity behind a workflow execution, and return its interface and the nodes its node executions
+        belong to.
+        """
+        lp_id = execution.spec.launch_plan
+        # This condition is only true for single-task executions
+        if lp_id.resource_type == ResourceType.TASK:
+            flyte_entity = self.fetch_task(lp_id.project, lp_id.domain, lp_id.name, lp_id.version)
+            # Need to construct the mapping. There should've been returned exactly three nodes, a start,
+            # an end, and a task node.
+            task_node_exec = [
+                x
+                for x in filter(
+                    lambda x: x.id.node_id != constants.START_NODE_ID and x.id.node_id != constants.END_NODE_ID,
+                    node_executions,
+                )
+            ]
+            # We need to manually make a map of the nodes since there is none for single task executions
+            # Assume the first one is the only one.
+            node_mapping = (
+                {
+                    task_node_exec[0].id.node_id: FlyteNode(
+                        id=flyte_entity.id,
+                        upstream_nodes=[],
+                        bindings=[],
+                        metadata=NodeMetadata(name=""),
+                        task_node=FlyteTaskNode(flyte_entity),
+                    )
+                }
+                if len(task_node_exec) >= 1
+                else {}  # This is for the case where node executions haven't appeared yet
+            )
+            return flyte_entity.interface, node_mapping
+        # This is the default case, an execution of a normal workflow through a launch plan
+        fetched_lp = self.fetch_launch_plan(lp_id.project, lp_id.domain, lp_id.name, lp_id.version)
+        execution._flyte_workflow = fetched_lp.flyte_workflow
+        return fetched_lp.flyte_workflow.interface, fetched_lp.flyte_workflow._node_map
+
     def sync_node_execution(
         self,
         execution: FlyteNodeExecution,
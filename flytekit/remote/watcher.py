@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flytekit.exceptions import user as user_exceptions
+from flytekit.remote.executions import FlyteWorkflowExecution
+
+if typing.TYPE_CHECKING:
+    from flytekit.remote.remote import FlyteRemote
+
+DEFAULT_MIN_POLL_INTERVAL = timedelta(seconds=1)
+DEFAULT_MAX_POLL_INTERVAL = timedelta(seconds=30)
+
+
+class _Watched(object):
+    def __init__(self, execution: FlyteWorkflowExecution, interval: float):
+        self.execution = execution
+        self.phase = execution.closure.phase if execution.closure is not None else None
+        self.interval = interval
+        self.next_poll = time.monotonic()
+        # The latest update seen on the node executions, only the ones updated since are fetched on the next poll.
+        self.nodes_updated_since: typing.Optional[datetime] = None
+
+
+class ExecutionWatcher(object):
+    """
+    Waits for many workflow executions at once, in a single loop. Iterating over the watcher yields the executions as
+    they complete, fully synced, in the order in which they complete. It can be iterated asynchronously as well.
+
+    While an execution runs, its closure is fetched, and if ``sync_nodes`` is set, the node executions updated since
+    the previous poll. Each execution is polled on its own schedule, starting at ``min_poll_interval`` and backing off
+    up to ``max_poll_interval`` for as long as its phase does not change. The execution data is only fetched once the
+    execution is done.
+
+    .. code-block:: python
+
+        for execution in remote.watch(executions):
+            print(execution.id.name, execution.closure.phase)
+
+        async for execution in remote.watch(executions):
+            ...
+    """
+
+    def __init__(
+        self,
+        remote: FlyteRemote,
+        executions: typing.Iterable[FlyteWorkflowExecution],
+        timeout: typing.Optional[timedelta] = None,
+        min_poll_interval: timedelta = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: timedelta = DEFAULT_MAX_POLL_INTERVAL,
+        sync_nodes: bool = False,
+        max_concurrency: int = 8,
+    ):
+        self._remote = remote
+        self._executions = list(executions)
+        self._timeout = timeout
+        self._min_poll_interval = min_poll_interval.total_seconds()
+        self._max_poll_interval = max(max_poll_interval.total_seconds(), self._min_poll_interval)
+        self._sync_nodes = sync_nodes
+        self._max_concurrency = max_concurrency
+
+    def _poll(self, watched: _Watched):
+        watched.execution._closure = self._remote.client.get_execution(watched.execution.id).closure
+        if self._sync_nodes:
+            watched.nodes_updated_since = self._remote.sync_node_executions(
+                watched.execution, watched.nodes_updated_since
+            )
+        now = time.monotonic()
+        if watched.execution.closure.phase != watched.phase:
+            watched.phase = watched.execution.closure.phase
+            watched.interval = self._min_poll_interval
+        else:
+            watched.interval = min(watched.interval * 2, self._max_poll_interval)
+        watched.next_poll = now + watched.interval
+
+    def __iter__(self) -> typing.Iterator[FlyteWorkflowExecution]:
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout.total_seconds()
+        pending = [_Watched(e, self._min_poll_interval) for e in self._executions]
+        if not pending:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(len(pending), self._max_concurrency), thread_name_prefix="flytekit-watch"
+        ) as pool:
+            while pending:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    names = ", ".join(w.execution.id.name for w in pending)
+                    raise user_exceptions.FlyteTimeout(f"Executions {names} did not complete before timeout.")
+
+                due = [w for w in pending if w.next_poll <= now]
+                if not due:
+                    wake_up = min(w.next_poll for w in pending)
+                    if deadline is not None:
+                        wake_up = min(wake_up, deadline)
+                    time.sleep(max(0.0, wake_up - now))
+                    continue
+
+                list(pool.map(self._poll, due))
+                done = [w for w in due if w.execution.is_done]
+                for w in done:
+                    pending.remove(w)
+                    # The node executions were synced by the last poll, which saw the execution done.
+                    yield self._remote.sync_execution(w.execution)
+
+    async def __aiter__(self) -> typing.AsyncIterator[FlyteWorkflowExecution]:
+        # The polling loop runs on a worker thread, so that it does not block the event loop.
+        it = iter(self)
+        loop = asyncio.get_running_loop()
+        while True:
+            execution = await loop.run_in_executor(None, next, it, None)
+            if execution is None:
+                return
+            yield execution
@@ -2,23 +2,33 @@ from __future__ import annotations
 
 import gzip
 import hashlib
+import json
 import os
 import posixpath
 import subprocess as _subprocess
 import tarfile
 import tempfile
+import time
 import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 import click
 
 from flytekit.core.context_manager import FlyteContextManager
 from flytekit.core.utils import timeit
+from flytekit.loggers import logger
 from flytekit.tools.ignore import DockerIgnore, GitIgnore, IgnoreGroup, StandardIgnore
 from flytekit.tools.script_mode import tar_strip_file_attributes
 
 FAST_PREFIX = "fast"
 FAST_FILEENDING = ".tar.gz"
+# Digests of the packaged files, keyed by their size and modification time, so that unchanged files are not read
+# again on the next registration.
+DIGEST_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".flyte", "fast-registration")
+_RACY_MTIME_NS = 2 * 10**9
+_GZIP_BLOCK_SIZE = 1024 * 1024
 
 
 def fast_package(source: os.PathLike, output_dir: os.PathLike, deref_symlinks: bool = False) -> os.PathLike:
@@ -31,7 +41,9 @@ def fast_package(source: os.PathLike, output_dir: os.PathLike, deref_symlinks: b
     :return os.PathLike:
     """
     ignore = IgnoreGroup(source, [GitIgnore, DockerIgnore, StandardIgnore])
-    digest = compute_digest(source, ignore.is_ignored)
+    # The tree is walked once, the same list of files is used for the digest and the archive.
+    entries = _list_entries(source, ignore.is_ignored, deref_symlinks)
+    digest = _digest_files(source, [e for e, is_file in entries if is_file], _digest_cache_path(source))
     archive_fname = f"{FAST_PREFIX}{digest}{FAST_FILEENDING}"
 
     if output_dir is None:
@@ -40,19 +52,29 @@ def fast_package(source: os.PathLike, output_dir: os.PathLike, deref_symlinks: b
 
     archive_fname = os.path.join(output_dir, archive_fname)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tar_path = os.path.join(tmp_dir, "tmp.tar")
-        with tarfile.open(tar_path, "w", dereference=deref_symlinks) as tar:
-            files: typing.List[str] = os.listdir(source)
-            for ws_file in files:
-                tar.add(
-                    os.path.join(source, ws_file),
-                    arcname=ws_file,
-                    filter=lambda x: ignore.tar_filter(tar_strip_file_attributes(x)),
-                )
-        with gzip.GzipFile(filename=archive_fname, mode="wb", mtime=0) as gzipped:
-            with open(tar_path, "rb") as tar_file:
-                gzipped.write(tar_file.read())
+    # The tar is compressed while it is written, straight to a temporary file that replaces the archive once it is
+    # complete.
+    tmp_path = f"{archive_fname}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            gzipped = _ParallelGzipWriter(f)
+            try:
+                with tarfile.open(fileobj=gzipped, mode="w|", dereference=deref_symlinks) as tar:
+                    for relpath, _ in entries:
+                        abspath = os.path.join(source, relpath)
+                        tarinfo = tar_strip_file_attributes(tar.gettarinfo(abspath, arcname=relpath))
+                        if tarinfo.isreg():
+                            with open(abspath, "rb") as member:
+                                tar.addfile(tarinfo, member)
+                        else:
+                            tar.addfile(tarinfo)
+            finally:
+                gzipped.close()
+        os.replace(tmp_path, archive_fname)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
     return archive_fname
 
@@ -64,20 +86,102 @@ def compute_digest(source: os.PathLike, filter: Optional[callable] = None) -> st
     :param Ignore ignore:
     :return Text:
     """
-    hasher = hashlib.md5()
-    for root, _, files in os.walk(source, topdown=True):
-        files.sort()
+    entries = _list_entries(source, filter, False)
+    return _digest_files(source, [e for e, is_file in entries if is_file], _digest_cache_path(source))
+
+
+def _list_entries(
+    source: os.PathLike, filter: Optional[callable], deref_symlinks: bool
+) -> typing.List[typing.Tuple[str, bool]]:
+    """
+    Returns the sorted relative paths of the files and directories that are not ignored, and whether they are files.
+    Ignored directories are not walked into.
+    """
+    entries = []
+    for root, dirs, files in os.walk(source, followlinks=deref_symlinks):
+        relroot = os.path.relpath(root, source)
+        kept = []
+        for dname in dirs:
+            relpath = os.path.normpath(os.path.join(relroot, dname))
+            if filter and filter(relpath):
+                continue
+            kept.append(dname)
+            entries.append((relpath, False))
+        dirs[:] = kept
 
         for fname in files:
-            abspath = os.path.join(root, fname)
-            relpath = os.path.relpath(abspath, source)
-            if filter:
-                if filter(relpath):
-                    continue
+            relpath = os.path.normpath(os.path.join(relroot, fname))
+            if filter and filter(relpath):
+                continue
+            entries.append((relpath, True))
+
+    entries.sort()
+    return entries
+
+
+def _digest_cache_path(source: os.PathLike) -> str:
+    key = hashlib.md5(os.path.abspath(source).encode("utf-8")).hexdigest()
+    return os.path.join(DIGEST_CACHE_DIR, f"{key}.json")
 
-            _filehash_update(abspath, hasher)
-            _pathhash_update(relpath, hasher)
 
+def _digest_files(source: os.PathLike, relpaths: typing.List[str], cache_path: Optional[str] = None) -> str:
+    """
+    Computes the combined digest of the given files, which are hashed in parallel. Files whose size and modification
+    time match the digest cache are not read again.
+    """
+    cache = _read_digest_cache(cache_path) if cache_path else {}
+    # Files modified right before the cache is written could be modified again without changing their modification
+    # time, those are not cached.
+    racy_after = time.time_ns() - _RACY_MTIME_NS
+    stats = {}
+    digests: typing.Dict[str, str] = {}
+    for relpath in relpaths:
+        st = os.stat(os.path.join(source, relpath))
+        stats[relpath] = [st.st_size, st.st_mtime_ns]
+        cached = cache.get(relpath)
+        if cached is not None and cached[:2] == stats[relpath]:
+            digests[relpath] = cached[2]
+
+    missing = [p for p in relpaths if p not in digests]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+            for relpath, digest in zip(missing, executor.map(lambda p: _filehash(os.path.join(source, p)), missing)):
+                digests[relpath] = digest
+        if cache_path:
+            _write_digest_cache(cache_path, {p: stats[p] + [digests[p]] for p in relpaths if stats[p][1] < racy_after})
+
+    hasher = hashlib.md5()
+    for relpath in relpaths:
+        hasher.update(digests[relpath].encode("utf-8"))
+        _pathhash_update(relpath, hasher)
+    return hasher.hexdigest()
+
+
+def _read_digest_cache(path: str) -> typing.Dict[str, list]:
+    try:
+        with open(path, "r") as f:
+            cache = json.load(f)
+        if cache.get("version") == 1:
+            return cache["files"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+
+def _write_digest_cache(path: str, files: typing.Dict[str, list]):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": 1, "files": files}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Failed to write the fast registration digest cache {path}: {e}")
+
+
+def _filehash(path: os.PathLike) -> str:
+    hasher = hashlib.md5()
+    _filehash_update(path, hasher)
     return hasher.hexdigest()
 
 
@@ -95,6 +199,45 @@ def _pathhash_update(path: os.PathLike, hasher: hashlib._Hash) -> None:
     hasher.update("".join(path_list).encode("utf-8"))
 
 
+class _ParallelGzipWriter(object):
+    """
+    A write only file object that gzips the data written to it on multiple threads. The data is cut into fixed size
+    blocks, each of which is compressed into a separate gzip member. Readers decompress the concatenated members as a
+    single stream, and the output only depends on the data written.
+    """
+
+    def __init__(self, fileobj: typing.BinaryIO, block_size: int = _GZIP_BLOCK_SIZE):
+        self._fileobj = fileobj
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._workers = os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="flytekit-gzip")
+        self._pending: typing.Deque[Future] = deque()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return len(data)
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(gzip.compress, block, mtime=0))
+        # Bounds the memory used by blocks that are waiting to be written, the output order is the input order.
+        while len(self._pending) > 2 * self._workers:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self):
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        try:
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+
 def get_additional_distribution_loc(remote_location: str, identifier: str) -> str:
     """
     :param Text remote_location:
@@ -12,7 +12,7 @@ from flytekit.loggers import logger
 from flytekit.models import launch_plan
 from flytekit.models.core.identifier import Identifier
 from flytekit.remote import FlyteRemote
-from flytekit.remote.remote import RegistrationSkipped, _get_git_repo_url
+from flytekit.remote.remote import REGISTRATION_CONCURRENCY, RegistrationSkipped, _get_git_repo_url
 from flytekit.tools import fast_registration, module_loader
 from flytekit.tools.script_mode import _find_project_root
 from flytekit.tools.serialize_helpers import get_registrable_entities, persist_registrable_entities
@@ -206,6 +206,12 @@ def secho(i: Identifier, state: str = "success", reason: str = None, op: str = "
     )
 
 
+def _original_id(cp_entity: FlyteControlPlaneEntity) -> Identifier:
+    if isinstance(cp_entity, launch_plan.LaunchPlan):
+        return cp_entity.id
+    return cp_entity.template.id
+
+
 def register(
     project: str,
     domain: str,
@@ -223,6 +229,9 @@ def register(
     dry_run: bool = False,
     activate_launchplans: bool = False,
     skip_errors: bool = False,
+    concurrency: int = REGISTRATION_CONCURRENCY,
+    skip_unchanged: bool = False,
+    verify_unchanged: bool = False,
 ):
     detected_root = find_common_root(package_or_module)
     click.secho(f"Detected Root {detected_root}, using this to create deployable package...", fg="yellow")
@@ -269,31 +278,43 @@ def register(
         click.secho("No Flyte entities were detected. Aborting!", fg="red")
         return
 
-    for cp_entity in registrable_entities:
-        is_lp = False
-        if isinstance(cp_entity, launch_plan.LaunchPlan):
-            og_id = cp_entity.id
-            is_lp = True
-        else:
-            og_id = cp_entity.template.id
-        secho(og_id, "")
-        try:
-            if not dry_run:
-                try:
-                    i = remote.raw_register(
-                        cp_entity, serialization_settings, version=version, create_default_launchplan=False
-                    )
-                    secho(i, state="success")
-                    if is_lp and activate_launchplans:
-                        secho(og_id, "", op="Activation")
-                        remote.activate_launchplan(i)
-                        secho(i, reason="activated", op="Activation")
-                except Exception as e:
-                    if not skip_errors:
-                        raise e
-                    secho(og_id, state="failed")
-            else:
-                secho(og_id, reason="Dry run Mode!")
-        except RegistrationSkipped:
+    if dry_run:
+        for cp_entity in registrable_entities:
+            secho(_original_id(cp_entity), reason="Dry run Mode!")
+        click.secho(f"Successfully registered {len(registrable_entities)} entities", fg="green")
+        return
+
+    failed: typing.List[Identifier] = []
+
+    def _on_registered(
+        cp_entity: FlyteControlPlaneEntity, i: typing.Optional[Identifier], error: typing.Optional[Exception]
+    ):
+        og_id = _original_id(cp_entity)
+        if isinstance(error, RegistrationSkipped):
             secho(og_id, "failed")
-    click.secho(f"Successfully registered {len(registrable_entities)} entities", fg="green")
+        elif error is not None:
+            failed.append(og_id)
+            secho(og_id, state="failed")
+        else:
+            secho(i, state="success")
+            if activate_launchplans and isinstance(cp_entity, launch_plan.LaunchPlan):
+                secho(i, reason="activated", op="Activation")
+
+    remote.raw_register_all(
+        [(None, cp_entity) for cp_entity in registrable_entities],
+        serialization_settings,
+        version=version,
+        create_default_launchplan=False,
+        activate_launchplans=activate_launchplans,
+        skip_errors=skip_errors,
+        max_concurrency=concurrency,
+        skip_unchanged=skip_unchanged,
+        verify_unchanged=verify_unchanged,
+        on_registered=_on_registered,
+    )
+    if failed:
+        click.secho(
+            f"Failed to register {len(failed)} entities: {', '.join(i.name for i in failed)}",
+            fg="red",
+        )
+    click.secho(f"Successfully registered {len(registrable_entities) - len(failed)} entities", fg="green")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import fnmatch
+import json
 import os
 import pathlib
 import random
@@ -15,8 +17,10 @@ from fsspec.utils import get_protocol
 from marshmallow import fields
 
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager
-from flytekit.core.type_engine import TypeEngine, TypeTransformer, get_batch_size
+from flytekit.core.hash import ContentAddressed, compute_directory_digest
+from flytekit.core.type_engine import TypeEngine, TypeTransformer, get_batch_size, get_content_addressed
 from flytekit.exceptions.user import FlyteAssertion
+from flytekit.loggers import logger
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
@@ -31,6 +35,41 @@ def noop():
     ...
 
 
+# Directories uploaded to a location chosen by flytekit come with a listing of their files, written next to them, so
+# that readers do not need to list the (possibly large and not consistently listable) directory in the object store.
+_MANIFEST_SUFFIX = ".manifest.json"
+_MANIFEST_METADATA_KEY = "manifest"
+
+
+def _list_local_tree(path: str) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """
+    Returns the relative paths of the files and of the empty directories under ``path``, separated with ``/``.
+    """
+    files = []
+    empty_directories = []
+    for root, dirs, names in os.walk(path):
+        relative_root = os.path.relpath(root, path).replace(os.sep, "/")
+        if not dirs and not names and relative_root != ".":
+            empty_directories.append(relative_root)
+        for name in names:
+            files.append(os.path.relpath(os.path.join(root, name), path).replace(os.sep, "/"))
+    return sorted(files), sorted(empty_directories)
+
+
+def _write_manifest(ctx: FlyteContext, remote_directory: str, local_directory: str) -> str:
+    # Object stores have no directories, so empty ones are only kept in the manifest.
+    files, empty_directories = _list_local_tree(local_directory)
+    manifest = f"{remote_directory.rstrip('/')}{_MANIFEST_SUFFIX}"
+    fs = ctx.file_access.get_filesystem_for_path(manifest)
+    fs.pipe(manifest, json.dumps({"version": 1, "files": files, "empty_directories": empty_directories}).encode())
+    return manifest
+
+
+def _read_manifest(ctx: FlyteContext, manifest: str) -> typing.Dict[str, typing.List[str]]:
+    fs = ctx.file_access.get_filesystem_for_path(manifest)
+    return json.loads(fs.cat_file(manifest))
+
+
 @dataclass
 class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
     path: PathType = field(default=None, metadata=config(mm_field=fields.String()))  # type: ignore
@@ -39,7 +78,8 @@ class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
 
         This class should not be used on very large datasets, as merely listing the dataset will cause
         the entire dataset to be downloaded. Listing on S3 and other backend object stores is not consistent
-        and we should not need data to be downloaded to list.
+        and we should not need data to be downloaded to list. Use :py:meth:`files` to list the files without
+        downloading them, and :py:meth:`download_files` or :py:meth:`get_file` to only download some of them.
 
     Please first read through the comments on the :py:class:`flytekit.types.file.FlyteFile` class as the
     implementation here is similar.
@@ -140,6 +180,7 @@ class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
         self._downloaded = False
         self._remote_directory = remote_directory
         self._remote_source: typing.Optional[str] = None
+        self._manifest: typing.Optional[str] = None
 
     def __fspath__(self):
         """
@@ -237,6 +278,57 @@ class FlyteDirectory(DataClassJsonMixin, os.PathLike, typing.Generic[T]):
     def download(self) -> str:
         return self.__fspath__()
 
+    def files(self, pattern: typing.Optional[str] = None) -> typing.List[str]:
+        """
+        Returns the paths, relative to this directory and separated with ``/``, of the files in it that match the
+        ``fnmatch`` style ``pattern``, if given. Nothing is downloaded: for a remote directory the listing comes from
+        its manifest, if it was uploaded with one, or else from the object store.
+        """
+        if self._manifest is not None:
+            files = _read_manifest(FlyteContextManager.current_context(), self._manifest)["files"]
+        elif self.remote_source:
+            fs = FlyteContextManager.current_context().file_access.get_filesystem_for_path(self.remote_source)
+            base = fsspec.core.strip_protocol(self.remote_source).rstrip("/") + "/"
+            files = [f[len(base) :] for f in fs.find(self.remote_source)]
+        else:
+            files = _list_local_tree(str(self.path))[0]
+        if pattern is not None:
+            files = [f for f in files if fnmatch.fnmatchcase(f, pattern)]
+        return files
+
+    def download_files(self, pattern: str) -> typing.List[str]:
+        """
+        Downloads only the files that match ``pattern`` (see :py:meth:`files`), concurrently, to their place under
+        :py:attr:`path`, and returns their local paths.
+
+        .. code-block:: python
+
+            @task
+            def t1(images: FlyteDirectory):
+                for p in images.download_files("2024-*/*.png"):
+                    ...
+        """
+        files = self.files(pattern)
+        if self.remote_source and not self._downloaded:
+            ctx = FlyteContextManager.current_context()
+            ctx.file_access.get_files(self.remote_source, str(self.path), files)
+        return [os.path.join(str(self.path), *f.split("/")) for f in files]
+
+    def get_file(self, relative_path: str) -> FlyteFile:
+        """
+        Returns a single file of this directory, which is only downloaded when it is opened.
+        """
+        local_path = os.path.join(str(self.path), *relative_path.split("/"))
+        if not self.remote_source or self._downloaded:
+            return FlyteFile(local_path)
+        ctx = FlyteContextManager.current_context()
+        remote_path = ctx.file_access.join(
+            self.remote_source, relative_path, fs=ctx.file_access.get_filesystem_for_path(self.remote_source)
+        )
+        ff: FlyteFile = FlyteFile(local_path, downloader=lambda: ctx.file_access.get_data(remote_path, local_path))
+        ff._remote_source = remote_path
+        return ff
+
     @classmethod
     def listdir(cls, directory: FlyteDirectory) -> typing.List[typing.Union[FlyteDirectory, FlyteFile]]:
         """
@@ -385,6 +477,7 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
         remote_directory = None
         should_upload = True
         batch_size = get_batch_size(python_type)
+        content_addressed = get_content_addressed(python_type)
 
         meta = BlobMetadata(type=self._blob_type(format=self.get_format(python_type)))
 
@@ -393,7 +486,10 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
         if isinstance(python_val, FlyteDirectory):
             # If the object has a remote source, then we just convert it back.
             if python_val._remote_source is not None:
-                return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=python_val._remote_source)))
+                return Literal(
+                    scalar=Scalar(blob=Blob(metadata=meta, uri=python_val._remote_source)),
+                    metadata={_MANIFEST_METADATA_KEY: python_val._manifest} if python_val._manifest else None,
+                )
 
             source_path = str(python_val.path)
             # If the user supplied a pathlike value, then the directory does need to be uploaded. However, don't upload
@@ -426,17 +522,55 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
-            if remote_directory is None:
-                remote_directory = ctx.file_access.get_random_remote_directory()
+            if remote_directory is None and content_addressed is not None:
+                return self._upload_content_addressed(ctx, source_path, meta, content_addressed, batch_size)
             if not pathlib.Path(source_path).is_dir():
                 raise FlyteAssertion("Expected a directory. {} is not a directory".format(source_path))
-            ctx.file_access.put_data(source_path, remote_directory, is_multipart=True, batch_size=batch_size)
-            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)))
+            if remote_directory is not None:
+                ctx.file_access.put_data(source_path, remote_directory, is_multipart=True, batch_size=batch_size)
+                return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)))
+            # The location is ours, so a manifest can be written next to it. The files themselves are uploaded with
+            # the recursive put of the file system, which batches them.
+            random_directory = ctx.file_access.get_random_remote_directory()
+            ctx.file_access.put_data(source_path, random_directory, is_multipart=True, batch_size=batch_size)
+            manifest = _write_manifest(ctx, random_directory, source_path)
+            return Literal(
+                scalar=Scalar(blob=Blob(metadata=meta, uri=random_directory)),
+                metadata={_MANIFEST_METADATA_KEY: manifest},
+            )
 
         # If not uploading, then we can only take the original source path as the uri.
         else:
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=source_path)))
 
+    @staticmethod
+    def _upload_content_addressed(
+        ctx: FlyteContext,
+        source_path: str,
+        meta: BlobMetadata,
+        content_addressed: ContentAddressed,
+        batch_size: typing.Optional[int],
+    ) -> Literal:
+        if not pathlib.Path(source_path).is_dir():
+            raise FlyteAssertion("Expected a directory. {} is not a directory".format(source_path))
+        digest = compute_directory_digest(source_path, ctx.file_access.data_config.transfer_concurrency)
+        prefix = content_addressed.prefix or ctx.file_access.raw_output_prefix
+        fs = ctx.file_access.get_filesystem_for_path(prefix)
+        remote_directory = ctx.file_access.join(prefix, digest, fs=fs)
+        # The manifest is only written once all the files are uploaded, so that an upload that was interrupted is
+        # not mistaken for a complete one.
+        manifest = f"{remote_directory}{_MANIFEST_SUFFIX}"
+        if ctx.file_access.exists(manifest):
+            logger.debug(f"Not uploading {source_path}, its content already exists at {remote_directory}")
+        else:
+            ctx.file_access.put_data(source_path, remote_directory, is_multipart=True, batch_size=batch_size)
+            _write_manifest(ctx, remote_directory, source_path)
+        return Literal(
+            scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)),
+            hash=digest,
+            metadata={_MANIFEST_METADATA_KEY: manifest},
+        )
+
     def to_python_value(
         self, ctx: FlyteContext, lv: Literal, expected_python_type: typing.Type[FlyteDirectory]
     ) -> FlyteDirectory:
@@ -454,13 +588,21 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
 
         batch_size = get_batch_size(expected_python_type)
 
+        manifest = (lv.metadata or {}).get(_MANIFEST_METADATA_KEY)
+
         def _downloader():
-            return ctx.file_access.get_data(uri, local_folder, is_multipart=True, batch_size=batch_size)
+            if manifest is None:
+                return ctx.file_access.get_data(uri, local_folder, is_multipart=True, batch_size=batch_size)
+            listing = _read_manifest(ctx, manifest)
+            for d in listing.get("empty_directories", []):
+                os.makedirs(os.path.join(local_folder, *d.split("/")), exist_ok=True)
+            return ctx.file_access.get_files(uri, local_folder, listing["files"], max_concurrency=batch_size)
 
         expected_format = self.get_format(expected_python_type)
 
         fd = FlyteDirectory.__class_getitem__(expected_format)(local_folder, _downloader)
         fd._remote_source = uri
+        fd._manifest = manifest
         return fd
 
     def guess_python_type(self, literal_type: LiteralType) -> typing.Type[FlyteDirectory[typing.Any]]:
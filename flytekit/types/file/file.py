@@ -12,7 +12,14 @@ from marshmallow import fields
 from mashumaro.mixins.json import DataClassJSONMixin
 
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager
-from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError, get_underlying_type
+from flytekit.core.hash import ContentAddressed, compute_file_digest
+from flytekit.core.type_engine import (
+    TypeEngine,
+    TypeTransformer,
+    TypeTransformerFailedError,
+    get_content_addressed,
+    get_underlying_type,
+)
 from flytekit.exceptions.user import FlyteAssertion
 from flytekit.loggers import logger
 from flytekit.models.core.types import BlobType
@@ -388,6 +395,7 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         if python_val is None:
             raise TypeTransformerFailedError("None value cannot be converted to a file.")
 
+        content_addressed = get_content_addressed(python_type)
         # Correctly handle `Annotated[FlyteFile, ...]` by extracting the origin type
         python_type = get_underlying_type(python_type)
 
@@ -446,6 +454,8 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
+            if remote_path is None and content_addressed is not None:
+                return self._upload_content_addressed(ctx, str(source_path), meta, content_addressed)
             if remote_path is not None:
                 remote_path = ctx.file_access.put_data(source_path, remote_path, is_multipart=False)
             else:
@@ -455,6 +465,21 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         else:
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=source_path)))
 
+    @staticmethod
+    def _upload_content_addressed(
+        ctx: FlyteContext, source_path: str, meta: BlobMetadata, content_addressed: ContentAddressed
+    ) -> Literal:
+        digest = compute_file_digest(source_path, ctx.file_access.data_config.transfer_concurrency)
+        prefix = content_addressed.prefix or ctx.file_access.raw_output_prefix
+        fs = ctx.file_access.get_filesystem_for_path(prefix)
+        # The file name is kept, so that downloads of the file end up with the same name.
+        remote_path = ctx.file_access.join(prefix, digest, ctx.file_access.get_file_tail(source_path), fs=fs)
+        if ctx.file_access.exists(remote_path):
+            logger.debug(f"Not uploading {source_path}, its content already exists at {remote_path}")
+        else:
+            ctx.file_access.put_data(source_path, remote_path, is_multipart=False)
+        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)), hash=digest)
+
     def to_python_value(
         self, ctx: FlyteContext, lv: Literal, expected_python_type: typing.Union[typing.Type[FlyteFile], os.PathLike]
     ) -> FlyteFile:
@@ -1,9 +1,12 @@
 import collections
 import typing
+from concurrent.futures import Future
 
 from typing_extensions import get_args
 
 from flytekit import FlyteContext, Literal, LiteralType
+from flytekit.core.data_persistence import submit_transfer
+from flytekit.core.prefetch import collect_downloadable
 from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
 from flytekit.models import types as _type_models
 from flytekit.models.literals import LiteralCollection
@@ -12,30 +15,65 @@ T = typing.TypeVar("T")
 
 
 class FlyteIterator:
-    def __init__(self, ctx: FlyteContext, lv: Literal, expected_python_type: typing.Type[T], length: int):
+    """
+    Converts the elements of an ``Iterator`` input one at a time, as they are consumed. With ``prefetch`` set, up to
+    that many of the following elements are converted, and downloaded if they are files or directories, in the
+    background while the current one is processed. Elements are still returned in order.
+    """
+
+    def __init__(
+        self, ctx: FlyteContext, lv: Literal, expected_python_type: typing.Type[T], length: int, prefetch: int = 0
+    ):
         self._ctx = ctx
         self._lv = lv
         self._expected_python_type = expected_python_type
+        self._element_type = get_args(expected_python_type)[0]
         self._length = length
         self._index = 0
+        self._prefetch = prefetch
+        self._pending: typing.Deque[Future] = collections.deque()
 
     def __len__(self):
         return self._length
 
     def __iter__(self):
         self._index = 0
+        self._stop_prefetching()
         return self
 
+    def _convert(self, lit: Literal) -> typing.Any:
+        value = TypeEngine.to_python_value(self._ctx, lit, self._element_type)
+        for v in collect_downloadable(value):
+            v.download()
+        return value
+
+    def _stop_prefetching(self):
+        for f in self._pending:
+            f.cancel()
+        self._pending.clear()
+
     def __next__(self):
-        if self._index < self._length:
-            lits = self._lv.collection.literals
-            st = get_args(self._expected_python_type)[0]
-            lt = TypeEngine.to_python_value(self._ctx, lits[self._index], st)
+        if self._index >= self._length:
+            self._stop_prefetching()
+            raise StopIteration
+
+        lits = self._lv.collection.literals
+        if self._prefetch <= 0:
+            lt = TypeEngine.to_python_value(self._ctx, lits[self._index], self._element_type)
             self._index += 1
             return lt
 
-        else:
-            raise StopIteration
+        # Keep the current element and at most ``prefetch`` elements after it in flight on the shared transfer pool.
+        workers = self._ctx.file_access.data_config.transfer_concurrency
+        end = min(self._index + 1 + self._prefetch, self._length)
+        for i in range(self._index + len(self._pending), end):
+            self._pending.append(submit_transfer(workers, self._convert, lits[i]))
+        self._index += 1
+        future = self._pending.popleft()
+        # An element whose conversion has not started yet is converted on this thread instead of waiting for the pool.
+        if future.cancel():
+            return self._convert(lits[self._index - 1])
+        return future.result()
 
 
 class IteratorTransformer(TypeTransformer[typing.Iterator]):
@@ -61,7 +99,9 @@ class IteratorTransformer(TypeTransformer[typing.Iterator]):
             lits = lv.collection.literals
         except AttributeError:
             raise TypeTransformerFailedError()
-        return FlyteIterator(ctx, lv, expected_python_type, len(lits))
+        return FlyteIterator(
+            ctx, lv, expected_python_type, len(lits), prefetch=ctx.file_access.data_config.iterator_prefetch
+        )
 
 
 TypeEngine.register(IteratorTransformer(), [collections.abc.Iterator])
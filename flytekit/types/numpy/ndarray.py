@@ -1,13 +1,13 @@
-import pathlib
+import os
 import typing
 from collections import OrderedDict
-from typing import Dict, Tuple, Type
+from typing import Dict, Optional, Tuple, Type
 
 import numpy as np
 from typing_extensions import Annotated, get_args, get_origin
 
 from flytekit.core.context_manager import FlyteContext
-from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError
+from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError, map_concurrently
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
@@ -27,9 +27,21 @@ def extract_metadata(t: Type[np.ndarray]) -> Tuple[Type[np.ndarray], Dict[str, b
 class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
     """
     TypeTransformer that supports np.ndarray as a native type.
+
+    Arrays are streamed into a single ``.npy`` blob without going through a local file. On the way in, arrays of at
+    least ``MMAP_THRESHOLD_BYTES`` are memory-mapped copy-on-write instead of being read into memory, unless an
+    ``mmap_mode`` is set explicitly (``None`` to always load them). Large arrays can also be split along the first
+    axis into several ``.npy`` shards, which are written and read concurrently:
+
+    .. code-block:: python
+
+        @task
+        def t1() -> Annotated[np.ndarray, kwtypes(shard_rows=1_000_000)]:
+            ...
     """
 
     NUMPY_ARRAY_FORMAT = "NumpyArray"
+    MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
 
     def __init__(self):
         super().__init__(name="Numpy Array", t=np.ndarray)
@@ -41,24 +53,43 @@ class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
             )
         )
 
+    @staticmethod
+    def _write(ctx: FlyteContext, remote_path: str, arr: np.ndarray, allow_pickle: bool):
+        fs = ctx.file_access.get_filesystem_for_path(remote_path)
+        # write_array writes the header and then the buffer in bounded chunks, so the array is never copied whole.
+        with fs.open(remote_path, "wb") as f:
+            np.lib.format.write_array(f, np.asanyarray(arr), allow_pickle=allow_pickle)
+
     def to_literal(
         self, ctx: FlyteContext, python_val: np.ndarray, python_type: Type[np.ndarray], expected: LiteralType
     ) -> Literal:
         python_type, metadata = extract_metadata(python_type)
+        allow_pickle = metadata.get("allow_pickle", False)
+        shard_rows = metadata.get("shard_rows")
 
-        meta = BlobMetadata(
-            type=_core_types.BlobType(
-                format=self.NUMPY_ARRAY_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
-            )
-        )
-
-        local_path = ctx.file_access.get_random_local_path() + ".npy"
-        pathlib.Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # save numpy array to file
-        np.save(file=local_path, arr=python_val, allow_pickle=metadata.get("allow_pickle", False))
-        remote_path = ctx.file_access.put_raw_data(local_path)
-        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+        if not shard_rows or python_val.ndim == 0:
+            dimensionality = _core_types.BlobType.BlobDimensionality.SINGLE
+            uri = ctx.file_access.get_random_remote_path(f"{ctx.file_access.get_random_string()}.npy")
+            self._write(ctx, uri, python_val, allow_pickle)
+        else:
+            dimensionality = _core_types.BlobType.BlobDimensionality.MULTIPART
+            uri = ctx.file_access.get_random_remote_directory()
+            shards = [
+                (ctx, ctx.file_access.join(uri, f"{i:05}.npy"), python_val[start : start + shard_rows], allow_pickle)
+                for i, start in enumerate(range(0, max(len(python_val), 1), shard_rows))
+            ]
+            map_concurrently(ctx, self._write, shards)
+
+        meta = BlobMetadata(type=_core_types.BlobType(format=self.NUMPY_ARRAY_FORMAT, dimensionality=dimensionality))
+        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=uri)))
+
+    def _mmap_mode(self, metadata: Dict[str, typing.Any], nbytes: int) -> Optional[str]:
+        if "mmap_mode" in metadata:
+            return metadata["mmap_mode"]
+        # Arrays of python objects are pickled and cannot be memory-mapped.
+        if metadata.get("allow_pickle", False) or nbytes < self.MMAP_THRESHOLD_BYTES:
+            return None
+        return "c"
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[np.ndarray]) -> np.ndarray:
         try:
@@ -67,17 +98,51 @@ class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
             raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
         expected_python_type, metadata = extract_metadata(expected_python_type)
+        allow_pickle = metadata.get("allow_pickle", False)
 
         local_path = ctx.file_access.get_random_local_path()
+        if lv.scalar.blob.metadata.type.dimensionality == _core_types.BlobType.BlobDimensionality.MULTIPART:
+            ctx.file_access.get_data(uri, local_path, is_multipart=True)
+            return self._load_shards(ctx, local_path, metadata)
+
         ctx.file_access.get_data(uri, local_path, is_multipart=False)
 
         # load numpy array from a file
         return np.load(
             file=local_path,
-            allow_pickle=metadata.get("allow_pickle", False),
-            mmap_mode=metadata.get("mmap_mode"),  # type: ignore
+            allow_pickle=allow_pickle,
+            mmap_mode=self._mmap_mode(metadata, os.path.getsize(local_path)),  # type: ignore
         )
 
+    def _load_shards(self, ctx: FlyteContext, local_dir: str, metadata: Dict[str, typing.Any]) -> np.ndarray:
+        allow_pickle = metadata.get("allow_pickle", False)
+        paths = sorted(os.path.join(local_dir, f) for f in os.listdir(local_dir) if f.endswith(".npy"))
+        if not paths:
+            raise TypeTransformerFailedError(f"No array shards found in {local_dir}")
+        # Only the headers are read here, the data is copied into the result below.
+        shards = [np.load(p, allow_pickle=allow_pickle, mmap_mode=None if allow_pickle else "r") for p in paths]
+        shape = (sum(len(s) for s in shards), *shards[0].shape[1:])
+        dtype = shards[0].dtype
+        mmap_mode = self._mmap_mode(metadata, int(np.prod(shape)) * dtype.itemsize)
+
+        local_path = f"{local_dir}.npy"
+        if mmap_mode is None or dtype.hasobject:
+            result = np.empty(shape, dtype=dtype)
+        else:
+            result = np.lib.format.open_memmap(local_path, mode="w+", dtype=dtype, shape=shape)
+
+        offsets = np.cumsum([0] + [len(s) for s in shards])
+
+        def _copy(shard: np.ndarray, start: int):
+            result[start : start + len(shard)] = shard
+
+        map_concurrently(ctx, _copy, list(zip(shards, offsets)))
+        if not isinstance(result, np.memmap):
+            return result
+        result.flush()
+        del result
+        return np.load(local_path, mmap_mode=mmap_mode)  # type: ignore
+
     def guess_python_type(self, literal_type: LiteralType) -> typing.Type[np.ndarray]:
         if (
             literal_type.blob is not None
@@ -1,4 +1,7 @@
-import os
+import contextlib
+import gzip
+import pickle
+import struct
 import typing
 from typing import Type
 
@@ -54,27 +57,98 @@ class FlytePickle(typing.Generic[T]):
     @classmethod
     def to_pickle(cls, python_val: typing.Any) -> str:
         ctx = FlyteContextManager.current_context()
-        local_dir = ctx.file_access.get_random_local_directory()
-        os.makedirs(local_dir, exist_ok=True)
-        local_path = ctx.file_access.get_random_local_path()
-        uri = os.path.join(local_dir, local_path)
-        with open(uri, "w+b") as outfile:
-            cloudpickle.dump(python_val, outfile)
-
-        return ctx.file_access.put_raw_data(uri)
+        data_config = ctx.file_access.data_config
+        uri = ctx.file_access.get_random_remote_path()
+        fs = ctx.file_access.get_filesystem_for_path(uri)
+        # The pickle is streamed to the destination, there is no local copy of it.
+        with fs.open(uri, "wb") as outfile:
+            if data_config.pickle_compression or data_config.pickle_out_of_band_buffers:
+                _dump_container(
+                    python_val, outfile, data_config.pickle_compression, data_config.pickle_out_of_band_buffers
+                )
+            else:
+                cloudpickle.dump(python_val, outfile)
+        return uri
 
     @classmethod
     def from_pickle(cls, uri: str) -> typing.Any:
         ctx = FlyteContextManager.current_context()
-        # Deserialize the pickle, and return data in the pickle,
-        # and download pickle file to local first if file is not in the local file systems.
-        if ctx.file_access.is_remote(uri):
-            local_path = ctx.file_access.get_random_local_path()
-            ctx.file_access.get_data(uri, local_path, False)
-            uri = local_path
-        with open(uri, "rb") as infile:
-            data = cloudpickle.load(infile)
-        return data
+        fs = ctx.file_access.get_filesystem_for_path(uri)
+        with fs.open(uri, "rb") as infile:
+            if infile.read(len(_CONTAINER_MAGIC)) == _CONTAINER_MAGIC:
+                return _load_container(infile)
+            infile.seek(0)
+            return cloudpickle.load(infile)
+
+
+# Pickles written with compression or out-of-band buffers are wrapped in a small container:
+#   magic, version, compression, then (compressed) pickle length, buffer count, pickle, and length-prefixed buffers.
+# Plain pickles always start with the PROTO opcode (0x80), so both can be told apart when reading.
+_CONTAINER_MAGIC = b"FLYTEPKL"
+_CONTAINER_VERSION = 1
+_COMPRESSIONS = ["", "gzip", "lz4", "zstd"]
+
+
+def _compression_stream(compression: str, f: typing.BinaryIO, mode: str) -> typing.ContextManager[typing.BinaryIO]:
+    if compression == "":
+        return contextlib.nullcontext(f)
+    if compression == "gzip":
+        # GzipFile is a binary stream, typeshed only types its __enter__ as returning a GzipFile.
+        return typing.cast(typing.ContextManager[typing.BinaryIO], gzip.GzipFile(fileobj=f, mode=mode))
+    if compression == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ImportError("Pickle compression lz4 requires the lz4 package to be installed.") from e
+        return lz4.frame.LZ4FrameFile(f, mode=mode)
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("Pickle compression zstd requires the zstandard package to be installed.") from e
+    if mode == "wb":
+        return zstandard.ZstdCompressor().stream_writer(f, closefd=False)
+    return zstandard.ZstdDecompressor().stream_reader(f, closefd=False)
+
+
+def _read_exact(f: typing.BinaryIO, n: int) -> bytearray:
+    buf = bytearray(n)
+    view = memoryview(buf)
+    pos = 0
+    while pos < n:
+        read = f.readinto(view[pos:])  # type: ignore
+        if not read:
+            raise EOFError(f"Pickle ended after {pos} of {n} bytes")
+        pos += read
+    return buf
+
+
+def _dump_container(python_val: typing.Any, f: typing.BinaryIO, compression: typing.Optional[str], oob: bool):
+    compression = compression or ""
+    if compression not in _COMPRESSIONS:
+        raise ValueError(f"Unsupported pickle compression {compression}, expected one of {_COMPRESSIONS[1:]}")
+    buffers: typing.List[pickle.PickleBuffer] = []
+    data = cloudpickle.dumps(python_val, protocol=5, buffer_callback=buffers.append if oob else None)
+    f.write(_CONTAINER_MAGIC + bytes([_CONTAINER_VERSION, _COMPRESSIONS.index(compression)]))
+    with _compression_stream(compression, f, "wb") as out:
+        out.write(struct.pack("<QQ", len(data), len(buffers)))
+        out.write(data)
+        for b in buffers:
+            # raw() is a view on the memory of the pickled object, e.g. a numpy array, it is not copied.
+            raw = b.raw()
+            out.write(struct.pack("<Q", raw.nbytes))
+            out.write(raw)
+
+
+def _load_container(f: typing.BinaryIO) -> typing.Any:
+    version, compression = _read_exact(f, 2)
+    if version != _CONTAINER_VERSION:
+        raise ValueError(f"Unsupported pickle container version {version}, upgrade flytekit to read it")
+    with _compression_stream(_COMPRESSIONS[compression], f, "rb") as inp:
+        data_len, num_buffers = struct.unpack("<QQ", _read_exact(inp, 16))
+        data = _read_exact(inp, data_len)
+        # The buffers are read into writable memory that the unpickled objects are built on top of.
+        buffers = [_read_exact(inp, struct.unpack("<Q", _read_exact(inp, 8))[0]) for _ in range(num_buffers)]
+    return cloudpickle.loads(data, buffers=buffers)
 
 
 class FlytePickleTransformer(TypeTransformer[FlytePickle]):
@@ -44,10 +44,15 @@ def register_pandas_handlers():
 def register_arrow_handlers():
     import pyarrow as pa
 
-    from .basic_dfs import ArrowToParquetEncodingHandler, ParquetToArrowDecodingHandler
+    from .basic_dfs import (
+        ArrowToParquetEncodingHandler,
+        GeneratorToParquetEncodingHandler,
+        ParquetToArrowDecodingHandler,
+    )
 
     StructuredDatasetTransformerEngine.register(ArrowToParquetEncodingHandler(), default_format_for_type=True)
     StructuredDatasetTransformerEngine.register(ParquetToArrowDecodingHandler(), default_format_for_type=True)
+    StructuredDatasetTransformerEngine.register(GeneratorToParquetEncodingHandler(), default_format_for_type=True)
     StructuredDatasetTransformerEngine.register_renderer(pa.Table, ArrowRenderer())
 
 
@@ -1,5 +1,7 @@
 import os
+import types
 import typing
+from concurrent.futures import Future, wait
 from pathlib import Path
 from typing import TypeVar
 
@@ -9,13 +11,15 @@ from fsspec.utils import get_protocol
 
 from flytekit import FlyteContext, lazy_module, logger
 from flytekit.configuration import DataConfig
-from flytekit.core.data_persistence import get_fsspec_storage_options
+from flytekit.core.data_persistence import get_fsspec_storage_options, submit_transfer
+from flytekit.core.type_engine import map_concurrently
 from flytekit.models import literals
 from flytekit.models.literals import StructuredDatasetMetadata
-from flytekit.models.types import StructuredDatasetType
+from flytekit.models.types import SimpleType, StructuredDatasetType
 from flytekit.types.structured.structured_dataset import (
     CSV,
     PARQUET,
+    Filters,
     StructuredDataset,
     StructuredDatasetDecoder,
     StructuredDatasetEncoder,
@@ -43,6 +47,88 @@ def get_pandas_storage_options(
     return None
 
 
+def get_parquet_rows_per_file(num_rows: int, nbytes: int, data_config: DataConfig) -> int:
+    """
+    Returns how many rows to write to each parquet file, according to ``DataConfig.parquet_rows_per_file`` and
+    ``DataConfig.parquet_bytes_per_file``. A dataframe is written as a single file if neither is set.
+    """
+    rows = data_config.parquet_rows_per_file or num_rows
+    if data_config.parquet_bytes_per_file and nbytes > 0:
+        rows = min(rows, data_config.parquet_bytes_per_file * num_rows // nbytes)
+    return max(rows, 1)
+
+
+def write_parquet_files(ctx: FlyteContext, uri: str, num_rows: int, rows_per_file: int, write: typing.Callable):
+    """
+    Calls ``write(path, offset, length)`` for every part of ``rows_per_file`` rows of a dataframe with ``num_rows``
+    rows, concurrently. The parts are named ``00000``, ``00001``, ... under ``uri``, so that reading the directory
+    returns the rows in their original order.
+    """
+    offsets = range(0, num_rows, rows_per_file) if num_rows > rows_per_file else range(1)
+    map_concurrently(
+        ctx, write, [(os.path.join(uri, f"{i:05}"), offset, rows_per_file) for i, offset in enumerate(offsets)]
+    )
+
+
+def _parquet_dataset(
+    ctx: FlyteContext, uri: str, filters: typing.Optional[Filters], anonymous: bool = False
+) -> typing.Tuple["pa.dataset.Dataset", typing.Optional["pa.compute.Expression"]]:
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    filesystem = ctx.file_access.get_filesystem_for_path(uri, anonymous=anonymous)
+    dataset = ds.dataset(strip_protocol(uri), filesystem=filesystem, format="parquet")
+    if filters is not None and not isinstance(filters, pc.Expression):
+        filters = pq.filters_to_expression(filters)
+    return dataset, filters
+
+
+def read_parquet_table(
+    ctx: FlyteContext,
+    uri: str,
+    columns: typing.Optional[typing.List[str]],
+    filters: typing.Optional[Filters],
+    limit: typing.Optional[int],
+    anonymous: bool = False,
+) -> "pa.Table":
+    """
+    Reads the parquet files under ``uri`` with a pyarrow dataset scan. Row groups whose statistics rule out the
+    ``filters`` are skipped without being downloaded, and the scan stops once ``limit`` rows have been read.
+    """
+    dataset, expression = _parquet_dataset(ctx, uri, filters, anonymous)
+    if limit is not None:
+        return dataset.head(limit, columns=columns, filter=expression)
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def iter_parquet_batches(
+    ctx: FlyteContext,
+    uri: str,
+    columns: typing.Optional[typing.List[str]],
+    filters: typing.Optional[Filters],
+    limit: typing.Optional[int],
+) -> typing.Generator["pa.RecordBatch", None, None]:
+    """
+    Streams the record batches of the parquet files under ``uri``, one file at a time and reading ahead a single
+    batch, so that memory use is bounded by the batch size instead of the size of the dataset.
+    """
+    try:
+        dataset, expression = _parquet_dataset(ctx, uri, filters)
+    except NoCredentialsError:
+        logger.debug("S3 source detected, attempting anonymous S3 access")
+        dataset, expression = _parquet_dataset(ctx, uri, filters, anonymous=True)
+    remaining = limit
+    for batch in dataset.to_batches(columns=columns, filter=expression, batch_readahead=1, fragment_readahead=1):
+        if remaining is not None:
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+        if batch.num_rows > 0:
+            yield batch
+        if remaining == 0:
+            return
+
+
 class PandasToCSVEncodingHandler(StructuredDatasetEncoder):
     def __init__(self):
         super().__init__(pd.DataFrame, None, CSV)
@@ -106,14 +192,22 @@ class PandasToParquetEncodingHandler(StructuredDatasetEncoder):
         )
         if not ctx.file_access.is_remote(uri):
             Path(uri).mkdir(parents=True, exist_ok=True)
-        path = os.path.join(uri, f"{0:05}")
         df = typing.cast(pd.DataFrame, structured_dataset.dataframe)
-        df.to_parquet(
-            path,
-            coerce_timestamps="us",
-            allow_truncated_timestamps=False,
-            storage_options=get_pandas_storage_options(uri=path, data_config=ctx.file_access.data_config),
-        )
+        data_config = ctx.file_access.data_config
+        rows_per_file = len(df)
+        if data_config.parquet_rows_per_file or data_config.parquet_bytes_per_file:
+            rows_per_file = get_parquet_rows_per_file(len(df), int(df.memory_usage(deep=True).sum()), data_config)
+
+        def _write(path: str, offset: int, length: int):
+            part = df if length >= len(df) else df.iloc[offset : offset + length]
+            part.to_parquet(
+                path,
+                coerce_timestamps="us",
+                allow_truncated_timestamps=False,
+                storage_options=get_pandas_storage_options(uri=path, data_config=data_config),
+            )
+
+        write_parquet_files(ctx, uri, len(df), rows_per_file, _write)
         structured_dataset_type.format = PARQUET
         return literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
@@ -127,12 +221,20 @@ class ParquetToPandasDecodingHandler(StructuredDatasetDecoder):
         ctx: FlyteContext,
         flyte_value: literals.StructuredDataset,
         current_task_metadata: StructuredDatasetMetadata,
+        filters: typing.Optional[Filters] = None,
+        limit: typing.Optional[int] = None,
     ) -> "pd.DataFrame":
         uri = flyte_value.uri
         columns = None
         kwargs = get_pandas_storage_options(uri=uri, data_config=ctx.file_access.data_config)
         if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
             columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+        if filters is not None or limit is not None:
+            try:
+                return read_parquet_table(ctx, uri, columns, filters, limit).to_pandas()
+            except NoCredentialsError:
+                logger.debug("S3 source detected, attempting anonymous S3 access")
+                return read_parquet_table(ctx, uri, columns, filters, limit, anonymous=True).to_pandas()
         try:
             return pd.read_parquet(uri, columns=columns, storage_options=kwargs)
         except NoCredentialsError:
@@ -140,6 +242,20 @@ class ParquetToPandasDecodingHandler(StructuredDatasetDecoder):
             kwargs = get_pandas_storage_options(uri=uri, data_config=ctx.file_access.data_config, anonymous=True)
             return pd.read_parquet(uri, columns=columns, storage_options=kwargs)
 
+    def iter_decode(
+        self,
+        ctx: FlyteContext,
+        flyte_value: literals.StructuredDataset,
+        current_task_metadata: StructuredDatasetMetadata,
+        filters: typing.Optional[Filters] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Generator["pd.DataFrame", None, None]:
+        columns = None
+        if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
+            columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+        for batch in iter_parquet_batches(ctx, flyte_value.uri, columns, filters, limit):
+            yield batch.to_pandas()
+
 
 class ArrowToParquetEncodingHandler(StructuredDatasetEncoder):
     def __init__(self):
@@ -158,9 +274,17 @@ class ArrowToParquetEncodingHandler(StructuredDatasetEncoder):
         )
         if not ctx.file_access.is_remote(uri):
             Path(uri).mkdir(parents=True, exist_ok=True)
-        path = os.path.join(uri, f"{0:05}")
-        filesystem = ctx.file_access.get_filesystem_for_path(path)
-        pq.write_table(structured_dataset.dataframe, strip_protocol(path), filesystem=filesystem)
+        table = typing.cast(pa.Table, structured_dataset.dataframe)
+        filesystem = ctx.file_access.get_filesystem_for_path(uri)
+        data_config = ctx.file_access.data_config
+        rows_per_file = table.num_rows
+        if data_config.parquet_rows_per_file or data_config.parquet_bytes_per_file:
+            rows_per_file = get_parquet_rows_per_file(table.num_rows, table.nbytes, data_config)
+
+        def _write(path: str, offset: int, length: int):
+            pq.write_table(table.slice(offset, length), strip_protocol(path), filesystem=filesystem)
+
+        write_parquet_files(ctx, uri, table.num_rows, rows_per_file, _write)
         return literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(structured_dataset_type))
 
 
@@ -173,6 +297,8 @@ class ParquetToArrowDecodingHandler(StructuredDatasetDecoder):
         ctx: FlyteContext,
         flyte_value: literals.StructuredDataset,
         current_task_metadata: StructuredDatasetMetadata,
+        filters: typing.Optional[Filters] = None,
+        limit: typing.Optional[int] = None,
     ) -> "pa.Table":
         import pyarrow.parquet as pq
 
@@ -184,6 +310,12 @@ class ParquetToArrowDecodingHandler(StructuredDatasetDecoder):
         columns = None
         if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
             columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+        if filters is not None or limit is not None:
+            try:
+                return read_parquet_table(ctx, uri, columns, filters, limit)
+            except NoCredentialsError:
+                logger.debug("S3 source detected, attempting anonymous S3 access")
+                return read_parquet_table(ctx, uri, columns, filters, limit, anonymous=True)
         try:
             return pq.read_table(path, columns=columns)
         except NoCredentialsError as e:
@@ -192,3 +324,104 @@ class ParquetToArrowDecodingHandler(StructuredDatasetDecoder):
             if fs is not None:
                 return pq.read_table(path, filesystem=fs, columns=columns)
             raise e
+
+    def iter_decode(
+        self,
+        ctx: FlyteContext,
+        flyte_value: literals.StructuredDataset,
+        current_task_metadata: StructuredDatasetMetadata,
+        filters: typing.Optional[Filters] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Generator["pa.Table", None, None]:
+        columns = None
+        if current_task_metadata.structured_dataset_type and current_task_metadata.structured_dataset_type.columns:
+            columns = [c.name for c in current_task_metadata.structured_dataset_type.columns]
+        for batch in iter_parquet_batches(ctx, flyte_value.uri, columns, filters, limit):
+            yield pa.Table.from_batches([batch])
+
+
+def _empty_table(structured_dataset_type: StructuredDatasetType) -> "pa.Table":
+    arrow_types = {
+        SimpleType.INTEGER: pa.int64(),
+        SimpleType.FLOAT: pa.float64(),
+        SimpleType.STRING: pa.string(),
+        SimpleType.BOOLEAN: pa.bool_(),
+        SimpleType.DATETIME: pa.timestamp("ns"),
+        SimpleType.DURATION: pa.duration("ns"),
+    }
+    columns = structured_dataset_type.columns
+    unsupported = [c.name for c in columns if c.literal_type.simple not in arrow_types]
+    if not columns or unsupported:
+        raise ValueError(
+            "Cannot write an empty generator of frames without the types of its columns, declare them with "
+            "Annotated[StructuredDataset, kwtypes(...)] using int, float, str, bool, datetime or timedelta columns"
+            + (f", got unsupported columns {unsupported}" if unsupported else "")
+        )
+    return pa.schema([(c.name, arrow_types[c.literal_type.simple]) for c in columns]).empty_table()
+
+
+class GeneratorToParquetEncodingHandler(StructuredDatasetEncoder):
+    """
+    Writes a generator of pandas DataFrames, arrow Tables or arrow RecordBatches to parquet, one file per frame, so
+    that a dataset larger than memory can be produced piece by piece. A frame is written in the background while the
+    generator produces the next one. An empty generator is written as one empty file with the columns declared in the
+    type of the dataset.
+
+    .. code-block:: python
+
+        @task
+        def t1() -> StructuredDataset:
+            def frames():
+                for chunk in range(1000):
+                    yield pd.DataFrame(...)
+
+            return StructuredDataset(dataframe=frames())
+    """
+
+    def __init__(self):
+        super().__init__(types.GeneratorType, None, PARQUET)
+
+    def encode(
+        self,
+        ctx: FlyteContext,
+        structured_dataset: StructuredDataset,
+        structured_dataset_type: StructuredDatasetType,
+    ) -> literals.StructuredDataset:
+        import pyarrow.parquet as pq
+
+        uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.join(
+            ctx.file_access.raw_output_prefix, ctx.file_access.get_random_string()
+        )
+        if not ctx.file_access.is_remote(uri):
+            Path(uri).mkdir(parents=True, exist_ok=True)
+        filesystem = ctx.file_access.get_filesystem_for_path(uri)
+
+        def _write(path: str, frame: typing.Any):
+            if isinstance(frame, pd.DataFrame):
+                frame = pa.Table.from_pandas(frame)
+            elif isinstance(frame, pa.RecordBatch):
+                frame = pa.Table.from_batches([frame])
+            elif not isinstance(frame, pa.Table):
+                raise TypeError(f"Expected a pandas DataFrame, an arrow Table or RecordBatch, got {type(frame)}")
+            pq.write_table(frame, strip_protocol(path), filesystem=filesystem)
+
+        # At most one frame is being written, on the shared transfer pool, while the next one is produced.
+        workers = ctx.file_access.data_config.transfer_concurrency
+        pending: typing.Optional[Future] = None
+        try:
+            for i, frame in enumerate(typing.cast(typing.Generator, structured_dataset.dataframe)):
+                if pending is not None:
+                    pending.result()
+                pending = submit_transfer(workers, _write, os.path.join(uri, f"{i:05}"), frame)
+        finally:
+            # Do not leave a write running in the background if the generator fails.
+            if pending is not None:
+                wait([pending])
+        if pending is not None:
+            pending.result()
+        else:
+            # A dataset without any file cannot be read back, so an empty generator is written as a single empty file
+            # with the declared columns.
+            _write(os.path.join(uri, "00000"), _empty_table(structured_dataset_type))
+        structured_dataset_type.format = PARQUET
+        return literals.StructuredDataset(uri=uri, metadata=StructuredDatasetMetadata(structured_dataset_type))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import inspect
 import types
 import typing
 from abc import ABC, abstractmethod
@@ -27,6 +28,7 @@ from flytekit.models.types import LiteralType, SchemaType, StructuredDatasetType
 if typing.TYPE_CHECKING:
     import pandas as pd
     import pyarrow as pa
+    import pyarrow.compute as pc
 else:
     pd = lazy_module("pandas")
     pa = lazy_module("pyarrow")
@@ -43,6 +45,9 @@ CSV: StructuredDatasetFormat = "csv"
 GENERIC_FORMAT: StructuredDatasetFormat = ""
 GENERIC_PROTOCOL: str = "generic protocol"
 
+# Row filters that can be pushed down to the decoders, see StructuredDataset.open
+Filters: TypeAlias = typing.Union["pc.Expression", typing.List[typing.Tuple], typing.List[typing.List[typing.Tuple]]]
+
 
 @dataclass
 class StructuredDataset(DataClassJSONMixin):
@@ -81,6 +86,8 @@ class StructuredDataset(DataClassJSONMixin):
         self._literal_sd: Optional[literals.StructuredDataset] = None
         # Not meant for users to set, will be set by an open() call
         self._dataframe_type: Optional[DF] = None  # type: ignore
+        self._filters: Optional[Filters] = None
+        self._limit: Optional[int] = None
         self._already_uploaded = False
 
     @property
@@ -95,22 +102,48 @@ class StructuredDataset(DataClassJSONMixin):
     def literal(self) -> Optional[literals.StructuredDataset]:
         return self._literal_sd
 
-    def open(self, dataframe_type: Type[DF]):
+    def open(self, dataframe_type: Type[DF], filters: Optional[Filters] = None, limit: Optional[int] = None):
+        """
+        Sets the dataframe type that :py:meth:`all` and :py:meth:`iter` return. For formats that support it (e.g.
+        parquet), ``filters`` and ``limit`` are pushed down to the reader, so that only the matching rows are
+        downloaded and decoded:
+
+        .. code-block:: python
+
+            import pyarrow.compute as pc
+
+            df = sd.open(pd.DataFrame, filters=pc.field("year") == 2023, limit=1000).all()
+            df = sd.open(pd.DataFrame, filters=[("year", "=", 2023)]).all()
+
+        :param dataframe_type: The dataframe type to decode to.
+        :param filters: Rows that do not match are not returned. Either a ``pyarrow.compute.Expression`` or filters
+            in the disjunctive normal form accepted by ``pyarrow.parquet.read_table``.
+        :param limit: The maximum number of rows to return.
+        """
         self._dataframe_type = dataframe_type
+        self._filters = filters
+        self._limit = limit
         return self
 
     def all(self) -> DF:  # type: ignore
         if self._dataframe_type is None:
             raise ValueError("No dataframe type set. Use open() to set the local dataframe type you want to use.")
         ctx = FlyteContextManager.current_context()
-        return flyte_dataset_transformer.open_as(ctx, self.literal, self._dataframe_type, self.metadata)
+        return flyte_dataset_transformer.open_as(
+            ctx, self.literal, self._dataframe_type, self.metadata, filters=self._filters, limit=self._limit
+        )
 
     def iter(self) -> Generator[DF, None, None]:
         if self._dataframe_type is None:
             raise ValueError("No dataframe type set. Use open() to set the local dataframe type you want to use.")
         ctx = FlyteContextManager.current_context()
         return flyte_dataset_transformer.iter_as(
-            ctx, self.literal, self._dataframe_type, updated_metadata=self.metadata
+            ctx,
+            self.literal,
+            self._dataframe_type,
+            updated_metadata=self.metadata,
+            filters=self._filters,
+            limit=self._limit,
         )
 
 
@@ -274,9 +307,25 @@ class StructuredDatasetDecoder(ABC):
          executing task. This type may have more or less information than the type information bundled inside the incoming flyte_value.
         :return: This function can either return an instance of the dataframe that this decoder handles, or an iterator
           of those dataframes.
+
+        Decoders that can filter rows while reading should also accept the keyword arguments ``filters`` and
+        ``limit``, see :py:meth:`StructuredDataset.open`. They are only passed if the user set them.
         """
         raise NotImplementedError
 
+    def iter_decode(
+        self,
+        ctx: FlyteContext,
+        flyte_value: literals.StructuredDataset,
+        current_task_metadata: StructuredDatasetMetadata,
+    ) -> typing.Iterator[DF]:
+        """
+        This is called by :py:meth:`StructuredDataset.iter` to read the dataset as a stream of smaller dataframes.
+        Override it to decode the dataset incrementally, so that it never has to fit in memory as a whole. By default,
+        this expects ``decode`` to return an iterator. Like ``decode``, this may accept ``filters`` and ``limit``.
+        """
+        return self.decode(ctx, flyte_value, current_task_metadata)  # type: ignore
+
 
 def convert_schema_type_to_structured_dataset_type(
     column_type: int,
@@ -341,9 +390,28 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
 
     Handlers = Union[StructuredDatasetEncoder, StructuredDatasetDecoder]
     Renderers: Dict[Type, Renderable] = {}
+    # Memoizes the handler resolved for (handler map, dataframe type, protocol, format), so that encoding or decoding
+    # every element of a list of datasets does not walk the fallbacks again. Invalidated whenever a handler is
+    # registered.
+    _HANDLER_CACHE: Dict[typing.Tuple[int, Type, str, str], Handlers] = {}
 
     @classmethod
     def _finder(cls, handler_map, df_type: Type, protocol: str, format: str):
+        key = (id(handler_map), df_type, protocol, format)
+        try:
+            return cls._HANDLER_CACHE[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # The dataframe type is not hashable, it cannot be memoized.
+            return cls._find_handler(handler_map, df_type, protocol, format)
+
+        handler = cls._find_handler(handler_map, df_type, protocol, format)
+        cls._HANDLER_CACHE[key] = handler
+        return handler
+
+    @classmethod
+    def _find_handler(cls, handler_map, df_type: Type, protocol: str, format: str):
         # If there's an exact match, then we should use it.
         try:
             return handler_map[df_type][protocol][format]
@@ -513,6 +581,9 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
                 logger.debug(f"Using storage {protocol} for dataframes of type {h.python_type} from handler {h}")
                 cls.DEFAULT_PROTOCOLS[h.python_type] = protocol
 
+        # The new handler or defaults may change how lookups resolve.
+        cls._HANDLER_CACHE.clear()
+
         # Register with the type engine as well
         # The semantics as of now are such that it doesn't matter which order these transformers are loaded in, as
         # long as the older Pandas/FlyteSchema transformer do not also specify the override
@@ -782,20 +853,26 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         sd: literals.StructuredDataset,
         df_type: Type[DF],
         updated_metadata: StructuredDatasetMetadata,
+        filters: Optional[Filters] = None,
+        limit: Optional[int] = None,
     ) -> DF:
         """
         :param ctx: A FlyteContext, useful in accessing the filesystem and other attributes
         :param sd:
         :param df_type:
         :param updated_metadata: New metadata type, since it might be different from the metadata in the literal.
+        :param filters: Optional row filters to push down to the decoder, see :py:meth:`StructuredDataset.open`.
+        :param limit: Optional maximum number of rows to return.
         :return: dataframe. It could be pandas dataframe or arrow table, etc.
         """
         protocol = get_protocol(sd.uri)
         decoder = self.get_decoder(df_type, protocol, sd.metadata.structured_dataset_type.format)
-        result = decoder.decode(ctx, sd, updated_metadata)
+        result: Union[DF, typing.Iterator[DF]] = self._decode(
+            decoder, decoder.decode, ctx, sd, updated_metadata, filters, limit
+        )
         if isinstance(result, types.GeneratorType):
             raise ValueError(f"Decoder {decoder} returned iterator {result} but whole value requested from {sd}")
-        return result
+        return typing.cast(DF, result)
 
     def iter_as(
         self,
@@ -803,14 +880,35 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         sd: literals.StructuredDataset,
         df_type: Type[DF],
         updated_metadata: StructuredDatasetMetadata,
+        filters: Optional[Filters] = None,
+        limit: Optional[int] = None,
     ) -> typing.Iterator[DF]:
         protocol = get_protocol(sd.uri)
-        decoder = self.DECODERS[df_type][protocol][sd.metadata.structured_dataset_type.format]
-        result: Union[DF, typing.Iterator[DF]] = decoder.decode(ctx, sd, updated_metadata)
+        decoder = self.get_decoder(df_type, protocol, sd.metadata.structured_dataset_type.format)
+        result: Union[DF, typing.Iterator[DF]] = self._decode(
+            decoder, decoder.iter_decode, ctx, sd, updated_metadata, filters, limit
+        )
         if not isinstance(result, types.GeneratorType):
             raise ValueError(f"Decoder {decoder} didn't return iterator {result} but should have from {sd}")
         return result
 
+    @staticmethod
+    def _decode(
+        decoder: StructuredDatasetDecoder,
+        decode: typing.Callable,
+        ctx: FlyteContext,
+        sd: literals.StructuredDataset,
+        updated_metadata: StructuredDatasetMetadata,
+        filters: Optional[Filters],
+        limit: Optional[int],
+    ) -> Union[DF, typing.Iterator[DF]]:
+        if filters is None and limit is None:
+            return decode(ctx, sd, updated_metadata)
+        params = inspect.signature(decode).parameters
+        if "filters" not in params or "limit" not in params:
+            raise ValueError(f"Decoder {decoder} does not support filtering rows, open the dataset without filters")
+        return decode(ctx, sd, updated_metadata, filters=filters, limit=limit)
+
     def _get_dataset_column_literal_type(self, t: Type) -> type_models.LiteralType:
         if t in get_supported_types():
             return get_supported_types()[t]
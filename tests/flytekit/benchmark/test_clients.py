@@ -0,0 +1,87 @@
+"""
+Micro-benchmarks for the Admin clients. These are not run as part of the unit tests, use ``make benchmark``.
+"""
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+from flyteidl.admin import execution_pb2
+from flyteidl.service import admin_pb2_grpc
+from mock import MagicMock, patch
+
+from flytekit.clients.aio import AsynchronousFlyteClient
+from flytekit.clients.friendly import SynchronousFlyteClient
+from flytekit.configuration import PlatformConfig
+from flytekit.models.core.identifier import WorkflowExecutionIdentifier
+
+N = 4_000
+# The time Admin takes to answer a call, so that the clients are measured on how many calls they keep in flight.
+LATENCY = 0.05
+
+
+class _AdminService(admin_pb2_grpc.AdminServiceServicer):
+    async def GetExecution(self, request, context):
+        await asyncio.sleep(LATENCY)
+        return execution_pb2.Execution(id=request.id)
+
+
+def _serve(ports: multiprocessing.Queue):
+    async def serve():
+        server = grpc.aio.server()
+        admin_pb2_grpc.add_AdminServiceServicer_to_server(_AdminService(), server)
+        ports.put(server.add_insecure_port("localhost:0"))
+        await server.start()
+        await server.wait_for_termination()
+
+    asyncio.run(serve())
+
+
+def _with_threads(cfg: PlatformConfig, ids: list, concurrency: int) -> float:
+    client = SynchronousFlyteClient(cfg)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(client.get_execution, ids[:concurrency]))
+        start = time.perf_counter()
+        list(pool.map(client.get_execution, ids))
+        return time.perf_counter() - start
+
+
+def _with_asyncio(cfg: PlatformConfig, ids: list, concurrency: int) -> float:
+    async def fetch_all() -> float:
+        async with AsynchronousFlyteClient(cfg) as client:
+            limit = asyncio.Semaphore(concurrency)
+
+            async def get(id):
+                async with limit:
+                    return await client.get_execution(id)
+
+            await asyncio.gather(*(get(i) for i in ids[:concurrency]))
+            start = time.perf_counter()
+            await asyncio.gather(*(get(i) for i in ids))
+            return time.perf_counter() - start
+
+    return asyncio.run(fetch_all())
+
+
+def test_get_execution_concurrency():
+    # The stub server runs in its own process, so that it does not compete with the clients for the GIL.
+    ports: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(ports,), daemon=True)
+    server.start()
+    cfg = PlatformConfig(endpoint=f"localhost:{ports.get(timeout=30)}", insecure=True)
+    ids = [WorkflowExecutionIdentifier("p", "d", f"e{i}") for i in range(N)]
+
+    authenticator = MagicMock()
+    authenticator.fetch_grpc_call_auth_metadata.return_value = None
+    try:
+        with patch("flytekit.clients.auth_helper.get_authenticator", return_value=authenticator):
+            for concurrency in (16, 128, 1024):
+                sync = _with_threads(cfg, ids, concurrency)
+                aio = _with_asyncio(cfg, ids, concurrency)
+                print(
+                    f"\nget_execution x{N} at concurrency {concurrency}: {N / sync:.0f} calls/s with "
+                    f"{concurrency} threads -> {N / aio:.0f} calls/s with asyncio ({sync / aio:.1f}x)"
+                )
+    finally:
+        server.kill()
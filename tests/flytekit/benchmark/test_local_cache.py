@@ -0,0 +1,67 @@
+"""
+Micro-benchmarks for the LocalTaskCache. These are not run as part of the unit tests, use ``make benchmark``.
+"""
+import timeit
+import typing
+
+import joblib
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.local_cache import _calculate_cache_key
+from flytekit.core.type_engine import TypeEngine
+from flytekit.models.literals import Literal, LiteralCollection, LiteralMap
+
+
+def _recursive_hash_placement(literal: Literal) -> Literal:
+    if literal.hash is not None:
+        return Literal(hash=literal.hash)
+    elif literal.collection is not None:
+        literals = [_recursive_hash_placement(lit) for lit in literal.collection.literals]
+        return Literal(collection=LiteralCollection(literals=literals))
+    elif literal.map is not None:
+        literal_map = {}
+        for key, literal_value in literal.map.literals.items():
+            literal_map[key] = _recursive_hash_placement(literal_value)
+        return Literal(map=LiteralMap(literal_map))
+    else:
+        return literal
+
+
+def _joblib_cache_key(task_name: str, cache_version: str, input_literal_map: LiteralMap) -> str:
+    # The cache key as it was computed before it was streamed into a blake2 hash.
+    literal_map_overridden = {}
+    for key, literal in input_literal_map.literals.items():
+        literal_map_overridden[key] = _recursive_hash_placement(literal)
+    hashed_inputs = LiteralMap(literal_map_overridden).to_flyte_idl().SerializeToString(deterministic=True)
+    return f"{task_name}-{cache_version}-{joblib.hash(hashed_inputs)}"
+
+
+def _report(name: str, before: float, after: float):
+    print(f"\n{name}: {before * 1e3:.1f}ms -> {after * 1e3:.1f}ms ({before / after if after else float('inf'):.1f}x)")
+
+
+def test_cache_key_large_nested_collections():
+    ctx = FlyteContextManager.current_context()
+    inputs = {
+        "ints": (typing.List[int], list(range(100_000))),
+        "nested": (
+            typing.List[typing.Dict[str, typing.List[float]]],
+            [{"a": [0.5] * 100, "b": [1.5]} for _ in range(2_000)],
+        ),
+        "strs": (typing.Dict[str, str], {str(i): str(i) * 10 for i in range(10_000)}),
+    }
+    for name, (pt, v) in inputs.items():
+        lt = TypeEngine.to_literal_type(pt)
+        # Hashing the old way materializes every literal, so both ways get their own copy of the inputs.
+        old_lm = LiteralMap(literals={"x": TypeEngine.to_literal(ctx, v, pt, lt)})
+        lm = LiteralMap(literals={"x": TypeEngine.to_literal(ctx, v, pt, lt)})
+        before = timeit.timeit(lambda: _joblib_cache_key("t", "1", old_lm), number=5) / 5
+        after = timeit.timeit(lambda: _calculate_cache_key("t", "1", lm), number=5) / 5
+        _report(f"cache key({name})", before, after)
+
+        # Inputs read from inputs.pb are hashed straight from their IDL.
+        lazy = LiteralMap.from_flyte_idl(lm.to_flyte_idl())
+        old_lazy = LiteralMap.from_flyte_idl(lm.to_flyte_idl())
+        before = timeit.timeit(lambda: _joblib_cache_key("t", "1", old_lazy), number=5) / 5
+        after = timeit.timeit(lambda: _calculate_cache_key("t", "1", lazy), number=5) / 5
+        _report(f"cache key({name}) from IDL", before, after)
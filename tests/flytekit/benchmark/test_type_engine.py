@@ -0,0 +1,161 @@
+"""
+Micro-benchmarks for the TypeEngine. These are not run as part of the unit tests, use ``make benchmark``.
+"""
+import timeit
+import typing
+from dataclasses import dataclass
+
+from dataclasses_json import DataClassJsonMixin
+from google.protobuf import json_format as _json_format
+
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import DataclassTransformer, TypeEngine
+from flytekit.models.literals import Literal, LiteralCollection
+from flytekit.types.file import FlyteFile
+
+N = 10_000
+
+
+@dataclass
+class Point(DataClassJsonMixin):
+    x: int
+    y: int
+
+
+@dataclass
+class Leaf(DataClassJsonMixin):
+    name: str
+    weight: float
+    tags: typing.List[str]
+
+
+@dataclass
+class Level(DataClassJsonMixin):
+    depth: int
+    leaves: typing.List[Leaf]
+    children: typing.Dict[str, "Level"]
+    f: typing.Optional[FlyteFile] = None
+
+
+# Resolve the forward reference, so that the nested levels are walked like any other nested dataclass.
+Level.__dataclass_fields__["children"].type = typing.Dict[str, Level]
+
+
+@dataclass
+class Wide(DataClassJsonMixin):
+    counts: typing.Dict[str, int]
+    names: typing.List[str]
+    leaves: typing.List[Leaf]
+    files: typing.List[FlyteFile]
+
+
+def _report(name: str, before: float, after: float, n: int = N):
+    print(
+        f"\n{name}: {before / n * 1e6:.2f}us -> {after / n * 1e6:.2f}us per element "
+        f"({before / after if after else float('inf'):.1f}x)"
+    )
+
+
+def test_get_transformer_per_element():
+    for t in [int, typing.List[int], typing.Dict[str, float], Point]:
+        TypeEngine.get_transformer(t)
+        before = timeit.timeit(lambda: TypeEngine._get_transformer(t), number=N)
+        after = timeit.timeit(lambda: TypeEngine.get_transformer(t), number=N)
+        _report(f"get_transformer({t})", before, after)
+
+
+def test_list_round_trip():
+    ctx = FlyteContextManager.current_context()
+    pt = typing.List[int]
+    lt = TypeEngine.to_literal_type(pt)
+    v = list(range(N))
+
+    # Resolving the element transformer on every element is what the ListTransformer did before it was memoized.
+    def uncached_to_literal():
+        for x in v:
+            TypeEngine._to_literal(ctx, x, int, lt.collection_type, TypeEngine._get_transformer(int))
+
+    before = timeit.timeit(uncached_to_literal, number=1)
+    after = timeit.timeit(lambda: TypeEngine.to_literal(ctx, v, pt, lt), number=1)
+    _report("to_literal(List[int])", before, after)
+
+    lv = TypeEngine.to_literal(ctx, v, pt, lt)
+
+    def uncached_to_python_value():
+        for x in lv.collection.literals:
+            TypeEngine._get_transformer(int).to_python_value(ctx, x, int)
+
+    before = timeit.timeit(uncached_to_python_value, number=1)
+    after = timeit.timeit(lambda: TypeEngine.to_python_value(ctx, lv, pt), number=1)
+    _report("to_python_value(List[int])", before, after)
+    assert TypeEngine.to_python_value(ctx, lv, pt) == v
+
+
+def test_list_of_primitives_bulk():
+    ctx = FlyteContextManager.current_context()
+    n = 1_000_000
+    pt = typing.List[int]
+    lt = TypeEngine.to_literal_type(pt)
+    v = list(range(n))
+    transformer = TypeEngine.get_transformer(int)
+
+    # Element-wise conversion, the way it is done for every other element type.
+    def element_wise_to_idl():
+        lits = [TypeEngine._to_literal(ctx, x, int, lt.collection_type, transformer) for x in v]
+        return Literal(collection=LiteralCollection(lits)).to_flyte_idl()
+
+    before = timeit.timeit(element_wise_to_idl, number=1)
+    after = timeit.timeit(lambda: TypeEngine.to_literal(ctx, v, pt, lt).to_flyte_idl(), number=1)
+    _report("to_literal(List[int]) + to_flyte_idl", before, after, n)
+
+    idl = TypeEngine.to_literal(ctx, v, pt, lt).to_flyte_idl()
+
+    def element_wise_from_idl():
+        lits = [Literal.from_flyte_idl(l) for l in idl.collection.literals]
+        return [transformer.to_python_value(ctx, x, int) for x in lits]
+
+    before = timeit.timeit(element_wise_from_idl, number=1)
+    after = timeit.timeit(lambda: TypeEngine.to_python_value(ctx, Literal.from_flyte_idl(idl), pt), number=1)
+    _report("from_flyte_idl + to_python_value(List[int])", before, after, n)
+    assert TypeEngine.to_python_value(ctx, Literal.from_flyte_idl(idl), pt) == v
+
+
+def _deep(depth: int, width: int) -> Level:
+    return Level(
+        depth=depth,
+        leaves=[Leaf(name=f"{depth}-{i}", weight=i / 2, tags=["a", "b"]) for i in range(width)],
+        children={} if depth == 0 else {str(i): _deep(depth - 1, width) for i in range(2)},
+        f=FlyteFile(f"s3://bucket/{depth}.txt"),
+    )
+
+
+def _dataclass_round_trip(name: str, python_type: typing.Type, value: typing.Any):
+    ctx = FlyteContextManager.current_context()
+    tf = DataclassTransformer()
+    lv = tf.to_literal(ctx, value, python_type, tf.get_literal_type(python_type))
+
+    # The separate passes over the whole value, the way to_python_value did it before it used a per type plan.
+    def separate_passes():
+        dc = python_type.from_json(_json_format.MessageToJson(lv.scalar.generic))
+        dc = tf._fix_structured_dataset_type(python_type, dc)
+        return tf._fix_dataclass_int(python_type, tf._deserialize_flyte_type(dc, python_type))
+
+    n = 10
+    before = timeit.timeit(separate_passes, number=n)
+    after = timeit.timeit(lambda: tf.to_python_value(ctx, lv, python_type), number=n)
+    _report(f"to_python_value({name})", before, after, n)
+
+
+def test_deep_dataclass():
+    _dataclass_round_trip("deep dataclass", Level, _deep(8, 8))
+
+
+def test_wide_dataclass():
+    n = 5_000
+    value = Wide(
+        counts={str(i): i for i in range(n)},
+        names=[str(i) for i in range(n)],
+        leaves=[Leaf(name=str(i), weight=i / 2, tags=["a"]) for i in range(n)],
+        files=[FlyteFile(f"s3://bucket/{i}.txt") for i in range(100)],
+    )
+    _dataclass_round_trip("wide dataclass", Wide, value)
@@ -0,0 +1,39 @@
+import pytest
+from click.testing import CliRunner
+
+from flytekit.clis.sdk_in_container import pyflyte
+from flytekit.core.local_cache import LocalTaskCache
+from flytekit.core.task import task
+
+
+@task(cache=True, cache_version="v1")
+def t1(a: int) -> int:
+    return a + 1
+
+
+@pytest.mark.serial
+def test_local_cache_stats():
+    LocalTaskCache.initialize()
+    LocalTaskCache.clear()
+    LocalTaskCache.reset_stats()
+
+    assert t1(a=1) == 2
+    # Start over with an empty memory, so that the second lookup goes to disk.
+    LocalTaskCache.initialize()
+    assert t1(a=1) == 2
+    assert t1(a=1) == 2
+
+    runner = CliRunner()
+    result = runner.invoke(pyflyte.main, ["local-cache", "stats"])
+    assert result.exit_code == 0, result.output
+    assert "Hits: 2 (66.7%)" in result.output
+    assert "Misses: 1" in result.output
+    assert "Entries: 1" in result.output
+
+    result = runner.invoke(pyflyte.main, ["local-cache", "prune"])
+    assert result.exit_code == 0, result.output
+    assert "Removed 0 objects" in result.output
+
+    result = runner.invoke(pyflyte.main, ["local-cache", "clear"])
+    assert result.exit_code == 0, result.output
+    assert LocalTaskCache.stats().entries == 0
@@ -0,0 +1,84 @@
+from contextlib import asynccontextmanager
+
+import grpc
+import pytest
+from flyteidl.admin import execution_pb2
+from flyteidl.service import admin_pb2_grpc
+from mock import MagicMock, patch
+
+from flytekit.clients.aio import AsynchronousFlyteClient
+from flytekit.configuration import PlatformConfig
+from flytekit.exceptions.user import FlyteEntityNotExistException
+from flytekit.models.core.identifier import WorkflowExecutionIdentifier
+
+
+class _AdminService(admin_pb2_grpc.AdminServiceServicer):
+    def __init__(self):
+        self.metadata = []
+        self.unauthenticated = 0
+
+    async def GetExecution(self, request, context):
+        self.metadata.append(dict(context.invocation_metadata()))
+        if self.unauthenticated:
+            self.unauthenticated -= 1
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "expired")
+        if request.id.name == "missing":
+            await context.abort(grpc.StatusCode.NOT_FOUND, "not found")
+        return execution_pb2.Execution(id=request.id)
+
+    async def ListExecutions(self, request, context):
+        # Three pages of two executions.
+        page = int(request.token or 0)
+        return execution_pb2.ExecutionList(
+            executions=[
+                execution_pb2.Execution(id={"project": "p", "domain": "d", "name": f"e{page * 2 + i}"})
+                for i in range(2)
+            ],
+            token=str(page + 1) if page < 2 else "",
+        )
+
+
+@asynccontextmanager
+async def _admin():
+    service = _AdminService()
+    server = grpc.aio.server()
+    admin_pb2_grpc.add_AdminServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    authenticator = MagicMock()
+    authenticator.fetch_grpc_call_auth_metadata.return_value = ("authorization", "Bearer t")
+    with patch("flytekit.clients.auth_helper.get_authenticator", return_value=authenticator):
+        client = AsynchronousFlyteClient(PlatformConfig(endpoint=f"localhost:{port}", insecure=True, rpc_retries=0))
+    try:
+        yield service, authenticator, client
+    finally:
+        await client.close()
+        await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_get_execution():
+    async with _admin() as (service, _, client):
+        id = WorkflowExecutionIdentifier("p", "d", "e1")
+        assert (await client.get_execution(id)).id == id
+        assert service.metadata[0]["authorization"] == "Bearer t"
+        assert service.metadata[0]["accept"] == "application/grpc"
+
+        with pytest.raises(FlyteEntityNotExistException):
+            await client.get_execution(WorkflowExecutionIdentifier("p", "d", "missing"))
+
+
+@pytest.mark.asyncio
+async def test_refresh_credentials():
+    async with _admin() as (service, authenticator, client):
+        service.unauthenticated = 1
+        await client.get_execution(WorkflowExecutionIdentifier("p", "d", "e1"))
+        authenticator.refresh_credentials.assert_called_once()
+        assert len(service.metadata) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_executions():
+    async with _admin() as (_, _, client):
+        names = [e.id.name async for e in client.list_executions("p", "d", page_size=2)]
+        assert names == ["e0", "e1", "e2", "e3", "e4", "e5"]
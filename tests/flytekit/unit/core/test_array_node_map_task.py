@@ -1,4 +1,6 @@
+import datetime
 import functools
+import threading
 import typing
 from collections import OrderedDict
 from typing import List
@@ -8,8 +10,11 @@ import pytest
 from flytekit import task, workflow
 from flytekit.configuration import FastSerializationSettings, Image, ImageConfig, SerializationSettings
 from flytekit.core.array_node_map_task import ArrayNodeMapTask, ArrayNodeMapTaskResolver
+from flytekit.core.context_manager import ExecutionState, FlyteContextManager
 from flytekit.core.task import TaskMetadata
+from flytekit.core.type_engine import TypeEngine
 from flytekit.experimental import map_task as array_node_map_task
+from flytekit.models.literals import LiteralMap
 from flytekit.tools.translator import get_serializable
 
 
@@ -306,3 +311,48 @@ def test_map_task_override(serialization_settings):
         array_node_map_task(my_mappable_task)(a=x).with_overrides(container_image="random:image")
 
     assert wf.nodes[0]._container_image == "random:image"
+
+
+def test_execution_converts_only_own_element(monkeypatch):
+    @task
+    def repeat(a: datetime.timedelta, b: str) -> str:
+        return b * a.days
+
+    m = array_node_map_task(functools.partial(repeat, b="x"))
+
+    ctx = FlyteContextManager.current_context()
+    a = [datetime.timedelta(days=i) for i in range(1, 4)]
+    idl = TypeEngine.dict_to_literal_map_pb(ctx, {"a": a, "b": "x"}, {"a": typing.List[datetime.timedelta], "b": str})
+    lm = LiteralMap.from_flyte_idl(idl)
+
+    monkeypatch.setenv("BATCH_JOB_ARRAY_INDEX_VAR_NAME", "ARRAY_INDEX")
+    monkeypatch.setenv("ARRAY_INDEX", "1")
+    with FlyteContextManager.with_context(
+        ctx.with_execution_state(ctx.new_execution_state().with_params(mode=ExecutionState.Mode.TASK_EXECUTION))
+    ) as ctx:
+        outputs = m.dispatch_execute(ctx, lm)
+
+    assert outputs.literals["o0"].scalar.primitive.string_value == "xx"
+    assert not lm.literals["a"].collection.is_materialized
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_raw_execute_with_local_executor(executor, monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", executor)
+    # Instances that run in other processes cannot share a barrier.
+    barrier = threading.Barrier(4, timeout=10) if executor == "thread" else None
+
+    @task
+    def some_task1(inputs: int) -> int:
+        if barrier:
+            # Only returns if all instances are running at the same time.
+            barrier.wait()
+        if inputs == 2:
+            raise ValueError("Unexpected inputs: 2")
+        return inputs
+
+    @workflow
+    def my_wf1() -> typing.List[typing.Optional[int]]:
+        return array_node_map_task(some_task1, min_success_ratio=0.5)(inputs=[1, 2, 3, 4])
+
+    assert my_wf1() == [1, None, 3, 4]
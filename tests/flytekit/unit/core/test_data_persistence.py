@@ -5,11 +5,16 @@ import random
 import string
 import sys
 import tempfile
+import threading
+import time
 
+import fsspec
 import mock
 import pytest
 from azure.identity import ClientSecretCredential, DefaultAzureCredential
+from fsspec.implementations.memory import MemoryFileSystem
 
+from flytekit.configuration import DataConfig
 from flytekit.core.data_persistence import FileAccessProvider
 
 
@@ -170,3 +175,135 @@ def test_initialise_azure_file_provider_with_default_credential():
         fp = FileAccessProvider("/tmp", "abfs://container/path/within/container")
         assert fp.get_filesystem().account_name == "accountname"
         assert isinstance(fp.get_filesystem().sync_credential, DefaultAzureCredential)
+
+
+def test_get_data_in_parts(tmp_path):
+    data = os.urandom(10 * 1024 + 7)
+    fsspec.filesystem("memory").pipe("memory://flytekit-test/large.bin", data)
+    fp = FileAccessProvider(
+        tmp_path, "memory://raw", data_config=DataConfig(transfer_chunk_size=1024, transfer_concurrency=4)
+    )
+
+    with mock.patch.object(MemoryFileSystem, "cat_file", autospec=True, side_effect=MemoryFileSystem.cat_file) as cat:
+        fp.get_data("memory://flytekit-test/large.bin", str(tmp_path / "large.bin"))
+    assert cat.call_count == 11
+    assert (tmp_path / "large.bin").read_bytes() == data
+    assert fp.transfers[-1].parts == 11
+    assert fp.transfers[-1].size == len(data)
+
+    fsspec.filesystem("memory").pipe("memory://flytekit-test/small.bin", b"small")
+    fp.get_data("memory://flytekit-test/small.bin", str(tmp_path / "small.bin"))
+    assert (tmp_path / "small.bin").read_bytes() == b"small"
+    assert fp.transfers[-1].parts == 1
+
+
+def test_transfers_share_one_limit(tmp_path):
+    fp = FileAccessProvider(
+        tmp_path, "memory://raw", data_config=DataConfig(transfer_chunk_size=1024, transfer_concurrency=2)
+    )
+    names = [f"{i}.bin" for i in range(4)]
+    for name in names:
+        fsspec.filesystem("memory").pipe(f"memory://flytekit-test/shared/{name}", b"x" * 2048)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+    original_cat_file = MemoryFileSystem.cat_file
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        with lock:
+            running.append(path)
+            max_running.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(path)
+        return original_cat_file(self, path, start=start, end=end, **kwargs)
+
+    with mock.patch.object(MemoryFileSystem, "cat_file", autospec=True, side_effect=cat_file):
+        # Two directory downloads at the same time, each of files downloaded in two ranged reads, share the limit
+        # of 2 instead of each running up to 4 files with 2 parts each.
+        threads = [
+            threading.Thread(
+                target=fp.get_files,
+                args=("memory://flytekit-test/shared", str(tmp_path / str(i)), names),
+                kwargs={"max_concurrency": 4},
+            )
+            for i in range(2)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(max_running) == 16
+    assert max(max_running) <= 2
+    for i in range(2):
+        for name in names:
+            assert (tmp_path / str(i) / name).read_bytes() == b"x" * 2048
+
+
+class _S3LikeMemoryFileSystem(MemoryFileSystem):
+    """
+    Takes the same transfer arguments as s3fs: ``chunksize`` on uploads only, and no ``max_concurrency``.
+    """
+
+    protocol = "s3likememory"
+
+    def get_file(self, rpath, lpath, callback=None, version_id=None):
+        self.get_kwargs = {}
+        return super().get_file(rpath, lpath)
+
+    def put_file(self, lpath, rpath, callback=None, chunksize=50 * 2**20, **kwargs):
+        self.put_kwargs = {"chunksize": chunksize, **kwargs}
+        return super().put_file(lpath, rpath)
+
+
+class _ConcurrentMemoryFileSystem(MemoryFileSystem):
+    """
+    Takes the same transfer arguments as adlfs: ``max_concurrency`` on downloads and uploads.
+    """
+
+    protocol = "concurrentmemory"
+
+    def get_file(self, rpath, lpath, callback=None, max_concurrency=None, **kwargs):
+        self.get_kwargs = {"max_concurrency": max_concurrency}
+        return super().get_file(rpath, lpath, **kwargs)
+
+    def put_file(self, lpath, rpath, callback=None, max_concurrency=None, **kwargs):
+        self.put_kwargs = {"max_concurrency": max_concurrency, **kwargs}
+        return super().put_file(lpath, rpath, **kwargs)
+
+
+def test_transfer_arguments_supported_by_file_system(tmp_path):
+    fp = FileAccessProvider(
+        tmp_path, "memory://raw", data_config=DataConfig(transfer_chunk_size=1024, transfer_concurrency=4)
+    )
+    local = tmp_path / "local.bin"
+    local.write_bytes(b"x" * 2048)
+
+    fsspec.register_implementation(_S3LikeMemoryFileSystem.protocol, _S3LikeMemoryFileSystem, clobber=True)
+    s3_like = fsspec.filesystem(_S3LikeMemoryFileSystem.protocol)
+    fp.put_data(str(local), "s3likememory://flytekit-test/local.bin")
+    assert s3_like.put_kwargs == {"chunksize": 1024}
+    # The part size grows with the file, so that it never needs more parts than S3 allows.
+    with mock.patch("flytekit.core.data_persistence._MAX_UPLOAD_PARTS", 1):
+        fp.put_data(str(local), "s3likememory://flytekit-test/local.bin")
+    assert s3_like.put_kwargs == {"chunksize": 2048}
+    assert fp.transfers[-1].size == 2048
+    assert fp.transfers[-1].destination == "s3likememory://flytekit-test/local.bin"
+    # Downloads cannot be split by the file system, so they are split into ranged reads.
+    with mock.patch.object(
+        _S3LikeMemoryFileSystem, "cat_file", autospec=True, side_effect=MemoryFileSystem.cat_file
+    ) as cat:
+        fp.get_data("s3likememory://flytekit-test/local.bin", str(tmp_path / "s3.bin"))
+    assert cat.call_count == 2
+    assert fp.transfers[-1].parts == 2
+    assert (tmp_path / "s3.bin").read_bytes() == b"x" * 2048
+
+    fsspec.register_implementation(_ConcurrentMemoryFileSystem.protocol, _ConcurrentMemoryFileSystem, clobber=True)
+    concurrent = fsspec.filesystem(_ConcurrentMemoryFileSystem.protocol)
+    fp.put_data(str(local), "concurrentmemory://flytekit-test/local.bin")
+    assert concurrent.put_kwargs == {"max_concurrency": 4}
+    fp.get_data("concurrentmemory://flytekit-test/local.bin", str(tmp_path / "concurrent.bin"))
+    assert concurrent.get_kwargs == {"max_concurrency": 4}
+    assert fp.transfers[-1].parts == 1
+    assert (tmp_path / "concurrent.bin").read_bytes() == b"x" * 2048
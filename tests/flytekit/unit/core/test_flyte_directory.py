@@ -7,6 +7,8 @@ from unittest.mock import MagicMock
 
 import mock
 import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from typing_extensions import Annotated
 
 import flytekit.configuration
 from flytekit.configuration import Image, ImageConfig
@@ -14,6 +16,7 @@ from flytekit.core import context_manager
 from flytekit.core.context_manager import ExecutionState, FlyteContextManager
 from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.dynamic_workflow_task import dynamic
+from flytekit.core.hash import ContentAddressed, compute_directory_digest
 from flytekit.core.task import task
 from flytekit.core.type_engine import TypeEngine
 from flytekit.core.workflow import workflow
@@ -314,3 +317,63 @@ def test_list_dir(mock_get_data, mock_lsdir):
 
     with pytest.raises(Exception):
         open(paths[0], "r")
+
+
+def test_content_addressed_upload(tmp_path, local_dummy_directory):
+    ctx = FlyteContextManager.current_context()
+    pt = Annotated[FlyteDirectory, ContentAddressed(str(tmp_path / "cas"))]
+    lt = TypeEngine.to_literal_type(pt)
+    copy = str(tmp_path / "copy")
+    shutil.copytree(local_dummy_directory, copy)
+
+    with mock.patch.object(FileAccessProvider, "put_data", wraps=ctx.file_access.put_data) as put_data:
+        lv1 = TypeEngine.to_literal(ctx, local_dummy_directory, pt, lt)
+        lv2 = TypeEngine.to_literal(ctx, copy, pt, lt)
+        put_data.assert_called_once()
+
+    assert lv1.hash == lv2.hash == compute_directory_digest(copy)
+    assert lv1.scalar.blob.uri == lv2.scalar.blob.uri == str(tmp_path / "cas" / lv1.hash)
+    assert os.listdir(lv1.scalar.blob.uri) == ["file"]
+
+
+def test_directory_manifest(tmp_path):
+    src = tmp_path / "src"
+    (src / "a").mkdir(parents=True)
+    (src / "empty" / "nested").mkdir(parents=True)
+    for name in ["a/1.csv", "a/2.txt", "b.csv"]:
+        (src / name).write_text(name)
+    fp = FileAccessProvider(str(tmp_path / "sandbox"), "memory://flytekit-manifest/raw")
+    ctx = FlyteContextManager.current_context()
+    with FlyteContextManager.with_context(ctx.with_file_access(fp)) as ctx:
+        lt = TypeEngine.to_literal_type(FlyteDirectory)
+        with mock.patch.object(FileAccessProvider, "put_files", side_effect=AssertionError("uploaded file by file")):
+            lv = TypeEngine.to_literal(ctx, str(src), FlyteDirectory, lt)
+        assert lv.metadata["manifest"] == f"{lv.scalar.blob.uri}.manifest.json"
+
+        fd = TypeEngine.to_python_value(ctx, lv, FlyteDirectory)
+        # The manifest is passed on when the directory is returned again.
+        assert TypeEngine.to_literal(ctx, fd, FlyteDirectory, lt).metadata == lv.metadata
+        with mock.patch.object(MemoryFileSystem, "find", side_effect=AssertionError("listed the directory")):
+            assert fd.files() == ["a/1.csv", "a/2.txt", "b.csv"]
+            assert fd.files("*.csv") == ["a/1.csv", "b.csv"]
+
+            assert fd.download_files("a/*") == [
+                os.path.join(fd.path, "a", "1.csv"),
+                os.path.join(fd.path, "a", "2.txt"),
+            ]
+            assert sorted(os.listdir(fd.path)) == ["a"]
+            f = fd.get_file("b.csv")
+            assert not os.path.exists(f.path)
+            assert open(f).read() == "b.csv"
+
+            # Empty directories, which the object store does not keep, are restored from the manifest.
+            assert sorted(os.listdir(fd)) == ["a", "b.csv", "empty"]
+            assert os.listdir(os.path.join(fd.path, "empty", "nested")) == []
+            assert open(os.path.join(fd.path, "a", "2.txt")).read() == "a/2.txt"
+
+        # Without the manifest, the listing comes from the object store.
+        lv._metadata = None
+        fd = TypeEngine.to_python_value(ctx, lv, FlyteDirectory)
+        assert fd.files("*.csv") == ["a/1.csv", "b.csv"]
+        # Unlike object stores, the memory file system keeps the empty directories itself.
+        assert sorted(os.listdir(fd)) == ["a", "b.csv", "empty"]
@@ -1,6 +1,8 @@
+import hashlib
 import os
 import pathlib
 import tempfile
+import threading
 import typing
 from unittest.mock import MagicMock, patch
 
@@ -12,7 +14,7 @@ from flytekit.configuration import Config, Image, ImageConfig
 from flytekit.core.context_manager import ExecutionState, FlyteContextManager
 from flytekit.core.data_persistence import FileAccessProvider, flyte_tmp_dir
 from flytekit.core.dynamic_workflow_task import dynamic
-from flytekit.core.hash import HashMethod
+from flytekit.core.hash import ContentAddressed, HashMethod, compute_file_digest
 from flytekit.core.launch_plan import LaunchPlan
 from flytekit.core.task import task
 from flytekit.core.type_engine import TypeEngine
@@ -640,3 +642,58 @@ def test_join():
     fs = ctx.file_access.get_filesystem("s3")
     f = ctx.file_access.join("s3://a", "b", "c", fs=fs)
     assert f == fs.sep.join(["s3://a", "b", "c"])
+
+
+def test_file_outputs_uploaded_concurrently(tmp_path):
+    @task
+    def t1() -> typing.Tuple[FlyteFile, FlyteFile]:
+        ...
+
+    paths = []
+    for i in range(2):
+        p = tmp_path / f"f{i}.txt"
+        p.write_text(str(i))
+        paths.append(str(p))
+
+    # Both uploads wait for each other, so this only completes if they run at the same time.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def put_raw_data(path, *args, **kwargs):
+        barrier.wait()
+        return f"s3://bucket/{os.path.basename(path)}"
+
+    ctx = FlyteContextManager.current_context()
+    with patch.object(ctx.file_access, "put_raw_data", side_effect=put_raw_data):
+        lm, _ = t1._output_to_literal_map(tuple(paths), ctx)
+
+    assert lm.literals["o0"].scalar.blob.uri == "s3://bucket/f0.txt"
+    assert lm.literals["o1"].scalar.blob.uri == "s3://bucket/f1.txt"
+
+
+def test_content_addressed_upload(tmp_path):
+    ctx = FlyteContextManager.current_context()
+    pt = Annotated[FlyteFile, ContentAddressed(str(tmp_path / "cas"))]
+    lt = TypeEngine.to_literal_type(pt)
+    for d in ["a", "b"]:
+        (tmp_path / d).mkdir()
+        (tmp_path / d / "data.txt").write_text("same content")
+
+    with patch.object(FileAccessProvider, "put_data", wraps=ctx.file_access.put_data) as put_data:
+        lv1 = TypeEngine.to_literal(ctx, str(tmp_path / "a" / "data.txt"), pt, lt)
+        lv2 = TypeEngine.to_literal(ctx, FlyteFile(str(tmp_path / "b" / "data.txt")), pt, lt)
+        put_data.assert_called_once()
+
+    assert lv1.hash == lv2.hash == compute_file_digest(str(tmp_path / "a" / "data.txt"))
+    assert lv1.scalar.blob.uri == lv2.scalar.blob.uri == str(tmp_path / "cas" / lv1.hash / "data.txt")
+    assert open(lv1.scalar.blob.uri).read() == "same content"
+
+
+def test_compute_file_digest_in_chunks(tmp_path):
+    p = tmp_path / "data"
+    p.write_bytes(bytes(range(256)) * 10)
+    with patch("flytekit.core.hash._CONTENT_HASH_CHUNK_SIZE", 1000):
+        digest = compute_file_digest(str(p))
+    data = p.read_bytes()
+    chunks = b"".join(hashlib.sha256(data[i : i + 1000]).digest() for i in range(0, len(data), 1000))
+    assert digest == f"{hashlib.sha256(chunks).hexdigest()}-3"
+    assert compute_file_digest(str(p)) == hashlib.sha256(data).hexdigest()
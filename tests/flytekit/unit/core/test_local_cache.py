@@ -4,18 +4,20 @@ import typing
 from dataclasses import dataclass
 from typing import Dict, List
 
+import mock
 import pytest
 from dataclasses_json import DataClassJsonMixin
 from pytest import fixture
 from typing_extensions import Annotated
 
 import flytekit
+from flytekit.configuration import LocalConfig
 from flytekit.core.base_sql_task import SQLTask
 from flytekit.core.base_task import kwtypes
 from flytekit.core.context_manager import FlyteContextManager
 from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.hash import HashMethod
-from flytekit.core.local_cache import LocalTaskCache, _calculate_cache_key, _recursive_hash_placement
+from flytekit.core.local_cache import LocalTaskCache, _calculate_cache_key
 from flytekit.core.task import TaskMetadata, task
 from flytekit.core.testing import task_mock
 from flytekit.core.type_engine import TypeEngine
@@ -528,7 +530,7 @@ def test_stable_cache_key():
         }
     )
     key = _calculate_cache_key("task_name_1", "31415", lm)
-    assert key == "task_name_1-31415-404b45f8556276183621d4bf37f50049"
+    assert key == "task_name_1-31415-4d74b4524221bcc4fea10232f40d52da"
 
 
 @pytest.mark.skipif("pandas" not in sys.modules, reason="Pandas is not installed.")
@@ -574,16 +576,130 @@ def test_cache_key_consistency(d):
 @pytest.mark.serial
 def test_literal_hash_placement():
     """
-    Test that hashes on literal collections and maps are preserved by the
-    _recursive_hash_placement function used in cache key calculations.
+    Test that hashes on literal collections and maps stand in for their contents in cache key calculations.
     """
     lit = Literal(scalar=Scalar(primitive=Primitive(string_value="test")))
+    other_lit = Literal(scalar=Scalar(primitive=Primitive(string_value="other")))
+
+    def key(literal: Literal) -> str:
+        return _calculate_cache_key("t1", "007", LiteralMap(literals={"a": literal}))
 
     litmap = Literal(map=LiteralMap(literals={"test": lit}), hash="0xffff")
     litcoll = Literal(collection=LiteralCollection(literals=[lit]), hash="0xffff")
 
-    assert litmap.hash == _recursive_hash_placement(litmap).hash
-    assert litcoll.hash == _recursive_hash_placement(litcoll).hash
+    assert key(litmap) == key(Literal(map=LiteralMap(literals={"test": other_lit}), hash="0xffff"))
+    assert key(litcoll) == key(Literal(collection=LiteralCollection(literals=[other_lit]), hash="0xffff"))
+    assert key(litcoll) != key(Literal(collection=LiteralCollection(literals=[lit]), hash="0xfffe"))
+    assert key(litcoll) != key(Literal(collection=LiteralCollection(literals=[lit])))
+
+    # Hashes are used at any level of nesting.
+    assert key(Literal(collection=LiteralCollection(literals=[litcoll, lit]))) == key(
+        Literal(collection=LiteralCollection(literals=[Literal(hash="0xffff"), lit]))
+    )
+    assert key(Literal(map=LiteralMap(literals={"x": litmap}))) != key(Literal(map=LiteralMap(literals={"x": lit})))
+
+
+@pytest.mark.serial
+def test_cache_key_lazy_literals():
+    """
+    The key does not depend on whether the inputs were built in memory or read from their IDL representation.
+    """
+    ctx = FlyteContextManager.current_context()
+    pt = typing.Dict[str, typing.List[int]]
+    lm = LiteralMap(
+        literals={"d": TypeEngine.to_literal(ctx, {"a": [1, 2], "b": []}, pt, TypeEngine.to_literal_type(pt))}
+    )
+    assert _calculate_cache_key("t1", "007", lm) == _calculate_cache_key(
+        "t1", "007", LiteralMap.from_flyte_idl(lm.to_flyte_idl())
+    )
+
+
+@pytest.mark.serial
+def test_cache_memory_entries(monkeypatch):
+    lm = LiteralMap(literals={"a": TypeEngine.to_literal(FlyteContextManager.current_context(), 1, int, None)})
+    monkeypatch.setenv("FLYTE_LOCAL_CACHE_MEMORY_ENTRIES", "1")
+    LocalTaskCache.initialize()
+
+    LocalTaskCache.set("t1", "v1", lm, lm)
+    LocalTaskCache.set("t2", "v1", lm, lm)
+    with mock.patch.object(LocalTaskCache._cache, "get", side_effect=AssertionError("disk read")):
+        # The most recently used entry is served from memory.
+        assert LocalTaskCache.get("t2", "v1", lm) == lm
+    assert list(LocalTaskCache._memory) == [_calculate_cache_key("t2", "v1", lm)]
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+    assert list(LocalTaskCache._memory) == [_calculate_cache_key("t1", "v1", lm)]
+
+    LocalTaskCache.clear()
+    assert LocalTaskCache.get("t1", "v1", lm) is None
+
+
+@pytest.mark.serial
+def test_cache_ttl(monkeypatch):
+    lm = LiteralMap(literals={"a": TypeEngine.to_literal(FlyteContextManager.current_context(), 1, int, None)})
+    monkeypatch.setenv("FLYTE_LOCAL_CACHE_TTL", "3600")
+    monkeypatch.setenv("FLYTE_LOCAL_CACHE_TASK_TTLS", "expired=0,other=60")
+    LocalTaskCache.initialize()
+    assert LocalTaskCache._config.cache_task_ttls == {"expired": 0, "other": 60}
+
+    LocalTaskCache.set("expired", "v1", lm, lm)
+    LocalTaskCache.set("t1", "v1", lm, lm)
+    assert LocalTaskCache.get("expired", "v1", lm) is None
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+
+    # Entries on disk expire as well.
+    LocalTaskCache._memory.clear()
+    assert LocalTaskCache.get("expired", "v1", lm) is None
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+    LocalTaskCache.prune()
+    assert LocalTaskCache.stats().entries == 1
+
+
+@pytest.mark.serial
+def test_cache_stats():
+    lm = LiteralMap(literals={"a": TypeEngine.to_literal(FlyteContextManager.current_context(), 1, int, None)})
+    size = lm.to_flyte_idl().ByteSize()
+    LocalTaskCache.reset_stats()
+
+    assert LocalTaskCache.get("t1", "v1", lm) is None
+    LocalTaskCache.set("t1", "v1", lm, lm)
+    # Hits served from memory are counted as well.
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+    LocalTaskCache._memory.clear()
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+
+    stats = LocalTaskCache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+    assert (stats.bytes_read, stats.bytes_written) == (2 * size, size)
+    assert stats.volume > 0
+
+    # Counts that were not flushed yet are dropped as well.
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+    LocalTaskCache.reset_stats()
+    assert LocalTaskCache.stats().hits == 0
+
+
+@pytest.mark.serial
+def test_cache_memory_hits_are_copies():
+    ctx = FlyteContextManager.current_context()
+    lm = LiteralMap(literals={"a": TypeEngine.to_literal(ctx, 1, int, None)})
+    LocalTaskCache.set("t1", "v1", lm, lm)
+
+    value = LocalTaskCache.get("t1", "v1", lm)
+    value.literals["a"] = TypeEngine.to_literal(ctx, 2, int, None)
+    assert LocalTaskCache.get("t1", "v1", lm) == lm
+    assert LocalTaskCache.get("t1", "v1", lm) is not LocalTaskCache.get("t1", "v1", lm)
+
+
+def test_cache_invalid_task_ttls(monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_CACHE_TASK_TTLS", "my.task")
+    with pytest.raises(ValueError, match="FLYTE_LOCAL_CACHE_TASK_TTLS"):
+        LocalConfig.auto()
+
+
+def test_cache_unknown_eviction_policy(monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_CACHE_EVICTION_POLICY", "random")
+    with pytest.raises(ValueError, match="Unknown local cache eviction policy"):
+        LocalTaskCache.initialize()
 
 
 @task(cache=True, cache_version="v0")
@@ -1,4 +1,7 @@
+import datetime
 import functools
+import threading
+import time
 import typing
 from collections import OrderedDict
 
@@ -6,10 +9,13 @@ import pytest
 
 import flytekit.configuration
 from flytekit import LaunchPlan, Resources, map_task
-from flytekit.configuration import Image, ImageConfig
+from flytekit.configuration import Image, ImageConfig, LocalConfig
+from flytekit.core.context_manager import ExecutionState, FlyteContextManager
 from flytekit.core.map_task import MapPythonTask, MapTaskResolver
 from flytekit.core.task import TaskMetadata, task
+from flytekit.core.type_engine import TypeEngine
 from flytekit.core.workflow import workflow
+from flytekit.models.literals import LiteralMap
 from flytekit.tools.translator import get_serializable
 
 
@@ -361,3 +367,100 @@ def test_bounded_inputs_vars_order(serialization_settings):
     args = mtr.loader_args(serialization_settings, mt)
 
     assert args[1] == "a,b,c"
+
+
+def test_map_task_execution_converts_only_own_element(monkeypatch):
+    @task
+    def repeat(a: datetime.timedelta, b: str) -> str:
+        return b * a.days
+
+    m = map_task(functools.partial(repeat, b="x"))
+
+    ctx = FlyteContextManager.current_context()
+    a = [datetime.timedelta(days=i) for i in range(1, 4)]
+    idl = TypeEngine.dict_to_literal_map_pb(ctx, {"a": a, "b": "x"}, {"a": typing.List[datetime.timedelta], "b": str})
+    lm = LiteralMap.from_flyte_idl(idl)
+
+    monkeypatch.setenv("BATCH_JOB_ARRAY_INDEX_VAR_NAME", "ARRAY_INDEX")
+    monkeypatch.setenv("ARRAY_INDEX", "2")
+    with FlyteContextManager.with_context(
+        ctx.with_execution_state(ctx.new_execution_state().with_params(mode=ExecutionState.Mode.TASK_EXECUTION))
+    ) as ctx:
+        outputs = m.dispatch_execute(ctx, lm)
+
+    assert outputs.literals["o0"].scalar.primitive.string_value == "xxx"
+    assert not lm.literals["a"].collection.is_materialized
+
+
+def test_map_task_local_execution_in_parallel(monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", "thread")
+    barrier = threading.Barrier(3, timeout=10)
+
+    @task
+    def wait_for_others(a: int) -> int:
+        # Only returns if all three instances are running at the same time.
+        barrier.wait()
+        return a * 2
+
+    assert map_task(wait_for_others)(a=[1, 2, 3]) == [2, 4, 6]
+
+
+def test_map_task_local_execution_respects_concurrency(monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", "thread")
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    @task
+    def count_running(a: int) -> int:
+        with lock:
+            running.append(a)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(a)
+        return a
+
+    assert map_task(count_running, concurrency=2)(a=list(range(6))) == list(range(6))
+    assert max(max_running) == 2
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_map_task_local_executors(executor, monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", executor)
+
+    @task
+    def some_task(a: int) -> int:
+        if a == 2:
+            raise ValueError("Unexpected inputs: 2")
+        return a
+
+    assert map_task(some_task, min_success_ratio=0.5)(a=[1, 2, 3, 4]) == [1, None, 3, 4]
+    with pytest.raises(ValueError):
+        map_task(some_task)(a=[1, 2, 3, 4])
+
+    @workflow
+    def wf(a: typing.List[int]) -> typing.List[int]:
+        return map_task(some_task)(a=a)
+
+    with pytest.raises(ValueError, match="Unexpected inputs: 2"):
+        wf(a=[1, 2, 3])
+
+
+def test_map_task_local_executor_defaults_to_serial():
+    assert LocalConfig.auto().map_executor == "serial"
+
+
+def test_map_task_reads_local_config_once(monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", "thread")
+    mt = map_task(t1)
+    assert mt(a=[1, 2]) == ["3", "4"]
+    # The configuration was read by the first call, so the unknown executor is not seen.
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", "gpu")
+    assert mt(a=[3]) == ["5"]
+
+
+def test_map_task_unknown_local_executor(monkeypatch):
+    monkeypatch.setenv("FLYTE_LOCAL_MAP_EXECUTOR", "gpu")
+    with pytest.raises(ValueError, match="Unknown local map executor"):
+        map_task(t1)(a=[1, 2])
@@ -0,0 +1,99 @@
+import os
+import threading
+import typing
+
+import mock
+from typing_extensions import Annotated
+
+from flytekit import Prefetch, task
+from flytekit.core.context_manager import ExecutionState, FlyteContextManager
+from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.core.prefetch import prefetch_inputs
+from flytekit.core.type_engine import TypeEngine
+from flytekit.models.core.types import BlobType
+from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralMap, Scalar
+from flytekit.types.file import FlyteFile
+
+
+def _remote_file_literal(uri: str) -> Literal:
+    meta = BlobMetadata(type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.SINGLE))
+    return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=uri)))
+
+
+def _fake_get_data(remote_path, local_path, *args, **kwargs):
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    with open(local_path, "w") as f:
+        f.write(os.path.basename(remote_path))
+
+
+def test_prefetch_inputs():
+    # Both downloads wait for each other, so the task only completes if they run at the same time.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def get_data(remote_path, local_path, *args, **kwargs):
+        barrier.wait()
+        _fake_get_data(remote_path, local_path)
+
+    @task(prefetch_inputs=True)
+    def t1(a: FlyteFile, b: FlyteFile) -> str:
+        with open(b) as fb, open(a) as fa:
+            return fa.read() + fb.read()
+
+    assert t1.prefetch_inputs
+    ctx = FlyteContextManager.current_context()
+    lm = LiteralMap(
+        literals={"a": _remote_file_literal("s3://bucket/a.txt"), "b": _remote_file_literal("s3://bucket/b.txt")}
+    )
+    with FlyteContextManager.with_context(
+        ctx.with_execution_state(ctx.new_execution_state().with_params(mode=ExecutionState.Mode.TASK_EXECUTION))
+    ) as ctx:
+        with mock.patch.object(FileAccessProvider, "get_data", side_effect=get_data):
+            outputs = t1.dispatch_execute(ctx, lm)
+    assert TypeEngine.to_python_value(ctx, outputs.literals["o0"], str) == "a.txtb.txt"
+
+
+def test_prefetch_annotated_inputs():
+    ctx = FlyteContextManager.current_context()
+    inputs = {
+        "a": TypeEngine.to_python_value(ctx, _remote_file_literal("s3://bucket/a.txt"), FlyteFile),
+        "b": [TypeEngine.to_python_value(ctx, _remote_file_literal("s3://bucket/b.txt"), FlyteFile)],
+    }
+    types = {"a": FlyteFile, "b": Annotated[typing.List[FlyteFile], Prefetch()]}
+
+    with mock.patch.object(FileAccessProvider, "get_data", side_effect=_fake_get_data) as get_data:
+        with prefetch_inputs(ctx, inputs, types):
+            assert open(inputs["b"][0]).read() == "b.txt"
+        get_data.assert_called_once()
+        assert get_data.call_args.args[0] == "s3://bucket/b.txt"
+
+        # The annotated input is not downloaded again on access, the other one is downloaded lazily.
+        assert open(inputs["b"][0]).read() == "b.txt"
+        assert open(inputs["a"]).read() == "a.txt"
+        assert get_data.call_count == 2
+
+
+def test_prefetch_cancelled_download_runs_on_access():
+    ctx = FlyteContextManager.current_context()
+    ff = TypeEngine.to_python_value(ctx, _remote_file_literal("s3://bucket/a.txt"), FlyteFile)
+    release = threading.Event()
+
+    def get_data(remote_path, local_path, *args, **kwargs):
+        if "blocker" in remote_path:
+            release.wait(10)
+        _fake_get_data(remote_path, local_path)
+
+    with mock.patch.object(FileAccessProvider, "get_data", side_effect=get_data) as get_data:
+        with mock.patch.object(FileAccessProvider, "data_config") as data_config:
+            data_config.transfer_concurrency = 2
+            blockers = {
+                f"blocker{i}": TypeEngine.to_python_value(
+                    ctx, _remote_file_literal(f"s3://bucket/blocker{i}.txt"), FlyteFile
+                )
+                for i in range(2)
+            }
+            with prefetch_inputs(ctx, {**blockers, "ff": ff}, {}, prefetch_all=True):
+                # Both workers of the transfer pool are busy, so the last download is still queued and runs on this
+                # thread instead of waiting for the others.
+                assert open(ff).read() == "a.txt"
+                release.set()
+        assert get_data.call_count == 3
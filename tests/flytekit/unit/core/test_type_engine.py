@@ -5,6 +5,8 @@ import os
 import re
 import sys
 import tempfile
+import threading
+import time
 import typing
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
@@ -48,6 +50,9 @@ from flytekit.core.type_engine import (
     dataclass_from_dict,
     get_underlying_type,
     is_annotated,
+    is_offloaded_type,
+    map_concurrently,
+    modify_literal_uris,
 )
 from flytekit.exceptions import user as user_exceptions
 from flytekit.models import types as model_types
@@ -55,6 +60,7 @@ from flytekit.models.annotation import TypeAnnotation
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralCollection, LiteralMap, Primitive, Scalar, Void
 from flytekit.models.types import LiteralType, SimpleType, TypeStructure, UnionType
+from flytekit.remote.remote_fs import FlytePathResolver
 from flytekit.types.directory import TensorboardLogs
 from flytekit.types.directory.types import FlyteDirectory
 from flytekit.types.file import FileExt, JPEGImageFile
@@ -62,7 +68,7 @@ from flytekit.types.file.file import FlyteFile, FlyteFilePathTransformer, noop
 from flytekit.types.pickle import FlytePickle
 from flytekit.types.pickle.pickle import BatchSize, FlytePickleTransformer
 from flytekit.types.schema import FlyteSchema
-from flytekit.types.structured.structured_dataset import StructuredDataset
+from flytekit.types.structured.structured_dataset import StructuredDataset, StructuredDatasetTransformerEngine
 
 T = typing.TypeVar("T")
 
@@ -101,6 +107,147 @@ def test_type_resolution():
     assert type(TypeEngine.get_transformer(typing.Any)) == FlytePickleTransformer
 
 
+def test_type_resolution_cache():
+    class Foo:
+        ...
+
+    class FooTransformer(TypeTransformer[Foo]):
+        def __init__(self):
+            super().__init__("Foo", Foo)
+
+        def get_literal_type(self, t: Type[Foo]) -> LiteralType:
+            return LiteralType(simple=SimpleType.STRING)
+
+    assert type(TypeEngine.get_transformer(Foo)) == FlytePickleTransformer
+    assert Foo in TypeEngine._TRANSFORMER_CACHE
+    assert TypeEngine.get_transformer(Foo) is TypeEngine.get_transformer(Foo)
+
+    # Registering a new transformer invalidates the cached resolution
+    transformer = FooTransformer()
+    TypeEngine.register(transformer)
+    assert Foo not in TypeEngine._TRANSFORMER_CACHE
+    assert TypeEngine.get_transformer(Foo) is transformer
+
+    other = FooTransformer()
+    TypeEngine.register_additional_type(other, Foo, override=True)
+    assert TypeEngine.get_transformer(Foo) is other
+    del TypeEngine._REGISTRY[Foo]
+    TypeEngine._TRANSFORMER_CACHE.clear()
+
+    # Unhashable annotations are resolved without being cached
+    t = Annotated[StructuredDataset, kwtypes(a=int)]
+    assert type(TypeEngine.get_transformer(t)) == StructuredDatasetTransformerEngine
+
+
+def test_type_resolution_cache_bounded():
+    with mock.patch.object(TypeEngine, "_TRANSFORMER_CACHE_MAX_SIZE", 2):
+        TypeEngine._TRANSFORMER_CACHE.clear()
+        TypeEngine.get_transformer(int)
+        TypeEngine.get_transformer(str)
+        assert len(TypeEngine._TRANSFORMER_CACHE) == 2
+        TypeEngine.get_transformer(float)
+        assert list(TypeEngine._TRANSFORMER_CACHE.keys()) == [float]
+
+
+def test_list_transformer_resolves_sub_type_once():
+    ctx = FlyteContextManager.current_context()
+    pt = typing.List[timedelta]
+    lt = TypeEngine.to_literal_type(pt)
+    v = [timedelta(seconds=i) for i in range(100)]
+    with mock.patch.object(TypeEngine, "get_transformer", wraps=TypeEngine.get_transformer) as get_transformer:
+        lv = TypeEngine.to_literal(ctx, v, pt, lt)
+        assert get_transformer.call_count == 2
+        get_transformer.reset_mock()
+        assert TypeEngine.to_python_value(ctx, lv, pt) == v
+        assert get_transformer.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "python_type, python_val",
+    [
+        (int, [1, 2, 3]),
+        (float, [1.5, -2.0]),
+        (str, ["a", "", "c"]),
+        (bool, [True, False]),
+        (int, []),
+    ],
+)
+def test_list_of_primitives_bulk(python_type, python_val):
+    ctx = FlyteContextManager.current_context()
+    pt = typing.List[python_type]
+    lt = TypeEngine.to_literal_type(pt)
+
+    lv = TypeEngine.to_literal(ctx, python_val, pt, lt)
+    assert not lv.collection.is_materialized
+    expected = Literal(
+        collection=LiteralCollection(
+            literals=[TypeEngine.to_literal(ctx, x, python_type, lt.collection_type) for x in python_val]
+        )
+    )
+    assert lv == expected
+
+    assert TypeEngine.to_python_value(ctx, lv, pt) == python_val
+    assert not lv.collection.is_materialized
+    # The element-wise path gives the same result
+    assert TypeEngine.to_python_value(ctx, expected, pt) == python_val
+
+    lv = Literal.from_flyte_idl(lv.to_flyte_idl())
+    assert TypeEngine.to_python_value(ctx, lv, pt) == python_val
+
+
+def test_modify_literal_uris_of_lazy_collections():
+    ctx = FlyteContextManager.current_context()
+    ints = TypeEngine.to_literal(ctx, [1, 2], typing.List[int], TypeEngine.to_literal_type(typing.List[int]))
+    blob = Literal(
+        scalar=Scalar(
+            blob=Blob(
+                metadata=BlobMetadata(type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.SINGLE)),
+                uri="flyte://data/file.txt",
+            )
+        )
+    )
+    files = Literal.from_flyte_idl(Literal(collection=LiteralCollection(literals=[blob])).to_flyte_idl())
+    assert not files.collection.is_materialized
+
+    FlytePathResolver.add_mapping("flyte://data/file.txt", "s3://bucket/file.txt")
+    modify_literal_uris(ints)
+    modify_literal_uris(files)
+    # Lists of primitives are not walked, but the URIs of lazily built collections of files are still resolved.
+    assert not ints.collection.is_materialized
+    assert files.collection.literals[0].scalar.blob.uri == "s3://bucket/file.txt"
+
+
+def test_list_of_primitives_bulk_fallback():
+    ctx = FlyteContextManager.current_context()
+    lt = TypeEngine.to_literal_type(typing.List[int])
+
+    # bool is a subclass of int, but not accepted by the int transformer
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_literal(ctx, [1, True], typing.List[int], lt)
+
+    # Integers are accepted where floats are expected
+    lv = TypeEngine.to_literal(ctx, [1, 2], typing.List[int], lt)
+    lv = Literal.from_flyte_idl(lv.to_flyte_idl())
+    assert TypeEngine.to_python_value(ctx, lv, typing.List[float]) == [1.0, 2.0]
+
+    lv = Literal.from_flyte_idl(lv.to_flyte_idl())
+    with pytest.raises(TypeTransformerFailedError):
+        TypeEngine.to_python_value(ctx, lv, typing.List[str])
+
+
+def test_dict_transformer_resolves_sub_type_once():
+    ctx = FlyteContextManager.current_context()
+    pt = typing.Dict[str, int]
+    lt = TypeEngine.to_literal_type(pt)
+    d = {str(i): i for i in range(100)}
+    with mock.patch.object(TypeEngine, "get_transformer", wraps=TypeEngine.get_transformer) as get_transformer:
+        lv = TypeEngine.to_literal(ctx, d, pt, lt)
+        assert get_transformer.call_count == 2
+        get_transformer.reset_mock()
+        assert TypeEngine.to_python_value(ctx, lv, pt) == d
+        assert get_transformer.call_count == 2
+
+
 def test_file_formats_getting_literal_type():
     transformer = TypeEngine.get_transformer(FlyteFile)
 
@@ -822,6 +969,54 @@ def test_dataclass_int_preserving():
     assert ot == o
 
 
+def test_dataclass_value_fixer_plan():
+    @dataclass
+    class Strings(DataClassJsonMixin):
+        a: str
+        b: typing.List[typing.Dict[str, float]]
+
+    @dataclass
+    class Leaf(DataClassJsonMixin):
+        value: int
+        f: typing.Optional[FlyteFile] = None
+
+    @dataclass
+    class Node(DataClassJsonMixin):
+        name: str
+        leaves: typing.List[Leaf]
+        by_id: typing.Dict[int, Leaf]
+
+    ctx = FlyteContext.current_context()
+    tf = DataclassTransformer()
+
+    # Nothing to fix, the value is returned as is without walking it.
+    assert tf._get_value_fixer(Strings) is None
+    o = Strings(a="a", b=[{"x": 1.5}])
+    assert tf.to_python_value(ctx, tf.to_literal(ctx, o, Strings, tf.get_literal_type(Strings)), Strings) == o
+
+    o = Node(
+        name="n",
+        leaves=[Leaf(value=1, f=FlyteFile("s3://a/b.txt")), Leaf(value=2)],
+        by_id={3: Leaf(value=3)},
+    )
+    lv = tf.to_literal(ctx, o, Node, tf.get_literal_type(Node))
+    fixer = tf._get_value_fixer(Node)
+    assert tf._get_value_fixer(Node) is fixer
+    ot = tf.to_python_value(ctx, lv, Node)
+    assert type(ot.leaves[1].value) is int
+    assert list(ot.by_id.keys()) == [3]
+    assert type(ot.by_id[3].value) is int
+    assert isinstance(ot.leaves[0].f, FlyteFile)
+    assert ot.leaves[0].f.remote_source == "s3://a/b.txt"
+
+    # The plan gives the same result as the separate passes.
+    dc = Node.from_json(_json_format.MessageToJson(lv.scalar.generic))
+    expected = tf._fix_dataclass_int(Node, tf._deserialize_flyte_type(tf._fix_structured_dataset_type(Node, dc), Node))
+    assert ot.by_id == expected.by_id
+    assert [leaf.value for leaf in ot.leaves] == [leaf.value for leaf in expected.leaves]
+    assert ot.leaves[0].f.remote_source == expected.leaves[0].f.remote_source
+
+
 @mock.patch("flytekit.core.data_persistence.FileAccessProvider.put_data")
 def test_optional_flytefile_in_dataclass(mock_upload_dir):
     mock_upload_dir.return_value = True
@@ -2539,3 +2734,70 @@ def test_ListTransformer_get_sub_type():
 
 def test_ListTransformer_get_sub_type_as_none():
     assert ListTransformer.get_sub_type_or_none(type([])) is None
+
+
+def test_is_offloaded_type():
+    assert is_offloaded_type(TypeEngine.to_literal_type(FlyteFile))
+    assert is_offloaded_type(TypeEngine.to_literal_type(typing.List[FlyteDirectory]))
+    assert is_offloaded_type(TypeEngine.to_literal_type(typing.Dict[str, StructuredDataset]))
+    assert is_offloaded_type(TypeEngine.to_literal_type(typing.Optional[FlyteFile]))
+    assert not is_offloaded_type(TypeEngine.to_literal_type(typing.List[int]))
+    assert not is_offloaded_type(TypeEngine.to_literal_type(typing.Dict[str, str]))
+    assert not is_offloaded_type(None)
+
+
+@pytest.mark.parametrize("python_type", [typing.List[FlyteFile], typing.Dict[str, FlyteFile]])
+def test_files_uploaded_concurrently(tmp_path, python_type):
+    ctx = FlyteContextManager.current_context()
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"f{i}.txt"
+        p.write_text(str(i))
+        paths.append(str(p))
+    v = paths if python_type == typing.List[FlyteFile] else {str(i): p for i, p in enumerate(paths)}
+
+    # Every upload waits for the other two, so this only completes if all three run at the same time.
+    barrier = threading.Barrier(3, timeout=10)
+
+    def put_raw_data(path, *args, **kwargs):
+        barrier.wait()
+        return f"s3://bucket/{os.path.basename(path)}"
+
+    with mock.patch.object(ctx.file_access, "put_raw_data", side_effect=put_raw_data):
+        lv = TypeEngine.to_literal(ctx, v, python_type, TypeEngine.to_literal_type(python_type))
+
+    lits = lv.collection.literals if lv.collection else [lv.map.literals[str(i)] for i in range(3)]
+    assert [lit.scalar.blob.uri for lit in lits] == [f"s3://bucket/f{i}.txt" for i in range(3)]
+
+
+def test_map_concurrently_shares_one_limit():
+    ctx = FlyteContextManager.current_context()
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def transfer(i):
+        with lock:
+            running.append(i)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(i)
+        # Nested conversions run on the calling pool thread instead of waiting for the pool.
+        return map_concurrently(ctx, lambda x: x, [(i,), (i,)])[0]
+
+    def convert(offset):
+        return map_concurrently(ctx, transfer, [(offset + i,) for i in range(3)])
+
+    with mock.patch.object(type(ctx.file_access), "data_config") as data_config:
+        data_config.transfer_concurrency = 2
+        # Two conversions at the same time, as in the instances of a local map task, share the limit of 2.
+        results = []
+        threads = [threading.Thread(target=lambda o=o: results.append(convert(o))) for o in (0, 10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert sorted(results) == [[0, 1, 2], [10, 11, 12]]
+    assert max(max_running) == 2
@@ -533,6 +533,44 @@ def test_literal_collection(literal_value_pair):
     assert len(obj.literals) == 3
 
 
+def test_literal_collection_lazy():
+    lit = literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=1)))
+    idl = literals.LiteralCollection([lit, lit]).to_flyte_idl()
+
+    obj = literals.LiteralCollection.from_flyte_idl(idl)
+    assert not obj.is_materialized
+    assert obj.to_flyte_idl() == idl
+    assert obj == literals.LiteralCollection([lit, lit])
+    assert obj.get_primitive_values("integer") == [1, 1]
+    assert obj.get_primitive_values("float_value") is None
+
+    assert obj.literals == [lit, lit]
+    assert obj.is_materialized
+    obj.literals.append(lit)
+    assert len(obj.to_flyte_idl().literals) == 3
+
+
+def test_lazy_literals_do_not_share_messages():
+    lit = literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=1)))
+    other = literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=2))).to_flyte_idl()
+    collection_idl = literals.LiteralCollection([lit]).to_flyte_idl()
+    map_idl = literals.LiteralMap({"a": lit}).to_flyte_idl()
+
+    collection = literals.LiteralCollection.from_flyte_idl(collection_idl)
+    literal_map = literals.LiteralMap.from_flyte_idl(map_idl)
+    # Changing the original messages does not change the models
+    collection_idl.literals[0].CopyFrom(other)
+    map_idl.literals["a"].CopyFrom(other)
+    # Neither does changing the messages they serialize to
+    collection.to_flyte_idl().literals.add().CopyFrom(other)
+    literal_map.to_flyte_idl().literals["b"].CopyFrom(other)
+
+    assert not collection.is_materialized
+    assert not literal_map.is_materialized
+    assert collection.literals == [lit]
+    assert literal_map.literals == {"a": lit}
+
+
 def test_set_metadata():
     scalar = literals.Scalar(primitive=literals.Primitive(integer=100))
     obj = literals.Literal(scalar=scalar)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pathlib
 import shutil
@@ -6,7 +7,7 @@ import tempfile
 import typing
 import uuid
 from collections import OrderedDict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import mock
 import pytest
@@ -23,14 +24,23 @@ from flytekit.core.type_engine import TypeEngine
 from flytekit.exceptions import user as user_exceptions
 from flytekit.models import common as common_models
 from flytekit.models import security
-from flytekit.models.admin.workflow import Workflow, WorkflowClosure
+from flytekit.models.admin.workflow import Workflow, WorkflowClosure, WorkflowSpec
 from flytekit.models.core.compiler import CompiledWorkflowClosure
-from flytekit.models.core.identifier import Identifier, ResourceType, WorkflowExecutionIdentifier
+from flytekit.models.core.execution import NodeExecutionPhase, WorkflowExecutionPhase
+from flytekit.models.core.identifier import (
+    Identifier,
+    NodeExecutionIdentifier,
+    ResourceType,
+    WorkflowExecutionIdentifier,
+)
 from flytekit.models.execution import Execution
+from flytekit.models.node_execution import NodeExecution, NodeExecutionClosure, NodeExecutionMetaData
 from flytekit.models.task import Task
-from flytekit.remote import FlyteTask
+from flytekit.remote import FlyteTask, registration_index
+from flytekit.remote.executions import FlyteWorkflowExecution
 from flytekit.remote.lazy_entity import LazyEntity
-from flytekit.remote.remote import FlyteRemote, _get_git_repo_url
+from flytekit.remote.remote import FlyteRemote, _entity_name, _get_git_repo_url, _registration_waves
+from flytekit.remote.watcher import ExecutionWatcher
 from flytekit.tools.translator import Options, get_serializable, get_serializable_launch_plan
 from tests.flytekit.common.parameterizers import LIST_OF_TASK_CLOSURES
 
@@ -533,3 +543,231 @@ def test_get_git_report_url_unknown_url(tmp_path):
 
     returned_url = _get_git_repo_url(source_path)
     assert returned_url == ""
+
+
+@task
+def t_reg(a: int) -> int:
+    return a
+
+
+@workflow
+def inner_reg(a: int) -> int:
+    return t_reg(a=a)
+
+
+inner_lp = LaunchPlan.get_or_create(inner_reg, "inner_reg_lp")
+
+
+@workflow
+def outer_reg(a: int) -> int:
+    return inner_lp(a=a)
+
+
+def _registration_entities():
+    ss = SerializationSettings(image_config=ImageConfig.auto_default_image(), project="p", domain="d", version="v")
+    m = OrderedDict()
+    get_serializable(m, ss, outer_reg)
+    return ss, list(m.items())
+
+
+def test_registration_waves():
+    _, entities = _registration_entities()
+    waves = _registration_waves([cp_entity for _, cp_entity in entities])
+    # The nodes are not registered, they are in the first wave.
+    names = [[_entity_name(entities[i][1]).split(".")[-1] for i in wave] for wave in waves]
+    assert names[1:] == [["inner_reg"], ["inner_reg_lp"], ["outer_reg"]]
+    assert "t_reg" in names[0]
+
+
+def test_raw_register_all(remote):
+    ss, entities = _registration_entities()
+    registered = []
+    results = remote.raw_register_all(
+        entities,
+        ss,
+        "v",
+        create_default_launchplan=False,
+        max_concurrency=4,
+        on_registered=lambda cp_entity, ident, error: ident and registered.append(ident.name.split(".")[-1]),
+    )
+    assert registered == ["t_reg", "inner_reg", "inner_reg_lp", "outer_reg"]
+    assert [r.resource_type for r in results if r is not None] == [
+        ResourceType.TASK,
+        ResourceType.WORKFLOW,
+        ResourceType.LAUNCH_PLAN,
+        ResourceType.WORKFLOW,
+    ]
+
+
+def test_raw_register_all_errors(remote):
+    ss, entities = _registration_entities()
+    remote._client.create_task.side_effect = ValueError("failed")
+
+    with pytest.raises(ValueError):
+        remote.raw_register_all(entities, ss, "v", create_default_launchplan=False)
+    remote._client.create_workflow.assert_not_called()
+
+    results = remote.raw_register_all(entities, ss, "v", create_default_launchplan=False, skip_errors=True)
+    assert isinstance(results[0], ValueError)
+    assert remote._client.create_workflow.call_count == 2
+
+
+def test_raw_register_all_skip_unchanged(remote, tmp_path, monkeypatch):
+    monkeypatch.setattr(registration_index, "REGISTRATION_INDEX_DIR", str(tmp_path))
+    ss, entities = _registration_entities()
+    remote.raw_register_all(entities, ss, "v", create_default_launchplan=False, skip_unchanged=True)
+    assert remote._client.create_task.call_count == 1
+
+    # Nothing changed, nothing is sent again.
+    remote.raw_register_all(entities, ss, "v", create_default_launchplan=False, skip_unchanged=True)
+    assert remote._client.create_task.call_count == 1
+    assert remote._client.create_workflow.call_count == 2
+    assert remote._client.create_launch_plan.call_count == 1
+
+    # A new version is registered again.
+    results = remote.raw_register_all(entities, ss, "v2", create_default_launchplan=False, skip_unchanged=True)
+    assert remote._client.create_task.call_count == 2
+    lps = [r for r in results if r is not None and r.resource_type == ResourceType.LAUNCH_PLAN]
+
+    # Admin does not know about the tasks anymore.
+    remote._client.list_tasks_paginated.return_value = [], None
+    remote._client.list_workflows_paginated.return_value = (
+        [
+            MagicMock(id=Identifier(ResourceType.WORKFLOW, "p", "d", e.template.id.name, "v2"))
+            for _, e in entities
+            if isinstance(e, WorkflowSpec)
+        ],
+        None,
+    )
+    remote._client.list_launch_plans_paginated.return_value = [MagicMock(id=ident) for ident in lps], None
+    remote.raw_register_all(
+        entities, ss, "v2", create_default_launchplan=False, skip_unchanged=True, verify_unchanged=True
+    )
+    assert remote._client.create_task.call_count == 3
+    assert remote._client.create_workflow.call_count == 4
+
+
+def _watched_executions(remote, phases):
+    """Creates running executions, each of which reports the given sequence of phases when polled."""
+    polled = {name: iter(p) for name, p in phases.items()}
+
+    def get_execution(id):
+        return Execution(id=id, spec=MagicMock(), closure=MagicMock(phase=next(polled[id.name])))
+
+    remote._client.get_execution.side_effect = get_execution
+    remote.sync_execution = MagicMock(side_effect=lambda execution, **kwargs: execution)
+    return [
+        FlyteWorkflowExecution.promote_from_model(
+            Execution(
+                id=WorkflowExecutionIdentifier("p1", "d1", name),
+                spec=MagicMock(),
+                closure=MagicMock(phase=WorkflowExecutionPhase.RUNNING),
+            )
+        )
+        for name in phases
+    ]
+
+
+def test_watch(remote):
+    executions = _watched_executions(
+        remote,
+        {
+            "slow": [WorkflowExecutionPhase.RUNNING, WorkflowExecutionPhase.RUNNING, WorkflowExecutionPhase.SUCCEEDED],
+            "fast": [WorkflowExecutionPhase.SUCCEEDED],
+        },
+    )
+    watcher = remote.watch(executions, poll_interval=timedelta(milliseconds=1))
+    assert [e.id.name for e in watcher] == ["fast", "slow"]
+    assert remote._client.get_execution.call_count == 4
+    remote.sync_execution.assert_called_with(executions[0])
+
+
+def test_watch_syncs_nodes_incrementally(remote):
+    executions = _watched_executions(
+        remote,
+        {"wf": [WorkflowExecutionPhase.RUNNING, WorkflowExecutionPhase.RUNNING, WorkflowExecutionPhase.SUCCEEDED]},
+    )
+    remote.fetch_launch_plan = MagicMock()
+    remote.sync_node_execution = MagicMock(side_effect=lambda execution, node_mapping: execution)
+
+    def node_execution(node_id, phase, second):
+        return NodeExecution(
+            id=NodeExecutionIdentifier(node_id, executions[0].id),
+            input_uri="",
+            closure=NodeExecutionClosure(
+                phase=phase,
+                started_at=None,
+                duration=None,
+                updated_at=datetime(2024, 1, 1, 0, 0, second, tzinfo=timezone.utc),
+            ),
+            metadata=NodeExecutionMetaData(retry_group="", is_parent_node=False, spec_node_id=node_id),
+        )
+
+    polls = iter(
+        [
+            [node_execution("n0", NodeExecutionPhase.RUNNING, 1)],
+            [
+                node_execution("n0", NodeExecutionPhase.SUCCEEDED, 2),
+                node_execution("n1", NodeExecutionPhase.RUNNING, 2),
+            ],
+            [
+                node_execution("n0", NodeExecutionPhase.SUCCEEDED, 2),
+                node_execution("n1", NodeExecutionPhase.SUCCEEDED, 3),
+            ],
+        ]
+    )
+    seen = []
+
+    def list_node_executions(**kwargs):
+        seen.append({k: v.closure.phase for k, v in executions[0].node_executions.items()})
+        return next(polls), ""
+
+    remote._client.list_node_executions.side_effect = list_node_executions
+    done = list(remote.watch(executions, poll_interval=timedelta(milliseconds=1), sync_nodes=True))
+
+    # The node executions are visible while the workflow execution runs.
+    assert seen == [
+        {},
+        {"n0": NodeExecutionPhase.RUNNING},
+        {"n0": NodeExecutionPhase.SUCCEEDED, "n1": NodeExecutionPhase.RUNNING},
+    ]
+    filters = [c.kwargs["filters"] for c in remote._client.list_node_executions.call_args_list]
+    assert filters[0] == []
+    assert [f.to_flyte_idl() for (f,) in filters[1:]] == [
+        "gte(updated_at,2024-01-01T00:00:01.000000Z)",
+        "gte(updated_at,2024-01-01T00:00:02.000000Z)",
+    ]
+    assert {k: v.closure.phase for k, v in done[0].node_executions.items()} == {
+        "n0": NodeExecutionPhase.SUCCEEDED,
+        "n1": NodeExecutionPhase.SUCCEEDED,
+    }
+    # Each node execution is synced once, when it is done, and the launch plan is only fetched once.
+    assert [c.args[0].id.node_id for c in remote.sync_node_execution.call_args_list] == ["n0", "n1"]
+    remote.fetch_launch_plan.assert_called_once()
+
+
+def test_watch_async(remote):
+    executions = _watched_executions(
+        remote,
+        {"a": [WorkflowExecutionPhase.RUNNING, WorkflowExecutionPhase.FAILED], "b": [WorkflowExecutionPhase.SUCCEEDED]},
+    )
+
+    async def watch():
+        return [e.id.name async for e in remote.watch(executions, poll_interval=timedelta(milliseconds=1))]
+
+    assert asyncio.run(watch()) == ["b", "a"]
+
+
+def test_watch_backoff_and_timeout(remote):
+    executions = _watched_executions(remote, {"stuck": [WorkflowExecutionPhase.RUNNING] * 100})
+    watcher = ExecutionWatcher(
+        remote,
+        executions,
+        timeout=timedelta(milliseconds=200),
+        min_poll_interval=timedelta(milliseconds=10),
+        max_poll_interval=timedelta(milliseconds=40),
+    )
+    with pytest.raises(user_exceptions.FlyteTimeout, match="stuck"):
+        list(watcher)
+    # Polls back off from 10ms to 40ms while the phase does not change.
+    assert 3 <= remote._client.get_execution.call_count <= 8
@@ -1,12 +1,18 @@
+import gzip
+import io
 import os
 import subprocess
 import tarfile
+import time
 
+import mock
 import pytest
 
+from flytekit.tools import fast_registration
 from flytekit.tools.fast_registration import (
     FAST_FILEENDING,
     FAST_PREFIX,
+    _ParallelGzipWriter,
     compute_digest,
     fast_package,
     get_additional_distribution_loc,
@@ -15,6 +21,13 @@ from flytekit.tools.ignore import DockerIgnore, GitIgnore, IgnoreGroup, Standard
 from tests.flytekit.unit.tools.test_ignore import make_tree
 
 
+@pytest.fixture(autouse=True)
+def digest_cache_dir(tmp_path_factory, monkeypatch):
+    cache_dir = tmp_path_factory.mktemp("digest-cache")
+    monkeypatch.setattr(fast_registration, "DIGEST_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def flyte_project(tmp_path):
     tree = {
@@ -103,3 +116,38 @@ def test_digest_change(flyte_project):
 
 def test_get_additional_distribution_loc():
     assert get_additional_distribution_loc("s3://my-s3-bucket/dir", "123abc") == "s3://my-s3-bucket/dir/123abc.tar.gz"
+
+
+def test_digest_cache(flyte_project):
+    ignore = IgnoreGroup(flyte_project, [GitIgnore, DockerIgnore, StandardIgnore])
+    # Files modified in the last moments are not cached.
+    past = time.time() - 60
+    for root, _, files in os.walk(flyte_project):
+        for f in files:
+            os.utime(os.path.join(root, f), (past, past))
+
+    digest1 = compute_digest(flyte_project, ignore.is_ignored)
+    with mock.patch.object(fast_registration, "_filehash", side_effect=AssertionError("file read")):
+        assert compute_digest(flyte_project, ignore.is_ignored) == digest1
+
+    change_file = flyte_project / "src" / "workflows" / "hello_world.py"
+    change_file.write_text("print('I do matter!')")
+    with mock.patch.object(fast_registration, "_filehash", wraps=fast_registration._filehash) as filehash:
+        assert compute_digest(flyte_project, ignore.is_ignored) != digest1
+        filehash.assert_called_once_with(str(change_file))
+
+
+def test_parallel_gzip_writer():
+    data = os.urandom(1000) * 500
+
+    def compress():
+        out = io.BytesIO()
+        writer = _ParallelGzipWriter(out, block_size=4096)
+        for i in range(0, len(data), 3000):
+            writer.write(data[i : i + 3000])
+        writer.close()
+        return out.getvalue()
+
+    compressed = compress()
+    assert gzip.decompress(compressed) == data
+    assert compress() == compressed
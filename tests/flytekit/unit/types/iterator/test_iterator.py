@@ -1,6 +1,12 @@
+import threading
 import typing
 
+import mock
+
 from flytekit import task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine
+from flytekit.types.iterator.iterator import FlyteIterator
 
 
 @task
@@ -21,3 +27,27 @@ def wf(a: int) -> typing.List[int]:
 
 def test_iterator():
     assert wf(a=4) == [0, 1, 2, 3]
+
+
+def test_iterator_prefetch():
+    ctx = FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(ctx, list(range(10)), typing.List[int], TypeEngine.to_literal_type(typing.List[int]))
+    # The first two elements wait for each other, so they are only returned if they are converted concurrently.
+    barrier = threading.Barrier(2, timeout=10)
+    converted = []
+    to_python_value = TypeEngine.to_python_value
+
+    def convert(ctx, lit, t):
+        v = to_python_value(ctx, lit, t)
+        if v < 2:
+            barrier.wait()
+        converted.append(v)
+        return v
+
+    it = FlyteIterator(ctx, lv, typing.Iterator[int], 10, prefetch=2)
+    with mock.patch.object(TypeEngine, "to_python_value", side_effect=convert):
+        assert next(it) == 0
+        # Never more than the current element and the two after it.
+        assert len(converted) <= 3
+        assert list(it) == list(range(10))
+        assert list(it) == list(range(10))
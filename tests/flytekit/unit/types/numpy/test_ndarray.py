@@ -1,7 +1,14 @@
+import os
+
+import mock
 import numpy as np
 from typing_extensions import Annotated
 
 from flytekit import kwtypes, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine
+from flytekit.models.core.types import BlobType
+from flytekit.types.numpy.ndarray import NumpyArrayTransformer
 
 
 @task
@@ -81,3 +88,40 @@ def wf():
 @workflow
 def test_wf():
     wf()
+
+
+def test_sharded_array():
+    ctx = FlyteContextManager.current_context()
+    arr = np.arange(30, dtype=np.float64).reshape(10, 3)
+    pt = Annotated[np.ndarray, kwtypes(shard_rows=4)]
+    lt = TypeEngine.to_literal_type(pt)
+    lv = TypeEngine.to_literal(ctx, arr, pt, lt)
+    assert lv.scalar.blob.metadata.type.dimensionality == BlobType.BlobDimensionality.MULTIPART
+    assert sorted(os.listdir(lv.scalar.blob.uri)) == ["00000.npy", "00001.npy", "00002.npy"]
+
+    out = TypeEngine.to_python_value(ctx, lv, np.ndarray)
+    assert not isinstance(out, np.memmap)
+    np.testing.assert_array_equal(out, arr)
+
+    out = TypeEngine.to_python_value(ctx, lv, Annotated[np.ndarray, kwtypes(mmap_mode="r")])
+    assert isinstance(out, np.memmap)
+    np.testing.assert_array_equal(out, arr)
+
+
+def test_large_array_memory_mapped():
+    ctx = FlyteContextManager.current_context()
+    arr = np.arange(1000, dtype=np.int64)
+    lv = TypeEngine.to_literal(ctx, arr, np.ndarray, TypeEngine.to_literal_type(np.ndarray))
+    assert lv.scalar.blob.metadata.type.dimensionality == BlobType.BlobDimensionality.SINGLE
+
+    assert not isinstance(TypeEngine.to_python_value(ctx, lv, np.ndarray), np.memmap)
+    with mock.patch.object(NumpyArrayTransformer, "MMAP_THRESHOLD_BYTES", arr.nbytes):
+        out = TypeEngine.to_python_value(ctx, lv, np.ndarray)
+        assert isinstance(out, np.memmap)
+        np.testing.assert_array_equal(out, arr)
+        # Copy-on-write, changes are not written back to the file.
+        out[0] = 42
+        np.testing.assert_array_equal(TypeEngine.to_python_value(ctx, lv, np.ndarray), arr)
+
+        out = TypeEngine.to_python_value(ctx, lv, Annotated[np.ndarray, kwtypes(mmap_mode=None)])
+        assert not isinstance(out, np.memmap)
@@ -1,15 +1,18 @@
+import os
 import sys
 from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Dict, List, Union
 
+import mock
 import numpy as np
 import pytest
 from typing_extensions import Annotated
 
 import flytekit.configuration
-from flytekit.configuration import Image, ImageConfig
+from flytekit.configuration import DataConfig, Image, ImageConfig
 from flytekit.core import context_manager
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.task import task
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import BlobMetadata
@@ -108,3 +111,37 @@ def test_union():
     assert variants[0].blob.format == "NumpyArray"
     assert variants[1].structured_dataset_type.format == ""
     assert variants[2].blob.format == FlytePickleTransformer.PYTHON_PICKLE_FORMAT
+
+
+@pytest.mark.parametrize(
+    "data_config",
+    [
+        DataConfig(pickle_compression="gzip"),
+        DataConfig(pickle_out_of_band_buffers=True),
+        DataConfig(pickle_compression="gzip", pickle_out_of_band_buffers=True),
+    ],
+)
+def test_pickle_container(data_config):
+    value = {"array": np.arange(100_000, dtype=np.int64), "name": "x" * 1000}
+    with mock.patch.object(FileAccessProvider, "data_config", data_config):
+        uri = FlytePickle.to_pickle(value)
+    with open(uri, "rb") as f:
+        assert f.read(8) == b"FLYTEPKL"
+    if data_config.pickle_compression:
+        assert os.path.getsize(uri) < value["array"].nbytes / 2
+
+    output = FlytePickle.from_pickle(uri)
+    assert output["name"] == value["name"]
+    np.testing.assert_array_equal(output["array"], value["array"])
+    # Arrays rebuilt from out-of-band buffers are still writable.
+    output["array"][0] = 1
+
+    # Plain pickles are still read.
+    plain = FlytePickle.to_pickle(value)
+    np.testing.assert_array_equal(FlytePickle.from_pickle(plain)["array"], value["array"])
+
+
+def test_pickle_unsupported_compression():
+    with mock.patch.object(FileAccessProvider, "data_config", DataConfig(pickle_compression="snappy")):
+        with pytest.raises(ValueError, match="Unsupported pickle compression"):
+            FlytePickle.to_pickle("a")
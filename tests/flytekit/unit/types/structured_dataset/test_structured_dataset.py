@@ -2,6 +2,7 @@ import os
 import tempfile
 import typing
 
+import mock
 import pyarrow as pa
 import pytest
 from fsspec.utils import get_protocol
@@ -290,6 +291,38 @@ def test_slash_register():
     assert res is not None
 
 
+def test_handler_lookup_cache():
+    class CachedDF:
+        ...
+
+    class TempEncoder(StructuredDatasetEncoder):
+        def __init__(self, fmt: str):
+            super().__init__(CachedDF, "tmpfs", supported_format=fmt)
+
+        def encode(
+            self,
+            ctx: FlyteContext,
+            structured_dataset: StructuredDataset,
+            structured_dataset_type: StructuredDatasetType,
+        ) -> literals.StructuredDataset:
+            return literals.StructuredDataset(uri="")
+
+    avro_encoder = TempEncoder("avro")
+    StructuredDatasetTransformerEngine.register(avro_encoder)
+    # With a single handler for the protocol, any format falls back to it.
+    assert StructuredDatasetTransformerEngine.get_encoder(CachedDF, "tmpfs", "rando") is avro_encoder
+    with mock.patch.object(
+        StructuredDatasetTransformerEngine, "_find_handler", side_effect=AssertionError("not memoized")
+    ):
+        assert StructuredDatasetTransformerEngine.get_encoder(CachedDF, "tmpfs", "rando") is avro_encoder
+
+    # Registering a generic handler changes how the same lookup resolves.
+    generic_encoder = TempEncoder("")
+    StructuredDatasetTransformerEngine.register(generic_encoder)
+    assert StructuredDatasetTransformerEngine.get_encoder(CachedDF, "tmpfs", "rando") is generic_encoder
+    assert StructuredDatasetTransformerEngine.get_encoder(CachedDF, "tmpfs", "avro") is avro_encoder
+
+
 def test_sd():
     sd = StructuredDataset(dataframe="hi")
     sd.uri = "my uri"
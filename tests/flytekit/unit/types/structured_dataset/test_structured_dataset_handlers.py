@@ -1,11 +1,15 @@
+import os
 import typing
 
 import mock
 import pyarrow as pa
 import pytest
 
+from flytekit.configuration import DataConfig
 from flytekit.core import context_manager
 from flytekit.core.base_task import kwtypes
+from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.core.type_engine import TypeEngine
 from flytekit.models.literals import StructuredDatasetMetadata
 from flytekit.models.types import StructuredDatasetType
 from flytekit.types.structured import basic_dfs
@@ -36,6 +40,122 @@ def test_pandas():
     assert df.equals(df2)
 
 
+@pytest.mark.parametrize(
+    "data_config, files",
+    [
+        (DataConfig(), 1),
+        (DataConfig(parquet_rows_per_file=4), 3),
+        (DataConfig(parquet_rows_per_file=100), 1),
+        (DataConfig(parquet_bytes_per_file=1), 10),
+    ],
+)
+def test_partitioned_parquet(data_config, files):
+    df = pd.DataFrame({"Name": [f"name-{i}" for i in range(10)], "Age": range(10)})
+    table = pa.Table.from_pandas(df)
+    ctx = context_manager.FlyteContextManager.current_context()
+    sd_type = StructuredDatasetType(format="parquet")
+
+    with mock.patch.object(FileAccessProvider, "data_config", data_config):
+        sd_lit = basic_dfs.PandasToParquetEncodingHandler().encode(ctx, StructuredDataset(dataframe=df), sd_type)
+        assert sorted(os.listdir(sd_lit.uri)) == [f"{i:05}" for i in range(files)]
+        df2 = basic_dfs.ParquetToPandasDecodingHandler().decode(ctx, sd_lit, StructuredDatasetMetadata(sd_type))
+        assert df.equals(df2)
+
+        sd_lit = basic_dfs.ArrowToParquetEncodingHandler().encode(ctx, StructuredDataset(dataframe=table), sd_type)
+        assert sorted(os.listdir(sd_lit.uri)) == [f"{i:05}" for i in range(files)]
+        table2 = basic_dfs.ParquetToArrowDecodingHandler().decode(ctx, sd_lit, StructuredDatasetMetadata(sd_type))
+        assert table.equals(table2)
+
+
+def test_parquet_filters_and_limit():
+    import pyarrow.compute as pc
+
+    df = pd.DataFrame({"Name": [f"name-{i}" for i in range(10)], "Age": range(10)})
+    ctx = context_manager.FlyteContextManager.current_context()
+    with mock.patch.object(FileAccessProvider, "data_config", DataConfig(parquet_rows_per_file=4)):
+        lv = TypeEngine.to_literal(ctx, df, pd.DataFrame, TypeEngine.to_literal_type(pd.DataFrame))
+    sd = TypeEngine.to_python_value(ctx, lv, StructuredDataset)
+
+    assert sd.open(pd.DataFrame, filters=pc.field("Age") >= 7).all()["Age"].tolist() == [7, 8, 9]
+    assert sd.open(pd.DataFrame, filters=[("Name", "=", "name-2")]).all()["Age"].tolist() == [2]
+    assert sd.open(pd.DataFrame, limit=5).all()["Age"].tolist() == [0, 1, 2, 3, 4]
+    table = sd.open(pa.Table, filters=[("Age", ">", 2)], limit=2).all()
+    assert table.column("Age").to_pylist() == [3, 4]
+
+
+def test_iter_parquet():
+    df = pd.DataFrame({"Name": [f"name-{i}" for i in range(10)], "Age": range(10)})
+    ctx = context_manager.FlyteContextManager.current_context()
+    with mock.patch.object(FileAccessProvider, "data_config", DataConfig(parquet_rows_per_file=4)):
+        lv = TypeEngine.to_literal(ctx, df, pd.DataFrame, TypeEngine.to_literal_type(pd.DataFrame))
+    sd = TypeEngine.to_python_value(ctx, lv, StructuredDataset)
+
+    chunks = list(sd.open(pd.DataFrame).iter())
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert pd.concat(chunks)["Age"].tolist() == list(range(10))
+    chunks = list(sd.open(pa.Table).iter())
+    assert all(isinstance(c, pa.Table) for c in chunks)
+    assert [c.num_rows for c in chunks] == [4, 4, 2]
+
+    chunks = list(sd.open(pd.DataFrame, filters=[("Age", ">=", 3)], limit=4).iter())
+    assert [c["Age"].tolist() for c in chunks] == [[3], [4, 5, 6]]
+
+
+def test_generator_to_parquet():
+    def frames():
+        yield pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [20, 22]})
+        yield pa.table({"Name": ["Ann"], "Age": [30]})
+        yield pa.RecordBatch.from_pydict({"Name": ["Bob"], "Age": [40]})
+
+    ctx = context_manager.FlyteContextManager.current_context()
+    lv = TypeEngine.to_literal(
+        ctx, StructuredDataset(dataframe=frames()), StructuredDataset, TypeEngine.to_literal_type(StructuredDataset)
+    )
+    assert lv.scalar.structured_dataset.metadata.structured_dataset_type.format == "parquet"
+    assert len(os.listdir(lv.scalar.structured_dataset.uri)) == 3
+
+    sd = TypeEngine.to_python_value(ctx, lv, StructuredDataset)
+    df = sd.open(pd.DataFrame).all()
+    assert df["Name"].tolist() == ["Tom", "Joseph", "Ann", "Bob"]
+    assert [len(c) for c in sd.open(pd.DataFrame).iter()] == [2, 1, 1]
+
+
+def test_empty_generator_to_parquet():
+    def frames():
+        yield from []
+
+    ctx = context_manager.FlyteContextManager.current_context()
+    python_type = typing.Annotated[StructuredDataset, kwtypes(Name=str, Age=int)]
+    lv = TypeEngine.to_literal(
+        ctx, StructuredDataset(dataframe=frames()), python_type, TypeEngine.to_literal_type(python_type)
+    )
+    df = TypeEngine.to_python_value(ctx, lv, StructuredDataset).open(pd.DataFrame).all()
+    assert df.empty
+    assert list(df.columns) == ["Name", "Age"]
+    assert str(df["Age"].dtype) == "int64"
+
+    with pytest.raises(ValueError, match="without the types of its columns"):
+        TypeEngine.to_literal(
+            ctx, StructuredDataset(dataframe=frames()), StructuredDataset, TypeEngine.to_literal_type(StructuredDataset)
+        )
+
+
+def test_filters_unsupported_by_decoder():
+    df = pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [20, 22]})
+    ctx = context_manager.FlyteContextManager.current_context()
+    sd_type = StructuredDatasetType(format="csv")
+    sd_lit = basic_dfs.PandasToCSVEncodingHandler().encode(ctx, StructuredDataset(dataframe=df), sd_type)
+
+    # The csv handlers are not registered by default, so the decoder is used directly.
+    with mock.patch.object(
+        StructuredDatasetTransformerEngine, "get_decoder", return_value=basic_dfs.CSVToPandasDecodingHandler()
+    ):
+        with pytest.raises(ValueError, match="does not support filtering rows"):
+            StructuredDatasetTransformerEngine().open_as(
+                ctx, sd_lit, pd.DataFrame, StructuredDatasetMetadata(sd_type), limit=1
+            )
+
+
 def test_csv():
     df = pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [20, 22]})
     encoder = basic_dfs.PandasToCSVEncodingHandler()